@@ -0,0 +1,4 @@
+"""
+Benchmarks for TypeRighter's hot paths. Run each module from the project root,
+eg. `python -m benchmarks.bench_plans`.
+"""
@@ -0,0 +1,58 @@
+"""
+Validates and converts a column of 1M sensor readings with a `min` and
+`max`. The baseline calls `validate` on every reading, which the vectorized
+`validate_array` replaces. Needs NumPy.
+"""
+
+from typerighter import arrays
+from typerighter import types
+
+from .timing import bench, speedup
+
+
+SIZE = 1000000
+
+
+def per_item(number_type, values):
+    for v in values:
+        number_type.validate(v)
+
+
+def run(label, number_type, readings):
+    print(label)
+    baseline = bench(
+        'Type.validate per item',
+        lambda: per_item(number_type, readings.tolist()), 1, 3
+    )
+    vectorized = bench(
+        'Type.validate_array',
+        lambda: number_type.validate_array(readings), 1, 3
+    )
+    speedup(baseline, vectorized)
+    bench(
+        'Type.to_native_array',
+        lambda: number_type.to_native_array(readings), 1, 3
+    )
+
+
+def main():
+    numpy = arrays.numpy
+    if numpy is None:
+        print('NumPy is not installed, skipping array benchmarks')
+        return
+
+    ints = numpy.arange(SIZE) % 1000
+    floats = ints / 10.0
+
+    run(
+        '%d int readings with min and max' % SIZE,
+        types.IntegerType(min=0, max=999), ints
+    )
+    run(
+        '%d float readings with min and max' % SIZE,
+        types.FloatType(min=0.0, max=99.9), floats
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""
+Compares looping over `Record.validate` and `Record.to_native` with the batch
+APIs, on a flat record with a mix of valid and invalid rows. The worker timings
+depend on the number of cores available.
+"""
+
+import os
+
+from typerighter import exceptions
+from typerighter import types
+
+from .timing import bench, speedup
+
+
+class Reading(types.Record):
+    sensor = types.StringType(required=True, max_length=32)
+    value = types.FloatType(min=-50, max=150)
+    count = types.IntegerType()
+    taken_at = types.DateTimeType()
+
+
+def make_rows(size):
+    rows = []
+    for i in range(size):
+        row = {
+            'sensor': 'sensor-%d' % (i % 50),
+            'value': str(i % 200 - 40),
+            'count': i,
+            'taken_at': '2021-05-29T00:00:%02d.001337' % (i % 60),
+        }
+        if i % 10 == 0:
+            del row['sensor']
+        rows.append(row)
+    return rows
+
+
+def validate_loop(record, rows):
+    for row in rows:
+        try:
+            record.validate(row)
+        except exceptions.ValidationException:
+            pass
+
+
+def to_native_loop(record, rows):
+    for row in rows:
+        record.to_native(row)
+
+
+if __name__ == '__main__':
+    record = Reading()
+    rows = make_rows(10000)
+
+    print('validate 10k rows')
+    baseline = bench(
+        'loop over validate', lambda: validate_loop(record, rows), 1, 3
+    )
+    batched = bench(
+        'validate_many', lambda: record.validate_many(rows), 1, 3
+    )
+    speedup(baseline, batched)
+
+    print('convert 10k rows')
+    baseline = bench(
+        'loop over to_native', lambda: to_native_loop(record, rows), 1, 3
+    )
+    batched = bench(
+        'to_native_many', lambda: record.to_native_many(rows), 1, 3
+    )
+    speedup(baseline, batched)
+
+    print('validate 100k rows with workers (%d cores)' % os.cpu_count())
+    rows = make_rows(100000)
+    baseline = bench(
+        'validate_many', lambda: record.validate_many(rows), 1, 1
+    )
+    for workers in (2, 4):
+        parallel = bench(
+            'validate_many, %d workers' % workers,
+            lambda: record.validate_many(rows, workers=workers), 1, 1
+        )
+        speedup(baseline, parallel)
@@ -0,0 +1,71 @@
+"""
+Compares the generated conversion functions for records against walking the
+record's fields with `Record._convert`, for flat and nested records. Only the
+top level record takes the regular path in the baseline, so nested records
+show less of a difference than they would otherwise.
+"""
+
+from typerighter import types
+from typerighter.types import records
+
+from .bench_plans import Artist, ARTIST_DATA
+from .timing import bench, speedup
+
+
+class Flat(types.Record):
+    name = types.StringType(required=True)
+    email = types.StringType()
+    age = types.IntegerType(min=0)
+    score = types.FloatType()
+    active = types.BooleanType(default=True)
+    bio = types.StringType(max_length=255)
+
+
+FLAT_DATA = {
+    'name': 'Stevie',
+    'email': 'stevie@example.com',
+    'age': '36',
+    'score': '9.5',
+    'bio': 'Texas blues',
+}
+
+ARTIST_FIELDS = ['name', 'albums.name', 'albums.songs.name']
+
+
+def regular(record, method, value, **convert_args):
+    def converter(value, ti, **kw):
+        return getattr(ti, method)(value, **kw)
+    return {k: v for k, v in record._convert(value, converter, **convert_args)}
+
+
+def run(label, record, method, data, number, **convert_args):
+    print(label)
+    baseline = bench(
+        'Record._convert',
+        lambda: regular(record, method, data, **convert_args), number
+    )
+    convert = getattr(record, method)
+    generated = bench(
+        'generated', lambda: convert(data, **convert_args), number
+    )
+    speedup(baseline, generated)
+
+
+if __name__ == '__main__':
+    run('flat to_native', Flat(), 'to_native', FLAT_DATA, 20000)
+    run('flat to_primitive', Flat(), 'to_primitive', FLAT_DATA, 20000)
+    run('flat to_native, filtered', Flat(), 'to_native', FLAT_DATA, 20000,
+        fields=['name', 'age'])
+    run('nested to_native', Artist(), 'to_native', ARTIST_DATA, 5000)
+    run('nested to_primitive', Artist(), 'to_primitive', ARTIST_DATA, 5000)
+    run('nested to_primitive, filtered', Artist(), 'to_primitive',
+        ARTIST_DATA, 5000, fields=ARTIST_FIELDS)
+
+    print('parsing field filters')
+    fields = tuple(ARTIST_FIELDS)
+    baseline = bench(
+        'uncached', lambda: records.parse_field_list.__wrapped__(fields),
+        20000
+    )
+    cached = bench('cached', lambda: records.parse_field_list(fields), 20000)
+    speedup(baseline, cached)
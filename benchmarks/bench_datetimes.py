@@ -0,0 +1,34 @@
+"""
+Compares parsing ISO 8601 strings by slicing against matching them with
+`REGEX_FROM_ISO8601`, for the shapes timestamps usually take.
+"""
+
+from typerighter import types
+
+from .timing import bench, speedup
+
+
+VALUES = [
+    '2021-05-29T00:00:01',
+    '2021-05-29T00:00:01.001337',
+    '2021-05-29T00:00:01Z',
+    '2021-05-29T00:00:01.001337Z',
+    '2012-07-24T23:14:29-07:00',
+    '2012-07-24T23:14:29.5+05:30',
+]
+
+
+def run(label, value, number):
+    print(label)
+    fast = types.DateTimeType()
+    slow = types.DateTimeType()
+    slow._parse_fast = False
+
+    baseline = bench('regex', lambda: slow.to_native(value), number)
+    sliced = bench('slicing', lambda: fast.to_native(value), number)
+    speedup(baseline, sliced)
+
+
+if __name__ == '__main__':
+    for value in VALUES:
+        run(value, value, 50000)
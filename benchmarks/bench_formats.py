@@ -0,0 +1,82 @@
+"""
+Compares the hand written parsers for network addresses and UUIDs against the
+regexes they replaced, on a mix of valid and invalid inputs, and on strings
+built to make the regexes backtrack.
+"""
+
+import re
+import uuid
+
+from typerighter import types
+from typerighter.types import ids
+from typerighter.types import net
+
+from .timing import bench, speedup
+
+
+IPV4_VALUES = [
+    '192.168.1.1', '10.0.0.255', '8.8.8.8', '256.1.1.1', '1.2.3', 'weeeee',
+]
+
+IPV6_VALUES = [
+    'FE80:CD00:0000:0CDE:1257:0000:211E:729C', '::1', 'fe80::1',
+    '::ffff:192.168.1.1', '1::2::3', '1:2:3:4:5:6:7:8:9', 'weeeee',
+]
+
+MAC_VALUES = [
+    '00:25:96:FF:FE:12', '00-25-96-ff-fe-12', '0025.96FF.FE12',
+    '00:25:96:FF:FE', 'weeeee',
+]
+
+UUID_VALUES = [uuid.uuid4().hex, uuid.uuid4().hex, str(uuid.uuid4()), 'x']
+
+ADVERSARIAL_VALUES = ['1:' * 40 + 'x', 'a' * 4 + ':' * 30 + '.' * 30]
+
+
+def check_all(check, values):
+    def run():
+        for value in values:
+            check(value)
+    return run
+
+
+def validate_all(type_instance, values):
+    def run():
+        for value in values:
+            try:
+                type_instance.validate(value)
+            except Exception:
+                pass
+    return run
+
+
+def run(label, type_class, regex, parser, values, number):
+    print(label)
+    compiled = re.compile(regex, re.I + re.X)
+    baseline = bench('regex match', check_all(compiled.match, values), number)
+    parsed = bench('parser', check_all(parser, values), number)
+    speedup(baseline, parsed)
+
+    baseline = bench(
+        'validate with regex',
+        validate_all(type_class(regex=regex), values), number
+    )
+    parsed = bench(
+        'validate with parser', validate_all(type_class(), values), number
+    )
+    speedup(baseline, parsed)
+
+
+if __name__ == '__main__':
+    run('ipv4', types.IPv4Type, net.REGEX_IPV4, net.is_ipv4,
+        IPV4_VALUES, 10000)
+    run('ipv6', types.IPv6Type, net.REGEX_IPV6, net.is_ipv6,
+        IPV6_VALUES, 5000)
+    run('ip address', types.IPAddressType, net.REGEX_IP, net.is_ip,
+        IPV4_VALUES + IPV6_VALUES, 5000)
+    run('mac address', types.MACAddressType, net.REGEX_MAC, net.is_mac,
+        MAC_VALUES, 10000)
+    run('uuid', types.UUIDType, ids.REGEX_UUID4, ids.is_uuid,
+        UUID_VALUES, 10000)
+    run('adversarial ipv6', types.IPv6Type, net.REGEX_IPV6, net.is_ipv6,
+        ADVERSARIAL_VALUES, 1000)
@@ -0,0 +1,77 @@
+"""
+Measures how many type and record instances can be created per second, as
+happens when schemas are built per request or per tenant. The dynamic case
+defines a new record class from a configuration and creates an instance of
+it, while the others create instances of classes defined once.
+"""
+
+from typerighter import types
+
+from .timing import bench
+
+
+TENANT_CONFIG = {
+    'name': {'max_length': 40, 'required': True},
+    'email': {},
+    'age': {'min': 0, 'max': 150},
+    'score': {},
+    'active': {'default': True},
+    'website': {},
+    'created_at': {},
+    'tags': {},
+}
+
+
+def tenant_fields(config):
+    return {
+        'name': types.StringType(**config['name']),
+        'email': types.EmailType(**config['email']),
+        'age': types.IntegerType(**config['age']),
+        'score': types.FloatType(**config['score']),
+        'active': types.BooleanType(**config['active']),
+        'website': types.URLType(**config['website']),
+        'created_at': types.DateTimeType(**config['created_at']),
+        'tags': types.ListType(types.StringType(), **config['tags']),
+    }
+
+
+class Customer(types.Record):
+    name = types.StringType(max_length=40, required=True)
+    email = types.EmailType()
+    age = types.IntegerType(min=0, max=150)
+    score = types.FloatType()
+    active = types.BooleanType(default=True)
+    website = types.URLType()
+    created_at = types.DateTimeType()
+    tags = types.ListType(types.StringType())
+
+
+def tenant_record():
+    record_class = types.RecordMeta(
+        'TenantCustomer', (types.Record,), tenant_fields(TENANT_CONFIG)
+    )
+    return record_class()
+
+
+def per_second(label, func, number):
+    best = bench(label, func, number)
+    print('  %-44s %10.0f /s' % ('', 1 / best))
+
+
+def main():
+    print('Instantiation')
+    per_second('StringType(max_length=40)', lambda: types.StringType(
+        max_length=40
+    ), 20000)
+    per_second('IntegerType(min=0, max=150)', lambda: types.IntegerType(
+        min=0, max=150
+    ), 20000)
+    per_second('Record instance', Customer, 20000)
+    per_second('Record fields from config', lambda: tenant_fields(
+        TENANT_CONFIG
+    ), 2000)
+    per_second('Record class and instance from config', tenant_record, 1000)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+"""
+Validates and converts lists of 100k items. The baseline validates every
+item with its type's `validate`, which is what checking every item costs
+without the bulk path. Unconstrained integers and strings take the bulk
+path, while constrained integers are checked one item at a time with their
+compiled plan.
+"""
+
+from typerighter import types
+
+from .timing import bench, speedup
+
+
+SIZE = 100000
+
+
+def per_item(item_type, value):
+    for v in value:
+        item_type.validate(v)
+
+
+def run(label, list_type, value):
+    print(label)
+    baseline = bench(
+        'Type.validate per item',
+        lambda: per_item(list_type.type, value), 1, 3
+    )
+    validated = bench(
+        'ListType.validate', lambda: list_type.validate(value), 1, 3
+    )
+    speedup(baseline, validated)
+    bench('ListType.load', lambda: list_type.load(value), 1, 3)
+    bench('ListType.to_native', lambda: list_type.to_native(value), 1, 3)
+
+
+def main():
+    ints = list(range(SIZE))
+    strings = ['item %d' % i for i in range(SIZE)]
+
+    run(
+        '%d unconstrained ints' % SIZE,
+        types.ListType(types.IntegerType()), ints
+    )
+    run(
+        '%d unconstrained strings' % SIZE,
+        types.ListType(types.StringType()), strings
+    )
+    run(
+        '%d ints with min and max' % SIZE,
+        types.ListType(types.IntegerType(min=0, max=SIZE)), ints
+    )
+
+
+if __name__ == '__main__':
+    main()
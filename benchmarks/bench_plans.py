@@ -0,0 +1,79 @@
+"""
+Compares `Record.validate` against compiled plans, using the record shapes
+from the test suite.
+"""
+
+from typerighter import types
+
+from .timing import bench, speedup
+
+
+class TestRecord(types.Record):
+    s1 = types.StringType(required=True)
+    s2 = types.StringType()
+
+
+class ParentRecord(types.Record):
+    tr = TestRecord()
+
+
+class GrandparentRecord(types.Record):
+    pr = ParentRecord()
+
+
+class GreatGrandparentRecord(types.Record):
+    gr = GrandparentRecord()
+
+
+class Song(types.Record):
+    name = types.StringType(required=True)
+    created_at = types.DateTimeType()
+    lyrics = types.StringType(max_length=255)
+
+
+class Album(types.Record):
+    name = types.StringType(required=True)
+    created_at = types.DateTimeType()
+    songs = types.ListType(Song())
+
+
+class Artist(types.Record):
+    name = types.StringType(required=True)
+    created_at = types.DateTimeType()
+    website = types.URLType()
+    albums = types.ListType(Album())
+
+
+NESTED_DATA = {'gr': {'pr': {'tr': {'s1': 'some string', 's2': 'another'}}}}
+
+ARTIST_DATA = {
+    'name': 'American Food',
+    'created_at': '2021-05-29T00:00:01.001337',
+    'website': 'https://soundcloud.com/americanfood',
+    'albums': [{
+        'name': 'Internet On The TV',
+        'created_at': '2021-05-29T00:00:01.001337',
+        'songs': [{
+            'name': 'Cane Spiders (mispoke)',
+            'created_at': '2021-05-29T00:00:00.001337',
+            'lyrics': 'Oh my gawd! It\'s that red dot! Gonna catch that...'
+        }, {
+            'name': 'My Take On Take On Me',
+            'created_at': '2021-05-30T00:00:00.001337',
+            'lyrics': 'I know. I know. I talk in numbers...'
+        }]
+    }]
+}
+
+
+def run(label, record, data, number):
+    print(label)
+    plan = record.compile()
+    baseline = bench('Record.validate', lambda: record.validate(data), number)
+    compiled = bench('Plan.validate', lambda: plan.validate(data), number)
+    speedup(baseline, compiled)
+
+
+if __name__ == '__main__':
+    run('nested records', GreatGrandparentRecord(), NESTED_DATA, 20000)
+    run('artist with albums', Artist(), ARTIST_DATA, 2000)
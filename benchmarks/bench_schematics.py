@@ -0,0 +1,59 @@
+"""
+Times the parts of defining and creating types that schematics take part in:
+defining type and record classes, creating instances, and reading an
+instance's schematic. Schematics read argspecs the first time they're
+needed and instances only keep the keyword arguments they were given, so
+the first two should carry little of the cost of the third.
+"""
+
+from typerighter import types
+
+from .timing import bench
+
+
+class Song(types.Record):
+    name = types.StringType(required=True)
+    track = types.IntegerType(default=1)
+    lyrics = types.StringType(max_length=255)
+
+
+def define_type():
+    class Shout(types.StringType):
+        def __init__(self, volume=11, **kw):
+            super().__init__(**kw)
+            self.volume = volume
+    return Shout
+
+
+def define_record():
+    class Album(types.Record):
+        name = types.StringType(required=True)
+        year = types.IntegerType(min=1900)
+        rating = types.FloatType()
+    return Album
+
+
+def main():
+    print('Class definition')
+    bench('Type subclass', define_type, 2000)
+    bench('Record subclass with 3 fields', define_record, 1000)
+
+    print('Instantiation')
+    bench('StringType()', types.StringType, 20000)
+    bench('StringType(max_length=10)', lambda: types.StringType(
+        max_length=10
+    ), 20000)
+    bench('IntegerType(min=0, max=10)', lambda: types.IntegerType(
+        min=0, max=10
+    ), 20000)
+    bench('Record subclass', Song, 20000)
+
+    print('Reading schematics')
+    st = types.StringType(max_length=10)
+    bench('StringType.to_schematic', st.to_schematic, 20000)
+    song = Song(strict=True)
+    bench('Record.to_schematic', song.to_schematic, 20000)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+"""
+Times the startup of a process that defines a few hundred records and
+converts a value with each of them, with and without an `artifacts` store.
+Each run is a fresh interpreter, started on a generated schema module, and
+the time reported is measured inside it, from importing the schema to the
+last conversion. The warm store is filled by a run before the timed ones.
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+
+RECORDS = 300
+RUNS = 5
+
+FIELD_LINES = [
+    "    name = types.StringType(required=True, max_length=40)",
+    "    email = types.EmailType()",
+    "    age = types.IntegerType(min=0)",
+    "    score = types.FloatType()",
+    "    active = types.BooleanType(default=True)",
+    "    created_at = types.DateTimeType()",
+    "    tags = types.ListType(types.StringType())",
+    "    field_%d = types.StringType(max_length=%d)",
+]
+
+VALUE = {
+    'name': 'Stevie',
+    'email': 'stevie@example.com',
+    'age': '36',
+    'score': '9.5',
+    'created_at': '2021-05-29T00:00:01',
+    'tags': ['blues'],
+}
+
+RUNNER = """
+import time
+
+start = time.perf_counter()
+
+from typerighter import artifacts
+artifacts.enable()
+
+import schema
+
+for record in schema.RECORDS:
+    record.to_primitive(record.to_native(schema.VALUE))
+
+print(time.perf_counter() - start)
+"""
+
+
+def write_schema(directory):
+    lines = ['from typerighter import types', '', '']
+    for i in range(RECORDS):
+        lines.append('class Record%d(types.Record):' % i)
+        lines.extend(FIELD_LINES[:-1])
+        lines.append(FIELD_LINES[-1] % (i, i + 1))
+        lines.extend(['', ''])
+
+    names = ', '.join('Record%d()' % i for i in range(RECORDS))
+    lines.append('RECORDS = [%s]' % names)
+    lines.append('VALUE = %r' % (VALUE,))
+
+    with open(os.path.join(directory, 'schema.py'), 'w') as fh:
+        fh.write('\n'.join(lines) + '\n')
+    with open(os.path.join(directory, 'runner.py'), 'w') as fh:
+        fh.write(RUNNER)
+
+
+def run_once(directory, cache_dir):
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join([directory, root])
+    env.pop('TYPERIGHTER_CACHE_DIR', None)
+    if cache_dir:
+        env['TYPERIGHTER_CACHE_DIR'] = cache_dir
+
+    output = subprocess.check_output(
+        [sys.executable, os.path.join(directory, 'runner.py')], env=env
+    )
+    return float(output)
+
+
+def report(label, times):
+    best = min(times)
+    print('  %-44s %10.2f ms' % (label, best * 1e3))
+    return best
+
+
+def main():
+    directory = tempfile.mkdtemp()
+    cache_dir = os.path.join(directory, 'artifacts')
+    try:
+        write_schema(directory)
+        # compile the schema module's bytecode before timing
+        run_once(directory, None)
+
+        print('Startup with %d records' % RECORDS)
+        baseline = report(
+            'no store', [run_once(directory, None) for _ in range(RUNS)]
+        )
+        run_once(directory, cache_dir)
+        warm = report(
+            'warm store', [run_once(directory, cache_dir) for _ in range(RUNS)]
+        )
+        print('  %-44s %10.2fx' % ('speedup', baseline / warm))
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    main()
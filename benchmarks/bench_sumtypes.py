@@ -0,0 +1,114 @@
+"""
+Compares `SumType`'s lookup by Python type, with `native_first`, against
+trying every variant in order. Values that match the last variant in order
+show the biggest difference, since the trial search validates every variant
+before it.
+
+Also compares adaptive ordering against the fixed order for records, which
+all share a native type, with traffic that mostly matches the last record.
+"""
+
+import datetime
+import itertools
+
+from typerighter import exceptions
+from typerighter import types
+
+from .timing import bench, speedup
+
+
+class TrialSumType(types.SumType):
+    """Finds variants by validating each one in order.
+    """
+    def _find_variant(self, value, count=False):
+        for t in self.types:
+            try:
+                t.validate(value)
+                return t
+            except exceptions.ValidationException:
+                pass
+        err_msg = "No matching variant for value: {}"
+        raise exceptions.TypeException(err_msg.format(value))
+
+
+def variants():
+    return (
+        types.IntegerType(strict=True),
+        types.FloatType(strict=True),
+        types.BooleanType(strict=True),
+        types.DateTimeType(strict=True),
+        types.StringType(max_length=40),
+    )
+
+
+# Two values of each kind are alternated, so the last match is only reused
+# between `validate` and `to_native` of the same value
+VALUES = [
+    ('int, first variant', [42, 4242]),
+    ('datetime, fourth variant', [
+        datetime.datetime(2021, 5, 29), datetime.datetime(2021, 5, 30)
+    ]),
+    ('str, last variant', ['Texas blues', 'Delta blues']),
+]
+
+
+def main():
+    trial = TrialSumType(*variants())
+    dispatch = types.SumType(*variants(), native_first=True)
+
+    for label, values in VALUES:
+        print('validate and to_native: %s' % label)
+        cycle = itertools.cycle(values)
+
+        def trial_run():
+            value = next(cycle)
+            trial.validate(value)
+            trial.to_native(value)
+
+        def dispatch_run():
+            value = next(cycle)
+            dispatch.validate(value)
+            dispatch.to_native(value)
+
+        baseline = bench('trial', trial_run, 2000)
+        candidate = bench('dispatch', dispatch_run, 2000)
+        speedup(baseline, candidate)
+
+
+def make_shape_record(index):
+    namespace = {
+        'name': types.StringType(required=True),
+        'side_%d' % index: types.FloatType(required=True, min=0),
+    }
+    return types.RecordMeta('Shape%d' % index, (types.Record,), namespace)()
+
+
+def shape(index):
+    return {'name': 'shape', 'side_%d' % index: 1.5}
+
+
+def adaptive_main():
+    records = [make_shape_record(i) for i in range(5)]
+    fixed = types.SumType(*records)
+    adaptive = types.SumType(*records, adaptive=True, reorder_every=100)
+
+    # nine in ten values match the last record
+    values = itertools.cycle([shape(4)] * 9 + [shape(0)])
+    for _ in range(1000):
+        adaptive.validate(next(values))
+
+    print('validate records, most matching the last of 5 variants')
+    baseline = bench('fixed order', lambda: fixed.validate(next(values)), 500)
+    candidate = bench(
+        'adaptive order', lambda: adaptive.validate(next(values)), 500
+    )
+    speedup(baseline, candidate)
+    stats = adaptive.variant_stats()
+    print('  %-44s %10.2f' % (
+        'variants tried per lookup', stats['trials_per_lookup']
+    ))
+
+
+if __name__ == '__main__':
+    main()
+    adaptive_main()
@@ -0,0 +1,68 @@
+"""
+Compares a `TaggedUnionType` against a `SumType` of the same ten event
+records. A `SumType` validates records in turn until one accepts the value,
+so events matching later records cost more, while the tagged union looks the
+record up by the value's `kind` field.
+"""
+
+from typerighter import types
+
+from .timing import bench, speedup
+
+
+EVENT_KINDS = 10
+
+
+def make_event_record(index):
+    namespace = {
+        'kind': types.StringType(required=True, choices=['event%d' % index]),
+        'user_id': types.IntegerType(required=True),
+        'source': types.StringType(max_length=40),
+        'created_at': types.DateTimeType(),
+        'value_%d' % index: types.IntegerType(required=True, min=0),
+    }
+    return types.RecordMeta(
+        'Event%d' % index, (types.Record,), namespace
+    )()
+
+
+def make_event(index):
+    return {
+        'kind': 'event%d' % index,
+        'user_id': 42,
+        'source': 'web',
+        'created_at': '2021-05-29T00:00:01',
+        'value_%d' % index: index,
+    }
+
+
+def main():
+    records = [make_event_record(i) for i in range(EVENT_KINDS)]
+    sum_type = types.SumType(*records)
+    tagged = types.TaggedUnionType(
+        'kind', {'event%d' % i: r for i, r in enumerate(records)}
+    )
+
+    for index in (0, EVENT_KINDS // 2, EVENT_KINDS - 1):
+        event = make_event(index)
+        print('validate, event matching variant %d of %d' % (
+            index + 1, EVENT_KINDS
+        ))
+        baseline = bench('SumType', lambda: sum_type.validate(event), 200)
+        candidate = bench(
+            'TaggedUnionType', lambda: tagged.validate(event), 200
+        )
+        speedup(baseline, candidate)
+
+        print('to_native, event matching variant %d of %d' % (
+            index + 1, EVENT_KINDS
+        ))
+        baseline = bench('SumType', lambda: sum_type.to_native(event), 200)
+        candidate = bench(
+            'TaggedUnionType', lambda: tagged.to_native(event), 200
+        )
+        speedup(baseline, candidate)
+
+
+if __name__ == '__main__':
+    main()
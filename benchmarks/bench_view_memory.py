@@ -0,0 +1,46 @@
+"""
+Compares the memory held by dict backed views against compact views, and the
+cost of reading their fields.
+"""
+
+import gc
+import tracemalloc
+
+from typerighter import views
+
+from .bench_views import Song, SONG_DATA
+from .timing import bench, speedup
+
+
+COUNT = 100000
+
+
+def measure(label, record, compact):
+    gc.collect()
+    tracemalloc.start()
+    held = [
+        views.to_view(record, dict(SONG_DATA), compact=compact, native=False)
+        for _ in range(COUNT)
+    ]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print('  %-44s %10.1f MB' % (label, size / 1e6))
+    print('  %-44s %10.0f B' % ('per view', size / len(held)))
+    return size
+
+
+if __name__ == '__main__':
+    record = Song()
+
+    print('memory for %d views' % COUNT)
+    baseline = measure('dict view', record, False)
+    compact = measure('compact view', record, True)
+    print('  %-44s %10.2fx' % ('reduction', baseline / compact))
+
+    print('reading a field')
+    view = views.to_view(record, SONG_DATA)
+    compact_view = views.to_view(record, SONG_DATA, compact=True)
+    baseline = bench('dict view', lambda: view.track, 100000)
+    compact = bench('compact view', lambda: compact_view.track, 100000)
+    speedup(baseline, compact)
@@ -0,0 +1,109 @@
+"""
+Compares creating views with cached view classes against building a new view
+class for every view, as `to_view` used to.
+"""
+
+from typerighter import types
+from typerighter import views
+
+from .timing import bench, speedup
+
+
+class Musician(types.Record):
+    name = types.StringType(required=True)
+    instrument = types.StringType()
+
+
+class Song(types.Record):
+    name = types.StringType(required=True)
+    author = Musician()
+    created_at = types.DateTimeType()
+    lyrics = types.StringType(max_length=255)
+    track = types.IntegerType(min=1)
+
+    def set_name(self, value):
+        return value
+
+
+SONG_DATA = {
+    'name': 'Pride & Joy',
+    'author': {'name': 'Stevie Ray Vaughan', 'instrument': 'guitar'},
+    'created_at': '1983-06-13T00:00:00',
+    'lyrics': 'Well you heard about love givin sight to the blind',
+    'track': 2,
+}
+
+
+# A record with 50 datetime fields
+Wide = type(types.Record)('Wide', (types.Record,), {
+    'f%d' % i: types.DateTimeType() for i in range(50)
+})
+
+WIDE_DATA = {'f%d' % i: '2021-05-29T00:00:01.001337' for i in range(50)}
+
+
+def read_two(view):
+    return view.f0, view.f1
+
+
+def uncached_view(record, data):
+    RecordView = views._build_view_class(record)
+    return RecordView(record, data=data)
+
+
+if __name__ == '__main__':
+    record = Song()
+
+    print('view creation')
+    baseline = bench(
+        'new class per view', lambda: uncached_view(record, SONG_DATA), 5000
+    )
+    cached = bench(
+        'cached class', lambda: views.to_view(record, SONG_DATA), 5000
+    )
+    speedup(baseline, cached)
+
+    print('view creation without conversion')
+    baseline = bench(
+        'new class per view',
+        lambda: views._build_view_class(record)(record, SONG_DATA, False),
+        5000
+    )
+    cached = bench(
+        'cached class',
+        lambda: views.to_view(record, SONG_DATA, native=False), 5000
+    )
+    speedup(baseline, cached)
+
+    print('reading 2 of 50 fields')
+    wide = Wide()
+    baseline = bench(
+        'view', lambda: read_two(views.to_view(wide, WIDE_DATA)), 1000
+    )
+    lazy = bench(
+        'lazy view',
+        lambda: read_two(views.to_view(wide, WIDE_DATA, lazy=True)), 1000
+    )
+    speedup(baseline, lazy)
+
+    print('writing back 1 of 50 changed fields')
+    view = views.to_view(wide, WIDE_DATA)
+    view.to_primitive()
+
+    def change_one(write_back):
+        view.f0 = view.f1
+        return write_back()
+
+    baseline = bench(
+        'whole record',
+        lambda: change_one(lambda: wide.to_primitive(view._data)), 1000
+    )
+    cached = bench('cached primitive', lambda: change_one(view.to_primitive),
+                   1000)
+    speedup(baseline, cached)
+    changed = bench(
+        'changed only',
+        lambda: change_one(lambda: view.to_primitive(changed_only=True)),
+        1000
+    )
+    speedup(baseline, changed)
@@ -0,0 +1,24 @@
+import timeit
+
+
+def bench(label, func, number=10000, repeat=5):
+    """Times `func` and prints the best per-call time across the repeats.
+
+    :param str label: The name printed beside the timing
+    :param callable func: A function taking no arguments
+    :param int number: The number of calls per repeat
+    :param int repeat: The number of repeats to take the best of
+    :return: the best per-call time in seconds
+    """
+    best = min(timeit.repeat(func, number=number, repeat=repeat)) / number
+    if best < 1e-3:
+        print('  %-44s %10.2f us' % (label, best * 1e6))
+    else:
+        print('  %-44s %10.2f ms' % (label, best * 1e3))
+    return best
+
+
+def speedup(baseline, candidate):
+    """Prints how many times faster `candidate` is than `baseline`.
+    """
+    print('  %-44s %10.2fx' % ('speedup', baseline / candidate))
@@ -27,6 +27,9 @@ setup(
             'flake8',
             'jedi'
         ], 
+        'arrays': [
+            'numpy'
+        ],
         'docs': [
             'sphinx',
             'sphinx_rtd_theme',
@@ -0,0 +1,113 @@
+import asyncio
+from concurrent import futures
+
+import pytest
+
+from typerighter import types
+from typerighter import exceptions
+
+
+@pytest.fixture
+def playlist_record():
+    class SongRecord(types.Record):
+        name = types.StringType(required=True)
+        track = types.IntegerType(min=1)
+
+    class PlaylistRecord(types.Record):
+        name = types.StringType(required=True)
+        songs = types.ListType(SongRecord())
+
+    return PlaylistRecord()
+
+
+def make_playlist(size):
+    return {
+        'name': 'texas flood',
+        'songs': [{'name': 'song %d' % i, 'track': i + 1} for i in range(size)]
+    }
+
+
+async def count_turns(coroutine):
+    """Runs a coroutine alongside a task that counts its turns on the loop.
+    """
+    turns = 0
+    done = False
+
+    async def spin():
+        nonlocal turns
+        while not done:
+            turns += 1
+            await asyncio.sleep(0)
+
+    spinner = asyncio.ensure_future(spin())
+    await asyncio.sleep(0)
+    turns = 0
+    try:
+        result = await coroutine
+    finally:
+        done = True
+        await spinner
+    return result, turns
+
+
+# Validation
+
+def test_avalidate_matches_validate(playlist_record):
+    values = [
+        make_playlist(3),
+        {'songs': []},
+        {'name': 'a', 'songs': [{'track': 1}]},
+        {'name': 'a', 'songs': [{'name': 'b', 'track': 'x'}]},
+        {'name': 'a', 'songs': 5},
+        None,
+        types.Unset,
+    ]
+
+    for value in values:
+        try:
+            playlist_record.validate(value)
+            expected = None
+        except Exception as e:
+            expected = type(e)
+
+        try:
+            asyncio.run(playlist_record.avalidate(value))
+            actual = None
+        except Exception as e:
+            actual = type(e)
+
+        assert actual == expected, value
+
+
+def test_avalidate_yields_to_the_loop(playlist_record):
+    data = make_playlist(1000)
+
+    _, turns = asyncio.run(
+        count_turns(playlist_record.avalidate(data, yield_every=50))
+    )
+
+    assert turns >= 1000 / 50
+
+
+def test_avalidate_offloads_big_values(playlist_record):
+    data = make_playlist(1000)
+    data['songs'][0]['track'] = 0
+
+    with futures.ThreadPoolExecutor(max_workers=1) as executor:
+        with pytest.raises(exceptions.ValidationException):
+            asyncio.run(playlist_record.avalidate(
+                {'songs': data['songs']}, executor=executor, offload_size=10
+            ))
+
+
+# Conversion
+
+def test_ato_native_matches_to_native(playlist_record):
+    data = make_playlist(300)
+
+    native, turns = asyncio.run(
+        count_turns(playlist_record.ato_native(data, yield_every=100))
+    )
+
+    assert native == playlist_record.to_native(data)
+    assert turns >= 3
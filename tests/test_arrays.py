@@ -0,0 +1,162 @@
+import pytest
+
+from typerighter import arrays
+from typerighter import exceptions
+from typerighter import types
+
+
+def failing_indexes(number_type, values):
+    failing = []
+    for i, v in enumerate(values):
+        try:
+            number_type.validate(v)
+        except exceptions.ValidationException:
+            failing.append(i)
+    return failing
+
+
+def test_arrays_require_numpy(monkeypatch):
+    monkeypatch.setattr(arrays, 'numpy', None)
+
+    with pytest.raises(exceptions.ConfigException):
+        types.IntegerType().validate_array([1, 2])
+    with pytest.raises(exceptions.ConfigException):
+        types.FloatType().to_native_array([1.0])
+    with pytest.raises(exceptions.ConfigException):
+        types.ListType(types.IntegerType()).validate_array([1, 2])
+
+
+def test_array_methods_arent_validators():
+    assert 'validate_array' not in types.IntegerType._validate_functions
+    assert 'validate_array' not in types.ListType._validate_functions
+
+
+def test_array_needs_number_items():
+    with pytest.raises(exceptions.TypeException):
+        types.ListType(types.StringType()).validate_array(['a'])
+
+
+def test_validate_array_range():
+    numpy = pytest.importorskip('numpy')
+
+    readings = numpy.array([5, -1, 10, 11, 1])
+    it = types.IntegerType(min=1, max=10)
+    failing = it.validate_array(readings)
+    assert failing.tolist() == [1, 3]
+    assert failing.tolist() == failing_indexes(it, readings.tolist())
+
+
+def test_validate_array_matches_validate():
+    numpy = pytest.importorskip('numpy')
+
+    values = [1, 2.5, '3', 'x', None, types.Unset, 7, float('nan'), 3 + 0j]
+    number_types = [
+        types.IntegerType(),
+        types.IntegerType(required=True),
+        types.IntegerType(min=2, max=7),
+        types.FloatType(choices=[1.0, 7.0]),
+        types.FloatType(strict=True),
+    ]
+    for number_type in number_types:
+        failing = number_type.validate_array(numpy.array(values, dtype=object))
+        assert failing.tolist() == failing_indexes(number_type, values)
+
+    it = types.IntegerType()
+    assert it.validate_array([5, 3 + 0j, 7]).tolist() == [1]
+    assert types.ListType(it).validate_array([5, 1j]).tolist() == [1]
+
+
+def test_validate_array_int64_limit():
+    numpy = pytest.importorskip('numpy')
+
+    readings = numpy.array([1.0, 1e30, -1e30])
+    assert types.IntegerType().validate_array(readings).tolist() == [1, 2]
+
+
+def test_validate_array_strict_dtypes():
+    numpy = pytest.importorskip('numpy')
+
+    assert types.IntegerType(strict=True).validate_array(
+        numpy.arange(3)
+    ).tolist() == []
+    assert types.IntegerType(strict=True).validate_array(
+        numpy.arange(3, dtype=float)
+    ).tolist() == [0, 1, 2]
+    assert types.FloatType(strict=True).validate_array(
+        numpy.linspace(0, 1, 3)
+    ).tolist() == []
+
+
+def test_validate_array_strict_lists():
+    numpy = pytest.importorskip('numpy')
+
+    values = [1.5, 1, 2 ** 70, True, None]
+    for number_type in [
+        types.IntegerType(strict=True), types.FloatType(strict=True)
+    ]:
+        expected = failing_indexes(number_type, values)
+        assert number_type.validate_array(values).tolist() == expected
+
+        objects = numpy.array(values, dtype=object)
+        assert number_type.validate_array(objects).tolist() == expected
+
+
+def test_list_validate_array_strict_lists():
+    pytest.importorskip('numpy')
+
+    lt = types.ListType(types.IntegerType(strict=True, min=2))
+    values = [2.5, 1, 3, 2 ** 70]
+
+    with pytest.raises(exceptions.ItemValidationException) as e:
+        lt.validate(values)
+    assert sorted(e.value.errors) == [1]
+    assert lt.validate_array(values).tolist() == [1]
+
+    lt.validate([2.5, 3])
+    assert lt.validate_array([2.5, 3]).tolist() == []
+
+
+def test_validate_array_custom_validator():
+    numpy = pytest.importorskip('numpy')
+
+    class EvenType(types.IntegerType):
+        def validate_even(self, value):
+            if value % 2:
+                raise exceptions.ValidationException('Odd')
+
+    failing = EvenType(min=1).validate_array(numpy.array([2, 3, -2, 4]))
+    assert failing.tolist() == [1, 2]
+
+
+def test_to_native_array():
+    numpy = pytest.importorskip('numpy')
+
+    native = types.IntegerType().to_native_array(['1', 2, 3.0])
+    assert native.dtype == numpy.int64
+    assert native.tolist() == [1, 2, 3]
+
+    native = types.FloatType().to_native_array(numpy.array([1, 2]))
+    assert native.dtype == numpy.float64
+
+    with pytest.raises(exceptions.TypeException) as e:
+        types.IntegerType().to_native_array([1, 'x', None])
+    assert '1, 2' in str(e.value)
+
+
+def test_list_validate_array():
+    numpy = pytest.importorskip('numpy')
+
+    lt = types.ListType(types.IntegerType(min=1), max_length=3)
+    assert lt.validate_array(numpy.array([1, -1, 2])).tolist() == [1]
+    with pytest.raises(exceptions.ValidationException):
+        lt.validate_array(numpy.arange(4))
+
+    required = types.ListType(types.IntegerType(), required=True)
+    with pytest.raises(exceptions.ValidationException):
+        required.validate_array(types.Unset)
+    assert types.ListType(types.IntegerType()).validate_array(
+        None
+    ).tolist() == []
+
+    native = lt.to_native_array([1, '2'])
+    assert native.tolist() == [1, 2]
@@ -0,0 +1,108 @@
+import os
+
+import pytest
+
+from typerighter import artifacts
+from typerighter import codegen
+from typerighter import schematics
+from typerighter import types
+
+
+@pytest.fixture
+def store(tmp_path):
+    yield artifacts.enable(str(tmp_path))
+    artifacts.disable()
+
+
+def test_store_round_trip(tmp_path):
+    store = artifacts.ArtifactStore(str(tmp_path))
+    store.put('test', 'key', ['value', 1])
+    assert store.get('test', 'key') == ['value', 1]
+    assert not os.path.exists(store.path('test'))
+
+    store.save()
+    reloaded = artifacts.ArtifactStore(str(tmp_path))
+    assert reloaded.get('test', 'key') == ['value', 1]
+    assert reloaded.get('test', 'missing') is None
+
+
+def test_store_merges_saves(tmp_path):
+    first = artifacts.ArtifactStore(str(tmp_path))
+    second = artifacts.ArtifactStore(str(tmp_path))
+    first.put('test', 'a', 1)
+    second.put('test', 'b', 2)
+    first.save()
+    second.save()
+
+    reloaded = artifacts.ArtifactStore(str(tmp_path))
+    assert reloaded.get('test', 'a') == 1
+    assert reloaded.get('test', 'b') == 2
+
+
+def test_store_ignores_broken_files(tmp_path):
+    store = artifacts.ArtifactStore(str(tmp_path))
+    with open(store.path('test'), 'wb') as fh:
+        fh.write(b'not marshal data')
+
+    assert store.get('test', 'key') is None
+
+
+def test_store_clear(tmp_path):
+    store = artifacts.ArtifactStore(str(tmp_path))
+    store.put(artifacts.CODE, 'key', 1)
+    store.save()
+    store.clear()
+
+    assert not os.path.exists(store.path(artifacts.CODE))
+    assert store.get(artifacts.CODE, 'key') is None
+
+
+def test_compile_source_without_store():
+    artifacts.disable()
+    assert artifacts.active_store() is None
+
+    namespace = {}
+    exec(artifacts.compile_source('x = 1\n', '<test>'), namespace)
+    assert namespace['x'] == 1
+
+
+def test_compile_source_reuses_code(store):
+    code = artifacts.compile_source('x = 1\n', '<test>')
+    assert artifacts.compile_source('x = 1\n', '<test>') is code
+    assert artifacts.compile_source('x = 2\n', '<test>') is not code
+
+
+def test_generated_code_is_stored(store):
+    class Song(types.Record):
+        name = types.StringType(required=True)
+        track = types.IntegerType(default=1)
+
+    converter = codegen.generate(Song(), 'to_native')
+    assert converter({'name': 'Smells', 'track': '2'}) == {
+        'name': 'Smells', 'track': 2
+    }
+
+    artifacts.save()
+    reloaded = artifacts.ArtifactStore(store.directory)
+    key = schematics.fingerprint(
+        [converter.__code__.co_filename, converter.source]
+    )
+    code = reloaded.get(artifacts.CODE, key)
+    namespace = dict(converter.__globals__)
+    exec(code, namespace)
+    assert namespace['to_native']({'name': 'Smells'}) == {
+        'name': 'Smells', 'track': 1
+    }
+
+
+def test_enable_reads_environment(tmp_path, monkeypatch):
+    monkeypatch.delenv(artifacts.CACHE_DIR_ENV, raising=False)
+    assert artifacts.enable() is None
+
+    monkeypatch.setenv(artifacts.CACHE_DIR_ENV, str(tmp_path))
+    try:
+        store = artifacts.enable()
+        assert artifacts.active_store() is store
+        assert store.directory == str(tmp_path)
+    finally:
+        artifacts.disable()
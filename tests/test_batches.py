@@ -0,0 +1,149 @@
+import pytest
+
+from typerighter import types
+from typerighter import batches
+from typerighter import exceptions
+
+
+@pytest.fixture
+def song_record():
+    class SongRecord(types.Record):
+        name = types.StringType(required=True)
+        track = types.IntegerType(min=1)
+        plays = types.IntegerType(default=7)
+        length = types.FloatType(strict=True)
+
+    return SongRecord()
+
+
+# Structural
+
+def test_validate_many_is_not_a_validator(song_record):
+    assert 'validate_many' not in song_record._validate_functions
+
+
+# Validation
+
+def test_validate_many_reports_per_row_and_field(song_record):
+    result = song_record.validate_many([
+        {'name': 'pride & joy', 'track': '1'},
+        {'track': 2},
+        {'name': 'texas flood', 'track': 0},
+        {'name': 'lenny', 'track': 'three'},
+        None,
+        5,
+    ])
+
+    assert len(result) == 6
+    assert not result.is_valid
+    assert result.failed_rows == [1, 2, 3, 5]
+
+    assert result.values[0] == {'name': 'pride & joy', 'track': 1, 'plays': 7}
+    assert result.values[1] is None
+    assert result.values[4] is None
+
+    assert set(result.errors) == {'name', 'track', batches.RECORD_PATH}
+    assert set(result.errors['track']) == {2, 3}
+    assert result.row_errors(1) == {'name': ['Value required but not found']}
+
+
+def test_validate_many_matches_validate(song_record):
+    rows = [
+        {'name': 'a', 'track': 1}, {'track': 1}, {'name': 'b', 'track': -1},
+        {}, None, types.Unset, 'not a record', {'name': 'c', 'plays': 'x'},
+        {'name': 'd', 'length': '2.0'}, {'name': 'e', 'length': 'x'},
+    ]
+
+    result = song_record.validate_many(rows)
+
+    for row, value in enumerate(rows):
+        try:
+            song_record.validate(value)
+        except Exception:
+            assert row in result.failed_rows, value
+        else:
+            assert row not in result.failed_rows, value
+
+
+def test_validate_many_runs_record_validators():
+    class TestRecord(types.Record):
+        low = types.IntegerType()
+        high = types.IntegerType()
+
+        def validate_order(self, value):
+            if value['low'] > value['high']:
+                raise exceptions.ValidationException('out of order')
+
+    result = TestRecord().validate_many([
+        {'low': 1, 'high': 2}, {'low': 3, 'high': 2}
+    ])
+
+    assert result.failed_rows == [1]
+    assert result.errors == {batches.RECORD_PATH: {1: ['out of order']}}
+
+
+# Conversion
+
+def test_to_native_many(song_record):
+    result = song_record.to_native_many([
+        {'name': 'pride & joy', 'track': '1'},
+        {'track': 'two'},
+        None,
+    ])
+
+    assert result.values[0] == song_record.to_native(
+        {'name': 'pride & joy', 'track': '1'}
+    )
+    assert result.values[1] is None
+    assert result.values[2] is None
+    assert result.failed_rows == [1]
+    assert list(result.errors) == ['track']
+
+
+def test_validate_many_reports_nested_paths():
+    class Song(types.Record):
+        name = types.StringType(required=True)
+
+    class Album(types.Record):
+        songs = types.ListType(Song())
+
+    result = Album().validate_many([
+        {'songs': [{'name': 'a'}]},
+        {'songs': [{}]},
+    ])
+
+    assert result.errors == {
+        'songs.0.name': {1: ['Value required but not found']}
+    }
+
+
+# Workers
+
+class WorkerSongRecord(types.Record):
+    name = types.StringType(required=True)
+    track = types.IntegerType(min=1)
+
+
+def test_validate_many_with_workers():
+    record = WorkerSongRecord(required=True)
+    rows = [{'name': 'song %d' % i, 'track': i % 4} for i in range(50)]
+
+    result = record.validate_many(rows, workers=2, chunk_size=7)
+    expected = record.validate_many(rows)
+
+    assert result.values == expected.values
+    assert result.errors == expected.errors
+    assert result.failed_rows == list(range(0, 50, 4))
+
+
+def test_validate_many_with_workers_needs_cached_record():
+    class WorkerSongRecord(types.Record):
+        name = types.StringType()
+
+    shadowed = WorkerSongRecord
+
+    class WorkerSongRecord(types.Record):
+        name = types.StringType()
+
+    with pytest.raises(exceptions.UncachableException):
+        shadowed().validate_many([{}], workers=2)
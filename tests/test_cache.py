@@ -38,3 +38,51 @@ def test_created_classes_in_cache(gen_musical_types):
     cache_keys = set(cache.TypeCache().keys())
 
     assert len(new_keys - cache_keys) == 0
+
+
+def test_pattern_cache_shares_compiled_patterns():
+    pattern_cache = cache.PatternCache()
+    before = pattern_cache.stats()
+
+    u1 = types.URLType()
+    u2 = types.URLType()
+
+    assert u1._regex is u2._regex
+    assert pattern_cache.stats()['hits'] > before['hits']
+
+    st = types.StringType(regex='^shared$')
+    assert st._regex is pattern_cache.compile('^shared$')
+
+
+def test_pattern_cache_keys_include_flags():
+    pattern_cache = cache.PatternCache()
+
+    plain = pattern_cache.compile('^abc$')
+    ignorecase = pattern_cache.compile('^abc$', 2)
+
+    assert plain is not ignorecase
+    assert ignorecase.match('ABC')
+
+
+def test_pattern_cache_is_bounded():
+    pattern_cache = cache.PatternCache()
+    max_size = pattern_cache.max_size
+    pattern_cache.max_size = 2
+
+    try:
+        pattern_cache.clear()
+        pattern_cache.compile('a')
+        pattern_cache.compile('b')
+        pattern_cache.compile('a')
+        pattern_cache.compile('c')
+
+        assert len(pattern_cache) == 2
+        assert pattern_cache.stats() == {
+            'hits': 1, 'misses': 3, 'size': 2, 'max_size': 2
+        }
+
+        pattern_cache.compile('a')
+        assert pattern_cache.stats()['hits'] == 2
+    finally:
+        pattern_cache.max_size = max_size
+        pattern_cache.clear()
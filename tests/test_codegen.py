@@ -0,0 +1,96 @@
+import pytest
+
+from typerighter import types
+from typerighter import codegen
+
+
+class Song(types.Record):
+    name = types.StringType(required=True)
+    created_at = types.DateTimeType()
+    track = types.IntegerType(default=1)
+    lyrics = types.StringType(max_length=255)
+
+
+class Album(types.Record):
+    name = types.StringType(required=True, default='untitled')
+    created_at = types.DateTimeType()
+    songs = types.ListType(Song())
+
+
+class Artist(types.Record):
+    name = types.StringType(required=True)
+    website = types.URLType()
+    albums = types.ListType(Album())
+    debut = Album()
+
+
+ARTIST_DATA = {
+    'name': 'American Food',
+    'albums': [{
+        'created_at': '2021-05-29T00:00:01.001337',
+        'songs': [{
+            'name': 'Cane Spiders (mispoke)',
+            'created_at': '2021-05-29T00:00:00.001337',
+            'lyrics': 'Oh my gawd! It\'s that red dot!',
+        }, {
+            'name': 'My Take On Take On Me',
+            'track': '2',
+        }]
+    }],
+    'debut': {'name': 'Internet On The TV'},
+}
+
+
+def regular_convert(record, method, value, **convert_args):
+    def converter(value, ti, **kw):
+        return getattr(ti, method)(value, **kw)
+    return {k: v for k, v in record._convert(value, converter, **convert_args)}
+
+
+@pytest.mark.parametrize('method', ['to_native', 'to_primitive'])
+@pytest.mark.parametrize('fields', [
+    None,
+    [],
+    ['name'],
+    ['name', 'albums.name', 'albums.songs.name'],
+    ['albums.songs.track', 'debut.name', 'missing'],
+])
+def test_generated_matches_regular_conversion(method, fields):
+    artist = Artist()
+    convert_args = {'fields': fields} if fields is not None else {}
+
+    expected = regular_convert(artist, method, ARTIST_DATA, **convert_args)
+    converted = getattr(artist, method)(ARTIST_DATA, **convert_args)
+
+    assert converted == expected
+
+
+def test_generated_functions_are_cached():
+    artist = Artist()
+
+    to_native = codegen.record_converter(artist, 'to_native')
+    filtered = codegen.record_converter(artist, 'to_native', fields=['name'])
+
+    assert to_native is codegen.record_converter(Artist(), 'to_native')
+    assert filtered is codegen.record_converter(
+        artist, 'to_native', fields=['name']
+    )
+    assert to_native is not filtered
+    assert "'albums'" not in filtered.source
+
+    assert codegen.record_converter(Album(), 'to_native') is not to_native
+
+
+def test_overridden_conversion_is_not_generated():
+    class ShoutingRecord(types.Record):
+        name = types.StringType()
+
+        def _filter(self, value, fields=None):
+            for field_name, field_type in super()._filter(value, fields):
+                yield field_name.upper(), field_type
+
+    sr = ShoutingRecord()
+
+    assert codegen.record_converter(sr, 'to_native') is None
+    assert codegen.record_converter(types.Record(), 'to_native', x=1) is None
+    assert sr.to_native({'NAME': 'x'}) == {'NAME': 'x'}
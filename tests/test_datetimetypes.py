@@ -50,3 +50,87 @@ def test_type_datetime_timezone_offset():
 
     primitive = dt.to_primitive(native)
     assert primitive == output_ds
+
+
+# Fast parsing
+
+def parse_outcome(dt, value):
+    try:
+        native = dt.to_native(value)
+    except Exception as e:
+        return type(e)
+    return (native, native.tzinfo, type(native))
+
+
+def assert_same_parse(values):
+    fast = types.DateTimeType()
+    slow = types.DateTimeType()
+    slow._parse_fast = False
+
+    for value in values:
+        assert parse_outcome(fast, value) == parse_outcome(slow, value), value
+
+
+def test_type_datetime_fast_parse_is_used():
+    parse = types.timekeeping.parse_iso8601
+
+    assert parse('2019-03-01T01:46:04') is not None
+    assert parse('2019-03-01 01:46:04.9Z') is not None
+    assert parse('2019-03-01T01:46:04.958967+05:30') is not None
+    assert parse('2019-03-01T01:46:04−07:00') is not None
+
+    assert parse('2019-03-01T01:46') is None
+    assert parse('2019-03-01T01:46:04,5') is None
+    assert parse('2019-03-01T01:46:04-0700') is None
+
+
+def test_type_datetime_fast_parse_matches_regex():
+    assert_same_parse([
+        '2019-03-01T01:46:04',
+        '2019-03-01 01:46:04',
+        '2019-03-01T01:46:04.958967',
+        '2019-03-01T01:46:04.9',
+        '2019-03-01T01:46:04.000001',
+        '2019-03-01T01:46:04.0000000',
+        '2019-03-01T01:46:04.Z',
+        '2019-03-01T01:46:04Z',
+        '2019-03-01T01:46:04.123Z',
+        '2012-07-24T23:14:29-07:00',
+        '2012-07-24T23:14:29+07:00',
+        '2012-07-24T23:14:29+00:00',
+        '2012-07-24T23:14:29-00:00',
+        '2012-07-24T23:14:29−07:30',
+        '2012-07-24T23:14:29−00:00',
+        '2012-07-24T23:14:29.5+05:45',
+        '2012-07-24T23:14:29+07:00Z',
+        '2012-07-24T23:14:29+24:00',
+        '2012-07-24T23:14:29-0700',
+        '2012-07-24T23:14:29+07',
+        '2012-07-24T23:14:29+07:0',
+        '2012-07-24T23:14:29+07:a0',
+        '2012-07-24T23:14:29.1a+07:00',
+        '2012-07-24T23:14:29,25',
+        '2012-07-24T23:14',
+        '2012-07-24T23:14Z',
+        '2012-07-24T23:14:29Z\n',
+        '2012-07-24t23:14:29',
+        '2012-13-24T23:14:29',
+        '2012-02-30T23:14:29',
+        '2012-07-24T24:00:00',
+        '2012-07-24T23:14:60',
+        '２012-07-24T23:14:29',
+        '2012-07-24T23:14:٢٩',
+        '+012-07-24T23:14:29',
+        '2012-07-24T23:1_:29',
+        '2012-07-24X23:14:29',
+        '2012-07-24',
+        'not a date',
+        '',
+    ])
+
+
+def test_type_datetime_custom_regex_skips_fast_parse():
+    dt = types.DateTimeType(regex=r'(?P<year>\d{4})$')
+
+    with pytest.raises(exceptions.TypeException):
+        dt.to_native('2019-03-01T01:46:04')
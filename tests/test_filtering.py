@@ -1,4 +1,5 @@
 from typerighter import types
+from typerighter.types import records
 
 
 def test_filtering_basic():
@@ -79,3 +80,21 @@ def test_filtering_messy_nested():
 
     second_song = filtered_data['albums'][0]['songs'][1]
     assert len(set(['name', 'created_at']) - set(second_song)) == 0
+
+
+def test_filtering_parses_each_filter_once():
+    class SongRecord(types.Record):
+        name = types.StringType(required=True)
+        author = types.StringType(required=True)
+
+    fields = ['name', 'hobby.name', 'hobby.started_at']
+    top_level_fields, subfield_map = SongRecord()._parse_field_list(fields)
+
+    assert top_level_fields == {'name', 'hobby'}
+    assert dict(subfield_map) == {
+        'name': None, 'hobby': ('name', 'started_at')
+    }
+
+    hits = records.parse_field_list.cache_info().hits
+    assert SongRecord()._parse_field_list(list(fields))[1] is subfield_map
+    assert records.parse_field_list.cache_info().hits == hits + 1
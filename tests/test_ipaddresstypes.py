@@ -54,3 +54,48 @@ def test_ipv4_address_basic_validation():
         e.validate("weeeeeee")
     with pytest.raises(exceptions.ValidationException):
         e.validate("FE80:CD00:0000:0CDE:1257:0000:211E:729C")
+
+
+def test_ipv4_address_parser():
+    e = types.IPv4Type()
+
+    e.validate("0.0.0.0")
+    e.validate("255.255.255.255")
+
+    for value in ["256.1.1.1", "1.2.3", "1.2.3.4.5", "1.2.3.4x", "1..3.4",
+                  "1.2.3.-4", "1.2.3.٤"]:
+        with pytest.raises(exceptions.ValidationException):
+            e.validate(value)
+
+
+def test_ipv6_address_parser():
+    e = types.IPv6Type()
+
+    for value in ["::", "::1", "fe80::1", "1::", "1:2:3:4:5:6:7::",
+                  "::ffff:192.168.1.1", "1:2:3:4:5:6:1.2.3.4"]:
+        e.validate(value)
+
+    for value in [":::", "1::2::3", "fe80::1%eth0", "1:2:3:4:5:6:7:8:9",
+                  "1:2:3:4:5:6:7", "12345::", "::1.2.3", ":1::",
+                  "1:2:3:4:5:6:7:1.2.3.4"]:
+        with pytest.raises(exceptions.ValidationException):
+            e.validate(value)
+
+
+def test_ip_address_parser_on_adversarial_input():
+    e = types.IPAddressType()
+
+    with pytest.raises(exceptions.ValidationException):
+        e.validate("1:" * 10000 + "x")
+    with pytest.raises(exceptions.ValidationException):
+        e.validate("1." * 10000)
+
+
+def test_ip_address_regex_override():
+    e = types.IPv4Type(regex=r'^10\.')
+
+    assert e.parser is None
+    e.validate("10.not.an.ip")
+
+    with pytest.raises(exceptions.ValidationException):
+        e.validate("192.168.1.1")
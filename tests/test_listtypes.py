@@ -83,3 +83,56 @@ def test_listtype_validates_max_size():
 
     with pytest.raises(exceptions.ValidationException):
         list_of_strings.validate(['li', 'st', 'of', 'strings'])
+
+
+def test_listtype_validates_every_item():
+    list_of_numbers = types.ListType(types.IntegerType(min=1))
+
+    list_of_numbers.validate([1, 2, 3])
+
+    with pytest.raises(exceptions.ItemValidationException) as e:
+        list_of_numbers.validate([1, 0, 2, -1])
+    assert e.value.errors == {
+        1: 'Value below allowed min: 0 < 1',
+        3: 'Value below allowed min: -1 < 1',
+    }
+    assert str(e.value) == 'Invalid items at indexes: 1, 3'
+
+
+def test_listtype_item_errors():
+    list_of_strings = types.ListType(types.StringType(max_length=2))
+
+    assert list_of_strings.item_errors(['ab', 'c']) == {}
+    assert list(list_of_strings.item_errors(['ab', 'cde', 'fgh'])) == [1, 2]
+
+
+def test_listtype_simple_items():
+    list_of_ints = types.ListType(types.IntegerType())
+    data = [1, 2, 3]
+
+    assert list_of_ints.is_simple(data)
+    assert not list_of_ints.is_simple([1, '2', 3])
+    assert not list_of_ints.is_simple([1, True])
+    assert not types.ListType(types.IntegerType(min=1)).is_simple(data)
+    assert not types.ListType(types.IntegerType(required=True)).is_simple(data)
+    assert not types.ListType(types.EmailType()).is_simple(['a@b.c'])
+
+    native = list_of_ints.to_native(data)
+    assert native == data
+    assert native is not data
+    assert list_of_ints.to_native([1, '2', True]) == [1, 2, 1]
+    assert types.ListType(types.FloatType()).to_native((1.5, 2.5)) == [
+        1.5, 2.5
+    ]
+
+
+def test_listtype_collects_every_item():
+    list_of_numbers = types.ListType(types.IntegerType(min=1))
+
+    assert list_of_numbers.validate([1, 0, 'x'], collect=True) == {
+        '1': ['Value below allowed min: 0 < 1'],
+        '2': ['Value doesnt match type format x'],
+    }
+    assert types.ListType(types.IntegerType()).validate(
+        [1, 2], collect=True
+    ) == {}
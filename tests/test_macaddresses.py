@@ -29,3 +29,22 @@ def test_mac_address_basic_validation():
         e.validate("weeeeeee")
     with pytest.raises(exceptions.ValidationException):
         e.validate("00:25:96:FF:FE")
+
+
+def test_mac_address_parser():
+    e = types.MACAddressType()
+
+    for value in ["00-25-96-ff-fe-12", "002596FFFE12", "002596-FFFE12",
+                  "002596:FFFE12", "0025.96FF.FE12"]:
+        e.validate(value)
+
+    for value in ["00:25-96:FF:FE:12", "00:25:96:FF:FE:1G", "002596FFFE1",
+                  "002596FFFE12AB", "002596.FFFE12", "0025:96FF:FE12"]:
+        with pytest.raises(exceptions.ValidationException):
+            e.validate(value)
+
+
+def test_mac_address_regex_override():
+    e = types.MACAddressType(regex=r'^[0-9a-f]{12}')
+
+    e.validate("002596FFFE12 and more")
@@ -0,0 +1,299 @@
+import pytest
+
+from typerighter import types
+from typerighter import plans
+from typerighter import exceptions
+
+
+def outcome(validate, value):
+    try:
+        validate(value)
+        return None
+    except Exception as e:
+        return type(e)
+
+
+def assert_same_outcomes(type_instance, values):
+    plan = type_instance.compile()
+    for value in values:
+        expected = outcome(type_instance.validate, value)
+        assert outcome(plan.validate, value) == expected, value
+
+
+# Structural
+
+def test_compile_is_cached():
+    st = types.StringType()
+
+    assert isinstance(st.compile(), plans.Plan)
+    assert st.compile() is st.compile()
+
+
+def test_compile_drops_unconfigured_validators():
+    active = dict(plans.active_validators(types.IntegerType()))
+    assert 'validate_choices' not in active
+    assert 'validate_min' not in active
+    assert 'validate_max' not in active
+
+    active = dict(plans.active_validators(types.IntegerType(min=3)))
+    assert 'validate_min' in active
+    assert 'validate_max' not in active
+
+    active = dict(plans.active_validators(types.StringType()))
+    assert 'validate_regex' not in active
+    assert 'validate_min_length' not in active
+
+    active = dict(plans.active_validators(types.StringType(regex='^a')))
+    assert 'validate_regex' in active
+
+
+# Validation
+
+def test_plan_matches_primitives():
+    assert_same_outcomes(
+        types.IntegerType(min=3, max=10, required=True),
+        [types.Unset, None, 0, 2, 3, '5', 11, 'abc', 5.5]
+    )
+    assert_same_outcomes(
+        types.StringType(min_length=2, regex='^a', choices=['ab', 'abc']),
+        [types.Unset, None, '', 'a', 'ab', 'abc', 'abcd', 'b', 5]
+    )
+    assert_same_outcomes(
+        types.IntegerType(strict=True),
+        [types.Unset, None, 1, '1', 1.5]
+    )
+    assert_same_outcomes(
+        types.DateTimeType(required=True),
+        [types.Unset, None, '2021-05-29T00:00:01.001337', 'not a date', 5]
+    )
+
+
+def test_plan_matches_nested_records():
+    class TestRecord(types.Record):
+        s1 = types.StringType(required=True)
+        s2 = types.StringType()
+
+    class ParentRecord(types.Record):
+        tr = TestRecord()
+
+    class GrandparentRecord(types.Record):
+        pr = ParentRecord()
+
+    class GreatGrandparentRecord(types.Record):
+        gr = GrandparentRecord()
+
+    assert_same_outcomes(GreatGrandparentRecord(), [
+        {'gr': {'pr': {'tr': {'s1': None}}}},
+        {'gr': {'pr': {'tr': {'s1': None, 's2': None}}}},
+        {'gr': {'pr': {'tr': {'s2': None}}}},
+        {'gr': {'pr': {'tr': {'s1': types.Unset}}}},
+        {'gr': {'pr': {'tr': None}}},
+        {'gr': {'pr': {'tr': {}}}},
+        {'gr': {'pr': {'tr': types.Unset}}},
+        {'gr': {'pr': None}},
+        {'gr': {'pr': {}}},
+        {'gr': None},
+        {'gr': {}},
+        {'gr': 5},
+        None,
+        types.Unset,
+    ])
+
+
+def test_plan_matches_records_in_lists():
+    class Song(types.Record):
+        name = types.StringType(required=True)
+        track = types.IntegerType(min=1)
+
+    class Album(types.Record):
+        name = types.StringType(required=True, default='untitled')
+        songs = types.ListType(Song(), max_length=2)
+
+    assert_same_outcomes(Album(), [
+        {'name': 'a', 'songs': [{'name': 'b', 'track': 1}]},
+        {'name': 'a', 'songs': [{'track': 1}]},
+        {'name': 'a', 'songs': [{'name': 'b', 'track': 0}]},
+        {'name': 'a', 'songs': [{'name': 'b', 'track': 'x'}]},
+        {'name': 'a', 'songs': [{'name': 'b', 'length': '2.0'}]},
+        {'name': 'a', 'songs': [{'name': 'b', 'length': 'x'}]},
+        {'songs': [{'name': 'b'}, {'name': 'c'}, {'name': 'd'}]},
+        {'songs': []},
+        {},
+    ])
+
+
+def test_plan_calls_record_validators():
+    call_order = list()
+
+    class TestRecord(types.Record):
+        s = types.StringType()
+
+        def validate_first(self, value):
+            call_order.append('first')
+
+        def validate_second(self, value):
+            call_order.append('second')
+
+    TestRecord().compile().validate({'s': 'foo'})
+
+    assert call_order == ['first', 'second']
+
+
+def test_plan_raises_validation_exception():
+    class TestRecord(types.Record):
+        s = types.StringType(required=True)
+
+    with pytest.raises(exceptions.ValidationException):
+        TestRecord().compile().validate({})
+
+
+# Loading
+
+def test_load_returns_native():
+    class Event(types.Record):
+        name = types.StringType(required=True)
+        count = types.IntegerType(default=1)
+        created_at = types.DateTimeType()
+
+    native = Event().load({
+        'name': 'launch', 'created_at': '2021-05-29T00:00:01.001337'
+    })
+
+    assert native['name'] == 'launch'
+    assert native['count'] == 1
+    assert native['created_at'].microsecond == 1337
+
+    assert types.IntegerType().load('5') == 5
+    assert types.IntegerType(default=3).load(types.Unset) == 3
+
+
+def test_load_raises_like_validate():
+    with pytest.raises(exceptions.ValidationException):
+        types.IntegerType(max=3).load('5')
+
+    with pytest.raises(exceptions.ValidationException):
+        types.IntegerType().load('five')
+
+
+def test_load_converts_fields_once():
+    conversions = list()
+
+    class CountingIntegerType(types.IntegerType):
+        def to_native(self, value):
+            conversions.append(value)
+            return super().to_native(value)
+
+    class TestRecord(types.Record):
+        i = CountingIntegerType(min=1)
+
+    assert TestRecord().load({'i': '7'}) == {'i': 7}
+    assert conversions == ['7']
+
+
+# Collecting
+
+def assert_same_validity(type_instance, values):
+    for value in values:
+        errors = type_instance.validate(value, collect=True)
+        expected = outcome(type_instance.validate, value)
+        assert (expected is None) == (errors == {}), value
+
+
+def test_collect_returns_empty_dict_when_valid():
+    assert types.IntegerType(min=1).validate('4', collect=True) == {}
+
+
+def test_collect_reports_every_failing_validator():
+    st = types.StringType(min_length=5, regex='^a')
+
+    errors = st.validate('bcd', collect=True)
+
+    assert list(errors) == ['']
+    assert len(errors['']) == 2
+
+
+def test_collect_reports_nested_paths():
+    class Song(types.Record):
+        name = types.StringType(required=True)
+        track = types.IntegerType(min=1)
+
+    class Album(types.Record):
+        name = types.StringType(required=True)
+        songs = types.ListType(Song())
+
+    class Artist(types.Record):
+        name = types.StringType(required=True)
+        albums = types.ListType(Album())
+
+    errors = Artist().validate({
+        'albums': [{
+            'name': 'Internet On The TV',
+            'songs': [{'track': 0}, {'name': 'b', 'track': 'x'}],
+        }, {
+            'songs': [],
+        }]
+    }, collect=True)
+
+    assert errors == {
+        'name': ['Value required but not found'],
+        'albums.0.songs.0.name': ['Value required but not found'],
+        'albums.0.songs.0.track': ['Value below allowed min: 0 < 1'],
+        'albums.0.songs.1.track': ['Value doesnt match type format x'],
+        'albums.1.name': ['Value required but not found'],
+    }
+
+
+def test_collect_reports_container_errors_with_item_errors():
+    lt = types.ListType(types.IntegerType(min=1), max_length=2)
+
+    errors = lt.validate([0, 5, 6], collect=True)
+
+    assert set(errors) == {'', '0'}
+    assert errors['0'] == ['Value below allowed min: 0 < 1']
+
+
+def test_collect_reports_record_errors_with_field_errors():
+    class Song(types.Record):
+        name = types.StringType(required=True)
+        track = types.IntegerType(min=1)
+
+        def validate_track_name(self, value):
+            if value['name'] == 'intro':
+                raise exceptions.ValidationException('intro has no track')
+
+    errors = Song().validate({'name': 'intro', 'track': 0}, collect=True)
+    assert set(errors) == {'', 'track'}
+
+    # validators that can't handle the missing field are skipped
+    errors = Song().validate({'track': 2}, collect=True)
+    assert errors == {'name': ['Value required but not found']}
+
+
+def test_collect_matches_validate():
+    class Song(types.Record):
+        name = types.StringType(required=True)
+        track = types.IntegerType(min=1)
+        length = types.FloatType(strict=True)
+
+    class Album(types.Record):
+        name = types.StringType(required=True, default='untitled')
+        songs = types.ListType(Song(), max_length=2)
+
+        def validate_title(self, value):
+            if value and value.get('name') == 'bad':
+                raise exceptions.ValidationException('bad title')
+
+    assert_same_validity(Album(), [
+        {'name': 'a', 'songs': [{'name': 'b', 'track': 1}]},
+        {'name': 'a', 'songs': [{'track': 1}]},
+        {'name': 'a', 'songs': [{'name': 'b', 'track': 0}, {'name': 'c'}]},
+        {'name': 'a', 'songs': [{'name': 'b', 'track': 'x'}]},
+        {'name': 'a', 'songs': [{'name': 'b', 'length': '2.0'}]},
+        {'name': 'a', 'songs': [{'name': 'b', 'length': 'x'}]},
+        {'songs': [{'name': 'b'}, {'name': 'c'}, {'name': 'd'}]},
+        {'name': 'bad'},
+        {'songs': []},
+        {},
+        None,
+        'not a record',
+    ])
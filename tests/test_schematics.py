@@ -22,3 +22,83 @@ def test_schematics_from_type():
     assert st._schematic._init_args['strict'] == True
     assert st._schematic._init_args['field_filters'] == []
     assert st._schematic._init_args['export_nones'] == False
+
+
+def test_fingerprint_is_stable():
+    class SongType(types.Record):
+        name = types.StringType(required=True, max_length=40)
+        plays = types.ListType(types.IntegerType())
+
+    first = SongType().fingerprint()
+    assert first == SongType().fingerprint()
+    assert len(first) == 64
+
+
+def test_fingerprint_follows_config():
+    assert types.StringType().fingerprint() != \
+        types.StringType(required=True).fingerprint()
+    assert types.ListType(types.IntegerType()).fingerprint() != \
+        types.ListType(types.StringType()).fingerprint()
+
+
+def test_fingerprint_includes_fields():
+    class SongType(types.Record):
+        name = types.StringType()
+
+    class OtherSongType(types.Record):
+        name = types.StringType(max_length=10)
+
+    class AlbumType(types.Record):
+        song = SongType()
+
+    class OtherAlbumType(types.Record):
+        song = OtherSongType()
+
+    assert SongType().fingerprint() != OtherSongType().fingerprint()
+    assert AlbumType().fingerprint() != OtherAlbumType().fingerprint()
+
+
+def test_fingerprint_includes_sum_variants():
+    one = types.SumType(types.IntegerType(), types.StringType())
+    same = types.SumType(types.IntegerType(), types.StringType())
+    other = types.SumType(types.IntegerType(), types.StringType(max_length=3))
+
+    assert one.fingerprint() == same.fingerprint()
+    assert one.fingerprint() != other.fingerprint()
+
+
+def test_fingerprint_is_cached():
+    st = types.StringType()
+    first = st.fingerprint()
+    st.max_length = 10
+
+    assert st.fingerprint() is first
+
+
+def test_schematic_argspec_is_lazy():
+    class LoudType(types.StringType):
+        def __init__(self, volume=11, **kw):
+            super().__init__(**kw)
+            self.volume = volume
+
+    assert LoudType._schematic._cached_argspec is None
+
+    argspec = LoudType._schematic._argspec
+    assert argspec['volume'] == 11
+    assert argspec['max_length'] is None
+    assert LoudType._schematic._cached_argspec is argspec
+
+
+def test_schematic_keeps_passed_kwargs():
+    class LoudType(types.StringType):
+        def __init__(self, volume=11, **kw):
+            super().__init__(**kw)
+            self.volume = volume
+
+    lt = LoudType(volume=3, max_length=10)
+
+    assert lt._init_kwargs == {'volume': 3, 'max_length': 10}
+    assert lt._schematic._init_args['volume'] == 3
+    assert lt._schematic._init_args['max_length'] == 10
+    assert lt._schematic._init_args['required'] is False
+    assert LoudType.__init__.__name__ == '__init__'
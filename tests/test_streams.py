@@ -0,0 +1,79 @@
+import io
+import types as pytypes
+
+import pytest
+
+from typerighter import types
+from typerighter import streams
+
+
+@pytest.fixture
+def song_record():
+    class SongRecord(types.Record):
+        name = types.StringType(required=True)
+        track = types.IntegerType(min=1)
+
+    return SongRecord()
+
+
+def test_validate_stream_is_lazy(song_record):
+    def rows():
+        yield {'name': 'pride & joy', 'track': '1'}
+        raise AssertionError('stream read too far')
+
+    results = streams.validate_stream(song_record, rows())
+
+    assert isinstance(results, pytypes.GeneratorType)
+    assert next(results) == (0, {'name': 'pride & joy', 'track': 1}, {})
+
+
+def test_validate_stream(song_record):
+    results = list(streams.validate_stream(song_record, [
+        {'name': 'pride & joy', 'track': 1},
+        {'track': 0},
+    ]))
+
+    assert results[0] == (0, {'name': 'pride & joy', 'track': 1}, {})
+    assert results[1] == (1, None, {
+        'name': ['Value required but not found'],
+        'track': ['Value below allowed min: 0 < 1'],
+    })
+
+
+def test_validate_jsonl(song_record):
+    source = io.StringIO(
+        '{"name": "pride & joy", "track": 1}\n'
+        '\n'
+        '{"track": 2}\n'
+        'not json\n'
+    )
+
+    results = list(streams.validate_jsonl(song_record, source))
+
+    assert [r[0] for r in results] == [1, 3, 4]
+    assert results[0][1] == {'name': 'pride & joy', 'track': 1}
+    assert list(results[1][2]) == ['name']
+    assert results[2][1] is None
+    assert list(results[2][2]) == ['']
+
+
+def test_validate_jsonl_from_path(song_record, tmp_path):
+    path = tmp_path / 'songs.jsonl'
+    path.write_text('{"name": "texas flood"}\n')
+
+    results = list(streams.validate_jsonl(song_record, str(path)))
+
+    assert results == [(1, {'name': 'texas flood'}, {})]
+
+
+def test_validate_csv(song_record, tmp_path):
+    path = tmp_path / 'songs.csv'
+    path.write_text('name,track\npride & joy,1\n,2\nlenny,\nsoulful,x\n')
+
+    results = list(streams.validate_csv(song_record, path))
+
+    assert [r[0] for r in results] == [2, 3, 4, 5]
+    assert results[0][1] == {'name': 'pride & joy', 'track': 1}
+    assert list(results[1][2]) == ['name']
+    assert results[2] == (4, {'name': 'lenny'}, {})
+    assert list(results[3][2]) == ['track']
@@ -94,3 +94,112 @@ def test_sumtype_item_type_honors_required():
 
     st.validate(types.Unset)
 
+
+# Dispatch
+
+def test_sumtype_tries_variants_in_order():
+    it = types.IntegerType()
+    st = types.StringType()
+    sum_type = types.SumType(it, st)
+
+    assert sum_type._find_variant('5') is it
+    assert sum_type.to_native('5') == 5
+
+
+def test_sumtype_prefers_native_variants():
+    it = types.IntegerType()
+    st = types.StringType()
+    bt = types.BooleanType()
+    sum_type = types.SumType(it, st, bt, native_first=True)
+
+    assert sum_type.to_native('5') == '5'
+
+    assert sum_type._find_variant(5) is it
+    assert sum_type._find_variant('5') is st
+    assert sum_type._find_variant(True) is bt
+    assert sum_type._dispatch[str] == (st,)
+    assert sum_type._dispatch[bool] == (bt, it)
+
+
+def test_sumtype_falls_back_to_coercion():
+    it = types.IntegerType()
+    sum_type = types.SumType(types.DateTimeType(), it, native_first=True)
+
+    assert sum_type._find_variant('5') is it
+    assert sum_type.to_native('5') == 5
+
+
+def test_sumtype_remembers_last_match():
+    calls = []
+
+    class CountingType(types.StringType):
+        def validate(self, value, **kw):
+            calls.append(value)
+            return super().validate(value, **kw)
+
+    sum_type = types.SumType(types.IntegerType(), CountingType())
+    sum_type.validate('foo')
+    assert sum_type.to_native('foo') == 'foo'
+    assert len(calls) == 1
+
+    value = ['not', 'remembered']
+    sum_type.to_native(value)
+    assert sum_type._last_match[0] is not value
+
+
+def test_sumtype_is_type_match_is_quiet(capsys):
+    sum_type = types.SumType(types.IntegerType(), types.StringType())
+
+    assert sum_type.is_type_match(1)
+    assert not sum_type.is_type_match(1.5)
+    assert capsys.readouterr().out == ''
+
+
+# Adaptive ordering
+
+def test_sumtype_adaptive_reorders_variants():
+    small = types.StringType(max_length=3)
+    big = types.StringType(min_length=4)
+    sum_type = types.SumType(small, big, adaptive=True, reorder_every=4)
+
+    for value in ['long one', 'long two', 'ab', 'long three']:
+        sum_type.validate(value)
+
+    stats = sum_type.variant_stats()
+    assert stats['lookups'] == 4
+    assert [v['index'] for v in stats['order']] == [1, 0]
+    assert [v['matches'] for v in stats['order']] == [3, 1]
+    assert stats['order'][0]['variant'] is big
+    assert sum_type._native_variants(str) == (big, small)
+
+    # the most common variant is tried first from now on
+    sum_type.validate('long four')
+    assert sum_type.variant_stats()['trials_per_lookup'] == 8 / 5
+
+
+def test_sumtype_counts_each_call_once():
+    it = types.IntegerType()
+    lt = types.ListType(types.IntegerType())
+    sum_type = types.SumType(it, lt, adaptive=True)
+
+    for _ in range(100):
+        sum_type.validate('5')
+    for _ in range(10):
+        sum_type.validate([1, 2])
+    sum_type.load([3])
+    sum_type.to_native('5')
+    sum_type.to_primitive([1, 2])
+
+    stats = sum_type._stats
+    assert stats.lookups == 113
+    assert stats.matches == [101, 12]
+
+
+def test_sumtype_counts_only_when_adaptive():
+    sum_type = types.SumType(types.IntegerType(), types.StringType())
+    sum_type.validate('foo')
+
+    stats = sum_type.variant_stats()
+    assert stats['lookups'] == 0
+    assert stats['trials_per_lookup'] == 0.0
+    assert [v['index'] for v in stats['order']] == [0, 1]
@@ -0,0 +1,113 @@
+import pytest
+
+from typerighter import exceptions
+from typerighter import schematics
+from typerighter import types
+
+
+class Click(types.Record):
+    kind = types.StringType(required=True)
+    x = types.IntegerType(required=True)
+    y = types.IntegerType(required=True)
+
+
+class KeyPress(types.Record):
+    kind = types.StringType(required=True)
+    key = types.StringType(required=True, max_length=1)
+
+
+def make_events():
+    return types.TaggedUnionType(
+        'kind', {'click': Click(), 'key': KeyPress()}
+    )
+
+
+# Conversion
+
+def test_tagged_union_conversion():
+    events = make_events()
+
+    click = {'kind': 'click', 'x': '1', 'y': 2}
+    assert events.to_native(click) == {'kind': 'click', 'x': 1, 'y': 2}
+    assert events.to_primitive({'kind': 'key', 'key': 'q'}) == {
+        'kind': 'key', 'key': 'q'
+    }
+    assert events.to_native(None) is None
+
+
+def test_tagged_union_unknown_tags():
+    events = make_events()
+
+    with pytest.raises(exceptions.TypeException):
+        events.to_native({'kind': 'scroll'})
+    with pytest.raises(exceptions.TypeException):
+        events.to_native({'x': 1})
+    with pytest.raises(exceptions.TypeException):
+        events.to_native({'kind': ['unhashable']})
+
+
+# Validation
+
+def test_tagged_union_validation():
+    events = make_events()
+
+    events.validate({'kind': 'click', 'x': 1, 'y': 2})
+    events.validate({'kind': 'key', 'key': 'q'})
+    events.validate(None)
+
+    with pytest.raises(exceptions.ValidationException):
+        events.validate({'kind': 'key', 'key': 'too long'})
+    with pytest.raises(exceptions.ValidationException):
+        events.validate({'kind': 'click', 'x': 1})
+    with pytest.raises(exceptions.ValidationException):
+        events.validate({'kind': 'scroll'})
+
+
+def test_tagged_union_required():
+    events = types.TaggedUnionType('kind', {'click': Click()}, required=True)
+
+    with pytest.raises(exceptions.ValidationException):
+        events.validate(types.Unset)
+
+
+def test_tagged_union_needs_discriminator_fields():
+    class Untagged(types.Record):
+        x = types.IntegerType()
+
+    with pytest.raises(exceptions.TypeException):
+        types.TaggedUnionType('kind', {'untagged': Untagged()})
+
+
+def test_tagged_union_is_type_match():
+    events = make_events()
+
+    assert events.is_type_match({'kind': 'click', 'x': 1, 'y': 2})
+    assert not events.is_type_match({'kind': 'scroll'})
+    assert not events.is_type_match('click')
+
+
+# Schematics
+
+def test_tagged_union_schematic_round_trip():
+    events = make_events()
+    type_name, init_args = events.to_schematic()
+
+    assert type_name == 'TaggedUnionType'
+    assert init_args['discriminator'] == 'kind'
+    assert init_args['variants']['click'] == Click().to_schematic()
+
+    rebuilt = schematics.from_schematic(events.to_schematic())
+    assert isinstance(rebuilt.variants['key'], KeyPress)
+    assert rebuilt.fingerprint() == events.fingerprint()
+    assert rebuilt.to_native({'kind': 'key', 'key': 'q'}) == {
+        'kind': 'key', 'key': 'q'
+    }
+
+
+def test_list_schematic_round_trip():
+    lt = types.ListType(types.IntegerType(min=1), max_length=3)
+    rebuilt = schematics.from_schematic(lt.to_schematic())
+
+    assert isinstance(rebuilt.type, types.IntegerType)
+    assert rebuilt.type.min == 1
+    assert rebuilt.max_length == 3
@@ -50,6 +50,41 @@ def test_type_instance_meta_defaults():
     assert not hasattr(tt, '_fields')
 
 
+def test_type_attributes_are_protected():
+    class TestType(types.Type):
+        s = types.StringType()
+
+    tt = TestType()
+    tt.s = 'overwritten'
+    tt.other = 'set'
+
+    assert TestType._type_attributes == frozenset(['s'])
+    assert isinstance(tt.s, types.StringType)
+    assert tt.other == 'set'
+
+
+def test_type_instance_keeps_init_kwargs():
+    st = types.StringType(max_length=5, required=True)
+    assert st._init_kwargs == {'max_length': 5, 'required': True}
+    assert types.StringType()._init_kwargs == {}
+
+
+def test_domain_validators_are_shared():
+    a = types.IntegerType(min=1)
+    b = types.IntegerType(max=5)
+
+    assert 'validate_min' in types.IntegerType._validate_functions
+    assert a._validate_functions['validate_min'] is (
+        b._validate_functions['validate_min']
+    )
+    a.validate(1)
+    b.validate(5)
+    with pytest.raises(exceptions.ValidationException):
+        a.validate(0)
+    with pytest.raises(exceptions.ValidationException):
+        b.validate(6)
+
+
 # Conversion
 
 def test_type_basic_conversion():
@@ -142,6 +177,22 @@ def test_type_validator_name_clash():
     assert validate('blabla') == 'last'
 
 
+def test_type_validator_marked_not_validator():
+    class TestType(types.Type):
+        def validate_many(self, value):
+            if value == 'many':
+                raise exceptions.ValidationException('too many')
+
+        @types.base.not_validator
+        def validate_later(self, value):
+            raise exceptions.ValidationException('not a validator')
+
+    assert list(TestType._validate_functions) == ['validate_many']
+    TestType().validate('one')
+    with pytest.raises(exceptions.ValidationException):
+        TestType().validate('many')
+
+
 def test_type_validation_calls_order():
     call_order = list()
 
@@ -0,0 +1,27 @@
+import uuid
+
+import pytest
+
+from typerighter import types
+from typerighter import exceptions
+
+
+# Validation
+
+def test_uuid_basic_validation():
+    e = types.UUIDType()
+
+    e.validate(types.Unset)
+    e.validate(uuid.uuid4().hex)
+    e.validate(uuid.uuid4().hex.upper())
+
+    for value in ["weeeeeee", uuid.uuid4().hex[:31], str(uuid.uuid4()),
+                  "z" * 32]:
+        with pytest.raises(exceptions.ValidationException):
+            e.validate(value)
+
+
+def test_uuid_regex_override():
+    e = types.UUIDType(regex=types.ids.REGEX_UUID4)
+
+    e.validate("z" * 32)
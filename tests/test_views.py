@@ -1,3 +1,5 @@
+import datetime
+
 import pytest
 
 from typerighter import types
@@ -127,3 +129,300 @@ def test_views_have_starting_types():
     # primitive is favored if both are True
     pnj = views.to_view(sr, data, primitive=True, native=True)
     assert isinstance(pnj.created_at, str)
+
+
+def test_view_classes_are_cached():
+    class SongRecord(types.Record):
+        name = types.StringType(required=True)
+
+    class AlbumRecord(types.Record):
+        name = types.StringType(required=True)
+
+    first = views.to_view(SongRecord(), {'name': 'pride & joy'})
+    second = SongRecord().to_view({'name': 'texas flood'})
+    album = views.to_view(AlbumRecord(), {'name': 'texas flood'})
+
+    assert type(first) is type(second)
+    assert type(first) is views.view_class(SongRecord())
+    assert type(first) is not type(album)
+    assert first.name == 'pride & joy'
+    assert second.name == 'texas flood'
+
+
+def test_views_nested_record_views_follow_data():
+    class MusicianRecord(types.Record):
+        name = types.StringType(required=True)
+
+    class SongRecord(types.Record):
+        name = types.StringType(required=True)
+        author = MusicianRecord()
+
+    sr = SongRecord()
+    srv = views.to_view(sr, {'name': 'a', 'author': {'name': 'stevie'}})
+    other = views.to_view(sr, {'name': 'b', 'author': {'name': 'jimmie'}})
+    missing = views.to_view(sr, {'name': 'c'})
+
+    assert srv.author.name == 'stevie'
+    assert other.author.name == 'jimmie'
+    assert missing.author is None
+
+    srv.author.name = 'stevie ray vaughn'
+    assert srv.to_primitive()['author'] == {'name': 'stevie ray vaughn'}
+
+
+def test_compact_views_match_views():
+    class MusicianRecord(types.Record):
+        name = types.StringType(required=True)
+
+    class SongRecord(types.Record):
+        name = types.StringType(required=True)
+        author = MusicianRecord()
+        track = types.IntegerType()
+
+    sr = SongRecord()
+    data = {'name': 'pride & joy', 'author': {'name': 'stevie ray vaughn'}}
+
+    srv = views.to_view(sr, data)
+    compact = views.to_view(sr, data, compact=True)
+
+    assert isinstance(compact, views.CompactView)
+    assert isinstance(compact, views.View)
+    assert type(compact).__dictoffset__ == 0
+
+    assert compact.name == srv.name
+    assert compact.author.name == srv.author.name
+    assert compact.track is None
+    assert list(compact) == list(srv)
+    assert compact.to_primitive() == srv.to_primitive()
+
+    compact.track = 2
+    assert compact.track == 2
+    assert compact.to_primitive()['track'] == 2
+
+    del compact.track
+    assert compact.track is None
+    with pytest.raises(KeyError):
+        del compact.track
+
+
+def test_compact_views_drop_unknown_data():
+    class SongRecord(types.Record):
+        name = types.StringType(required=True)
+
+    srv = views.to_view(
+        SongRecord(), {'name': 'pride & joy', 'extra': 1}, native=False,
+        compact=True
+    )
+
+    assert list(srv) == [('name', 'pride & joy')]
+
+
+def test_lazy_views_convert_fields_when_read():
+    conversions = list()
+
+    class CountingIntegerType(types.IntegerType):
+        def to_native(self, value):
+            conversions.append(value)
+            return super().to_native(value)
+
+    class ScoreRecord(types.Record):
+        a = CountingIntegerType()
+        b = CountingIntegerType()
+        c = CountingIntegerType(default=3)
+
+    srv = views.to_view(ScoreRecord(), {'a': '1', 'b': '2'}, lazy=True)
+
+    assert isinstance(srv, views.LazyView)
+    assert conversions == []
+
+    assert srv.a == 1
+    assert srv.a == 1
+    assert conversions == ['1']
+
+    assert srv.c == 3
+    assert conversions == ['1']
+
+    srv.b = 5
+    assert srv.b == 5
+    assert conversions == ['1']
+
+
+def test_lazy_views_write_back_untouched_fields():
+    class SongRecord(types.Record):
+        name = types.StringType()
+        created_at = types.DateTimeType()
+        track = types.IntegerType()
+
+    data = {
+        'name': 'pride & joy',
+        'created_at': '1983-06-13T00:00:00',
+        'track': '2',
+    }
+
+    srv = views.to_view(SongRecord(), data, lazy=True)
+    srv.name = 'texas flood'
+    del srv.track
+
+    assert srv.to_primitive() == {
+        'name': 'texas flood', 'created_at': '1983-06-13T00:00:00.000000'
+    }
+    assert srv.track is None
+    assert data['track'] == '2'
+
+
+def test_lazy_views_convert_untouched_fields_to_primitive():
+    class SongRecord(types.Record):
+        track = types.IntegerType()
+        created_at = types.DateTimeType()
+        flag = types.BooleanType()
+        name = types.StringType()
+        plays = types.IntegerType(default=5)
+
+    data = {
+        'track': '2',
+        'created_at': datetime.datetime(2020, 1, 1),
+        'flag': 'true',
+        'name': 'lenny',
+    }
+
+    lazy = views.to_view(SongRecord(), data, lazy=True)
+    eager = views.to_view(SongRecord(), data)
+
+    assert lazy.to_primitive() == eager.to_primitive()
+    assert lazy.to_primitive() == {
+        'track': 2,
+        'created_at': '2020-01-01T00:00:00.000000',
+        'flag': True,
+        'name': 'lenny',
+        'plays': 5,
+    }
+
+
+def test_lazy_views_match_views():
+    class MusicianRecord(types.Record):
+        name = types.StringType(required=True)
+
+    class SongRecord(types.Record):
+        name = types.StringType(required=True)
+        author = MusicianRecord()
+        track = types.IntegerType(default=1)
+
+    sr = SongRecord()
+    data = {'name': 'pride & joy', 'author': {'name': 'stevie ray vaughn'}}
+
+    srv = views.to_view(sr, data)
+    lazy = views.to_view(sr, data, lazy=True)
+
+    assert lazy.author.name == srv.author.name
+    assert sorted(lazy) == sorted(srv)
+    assert lazy.to_native() == srv.to_native()
+    assert lazy.to_primitive() == srv.to_primitive()
+    lazy.validate()
+
+    with pytest.raises(ValueError):
+        views.to_view(sr, data, lazy=True, compact=True)
+
+
+def test_views_track_changed_fields():
+    class MusicianRecord(types.Record):
+        name = types.StringType(required=True)
+
+    class SongRecord(types.Record):
+        name = types.StringType(required=True)
+        author = MusicianRecord()
+        track = types.IntegerType()
+        year = types.IntegerType()
+
+    for view_config in ({}, {'compact': True}, {'lazy': True}):
+        srv = views.to_view(SongRecord(), {
+            'name': 'pride & joy',
+            'author': {'name': 'stevie'},
+            'track': 2,
+        }, **view_config)
+
+        assert srv.changed_fields() == set()
+        assert srv.to_primitive(changed_only=True) == {}
+
+        srv.track = 3
+        srv.author.name = 'stevie ray vaughn'
+        del srv.name
+
+        assert srv.changed_fields() == {'track', 'author', 'name'}
+        assert srv.to_primitive(changed_only=True) == {
+            'track': 3, 'author': {'name': 'stevie ray vaughn'}
+        }
+
+
+def test_views_reuse_cached_primitive():
+    conversions = list()
+
+    class CountingIntegerType(types.IntegerType):
+        def to_primitive(self, value):
+            conversions.append(value)
+            return super().to_primitive(value)
+
+    class ScoreRecord(types.Record):
+        a = CountingIntegerType()
+        b = CountingIntegerType(default=7)
+        scores = types.ListType(types.IntegerType())
+
+    srv = views.to_view(ScoreRecord(), {'a': 1, 'b': 2, 'scores': [1]})
+
+    assert srv.to_primitive() == {'a': 1, 'b': 2, 'scores': [1]}
+    assert sorted(conversions) == [1, 2]
+
+    srv.a = 5
+    srv.scores.append(2)
+    assert srv.to_primitive() == {'a': 5, 'b': 2, 'scores': [1, 2]}
+    assert sorted(conversions) == [1, 2, 5]
+
+    del srv.b
+    assert srv.to_primitive() == {'a': 5, 'b': 7, 'scores': [1, 2]}
+
+
+def test_views_return_copies_of_cached_primitive():
+    class MusicianRecord(types.Record):
+        name = types.StringType(required=True)
+
+    class SongRecord(types.Record):
+        author = MusicianRecord()
+        tags = types.ListType(types.StringType())
+
+    srv = views.to_view(
+        SongRecord(), {'author': {'name': 'stevie'}, 'tags': ['blues']}
+    )
+
+    primitive = srv.to_primitive()
+    primitive['author']['name'] = 'x'
+    primitive['tags'].append('rock')
+
+    assert srv.to_primitive() == {
+        'author': {'name': 'stevie'}, 'tags': ['blues']
+    }
+    assert srv.author.name == 'stevie'
+
+
+def test_views_reconvert_fields_changed_in_place():
+    class MusicianRecord(types.Record):
+        name = types.StringType(required=True)
+        instruments = types.ListType(types.StringType())
+
+    class SongRecord(types.Record):
+        name = types.StringType()
+        author = MusicianRecord()
+        extra = types.Type()
+
+    srv = views.to_view(SongRecord(), {
+        'name': 'lenny',
+        'author': {'name': 'stevie', 'instruments': ['g']},
+        'extra': {'take': 1},
+    })
+    assert srv.to_primitive()['author']['instruments'] == ['g']
+
+    srv.author.instruments.append('drums')
+    srv._data['extra']['take'] = 2
+    assert srv.to_primitive() == {
+        'name': 'lenny',
+        'author': {'name': 'stevie', 'instruments': ['g', 'drums']},
+        'extra': {'take': 2},
+    }
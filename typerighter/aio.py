@@ -0,0 +1,210 @@
+"""
+Asyncio entry points for validating and converting large values without
+blocking the event loop. Records and lists are walked with their compiled
+plans, handing control back to the loop after every `yield_every` fields or
+items. Values bigger than `offload_size` can instead be sent to an executor.
+"""
+
+
+import asyncio
+
+from typerighter import exceptions
+from typerighter import plans
+from typerighter import types
+
+
+YIELD_EVERY = 100
+
+
+class Ticker(object):
+    """Counts the fields and items walked so far and says when it's time to
+    give control back to the event loop.
+    """
+    def __init__(self, every):
+        self.every = every
+        self.count = 0
+
+    def tick(self):
+        self.count += 1
+        if self.count >= self.every:
+            self.count = 0
+            return True
+        return False
+
+
+def estimate_size(value):
+    """A cheap estimate of how much work a value is: the number of entries in
+    it and in any containers directly inside it.
+    """
+    if isinstance(value, dict):
+        children = value.values()
+    elif isinstance(value, (list, tuple)):
+        children = value
+    else:
+        return 1
+
+    size = len(value)
+    for child in children:
+        if isinstance(child, (dict, list, tuple)):
+            size += len(child)
+    return size
+
+
+def _is_nested(plan):
+    return plan.validators is not None and plan.nested_convert
+
+
+async def _convert(plan, value, ticker):
+    """Converts a value the way `plan.convert` does, walking the fields of
+    records and the items of lists so the loop gets a turn along the way.
+    """
+    if not plan.nested_convert or plan.is_falsy(value):
+        return plan.convert(value)
+
+    if plan.fields is None:
+        if plan.type.is_simple(value):
+            return list(value)
+
+        item_plan = plan.type.type.compile()
+        native = []
+        for v in value:
+            native.append(await _convert(item_plan, v, ticker))
+            if ticker.tick():
+                await asyncio.sleep(0)
+        return native
+
+    native = {}
+    for field_name, field_plan in plan.fields:
+        if field_name in value:
+            native[field_name] = await _convert(
+                field_plan, value[field_name], ticker
+            )
+        else:
+            default = plans.field_default(field_plan.type)
+            if default is not types.Unset:
+                native[field_name] = default
+
+    if ticker.tick():
+        await asyncio.sleep(0)
+    return native
+
+
+async def _check_nested(plan, native, ticker):
+    """Does the work of the validator that `plan` replaced with the checks
+    of its fields or items.
+    """
+    if plan.is_falsy(native):
+        return
+
+    if plan.fields is not None:
+        for field_name, field_plan in plan.fields:
+            field_value = native.get(field_name, types.Unset)
+            await _check(field_plan, field_value, ticker)
+        if ticker.tick():
+            await asyncio.sleep(0)
+        return
+
+    if plan.type.is_simple(native):
+        return
+
+    item_plan = plan.type.type.compile()
+    item_errors = {}
+    for i, v in enumerate(native):
+        try:
+            await _check(item_plan, v, ticker)
+        except exceptions.ValidationException as e:
+            item_errors[i] = str(e)
+
+        if ticker.tick():
+            await asyncio.sleep(0)
+
+    if item_errors:
+        raise exceptions.ItemValidationException(item_errors)
+
+
+async def _run_validators(plan, native, ticker):
+    for name, check in plan.validators:
+        if name == plan.nested_check:
+            await _check_nested(plan, native, ticker)
+        else:
+            check(native)
+
+
+async def _check(plan, value, ticker):
+    """Checks a value that's already native, as `plan.check` does.
+    """
+    t = plan.type
+    if not _is_nested(plan) or plan.is_falsy(value):
+        return plan.check(value)
+    if t.strict and not t.is_type_match(value):
+        return plan.check(value)
+    await _run_validators(plan, value, ticker)
+
+
+async def _load(plan, value, ticker):
+    """Validates a value and returns its native form, as `plan.load` does.
+    """
+    t = plan.type
+    if not _is_nested(plan) or plan.is_falsy(value):
+        return plan.load(value)
+
+    if t.strict:
+        if not t.is_type_match(value):
+            return plan.load(value)
+        native = await _convert(plan, value, ticker)
+    else:
+        try:
+            native = await _convert(plan, value, ticker)
+        except Exception:
+            e_msg = plans.TYPE_MATCH_MSG.format(value)
+            raise exceptions.ValidationException(e_msg)
+
+    await _run_validators(plan, native, ticker)
+    return native
+
+
+async def _offload(func, value, executor):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, func, value)
+
+
+async def avalidate(
+    type_instance, value, yield_every=YIELD_EVERY, executor=None,
+    offload_size=None
+):
+    """Validates a value like `Type.validate`, without holding the event loop
+    for the whole walk.
+
+    :param Type type_instance: The type to validate with
+    :param object value: The value to validate
+    :param int yield_every: The number of fields or items between yields
+    :param executor: The executor used for offloading, or the loop's default
+    :param int offload_size: Values estimated bigger than this are validated
+        in `executor` instead of on the loop
+    """
+    if offload_size is not None and estimate_size(value) > offload_size:
+        return await _offload(type_instance.validate, value, executor)
+
+    plan = type_instance.compile()
+    await _load(plan, value, Ticker(yield_every))
+
+
+async def ato_native(
+    type_instance, value, yield_every=YIELD_EVERY, executor=None,
+    offload_size=None
+):
+    """Converts a value like `Type.to_native`, without holding the event loop
+    for the whole walk.
+
+    :param Type type_instance: The type to convert with
+    :param object value: The value to convert
+    :param int yield_every: The number of fields or items between yields
+    :param executor: The executor used for offloading, or the loop's default
+    :param int offload_size: Values estimated bigger than this are converted
+        in `executor` instead of on the loop
+    """
+    if offload_size is not None and estimate_size(value) > offload_size:
+        return await _offload(type_instance.to_native, value, executor)
+
+    plan = type_instance.compile()
+    return await _convert(plan, value, Ticker(yield_every))
@@ -0,0 +1,307 @@
+"""
+Vectorized validation and conversion for large arrays of numbers, like
+columns of sensor readings, using NumPy. NumPy is optional: it's only
+imported here, and using these functions without it raises a
+`ConfigException`.
+
+An array is checked the way `validate` checks each of its values, with
+`None` and `Unset` as missing values. A few things follow from NumPy's
+types instead of Python's:
+
+- `strict` types accept numeric arrays by dtype, so integer and boolean
+  arrays match `IntegerType` and float arrays match `FloatType`. Lists and
+  arrays of objects are checked the way `validate` checks them instead, as
+  NumPy would otherwise give all of their values one type.
+- Native integer arrays are 64 bit, so integers outside that range fail,
+  unless they're checked one value at a time.
+"""
+
+
+from typerighter import exceptions
+from typerighter import plans
+from typerighter import types
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+# The dtype of native arrays, by the native type of a number type
+NATIVE_DTYPES = {
+    int: 'int64',
+    float: 'float64',
+}
+
+# Floats at or beyond this size don't fit in a native integer array
+INT64_LIMIT = 2.0 ** 63
+
+# The dtype kinds a strict number type accepts, by its native type
+STRICT_KINDS = {
+    int: 'iub',
+    float: 'f',
+}
+
+
+def require_numpy():
+    if numpy is None:
+        err_msg = "NumPy is required for array validation"
+        raise exceptions.ConfigException(err_msg)
+
+
+def is_numeric_array(values):
+    """Checks for a NumPy array whose values all have one type, which
+    `strict` types check by dtype rather than one value at a time.
+    """
+    if numpy is None or not isinstance(values, numpy.ndarray):
+        return False
+    return values.dtype != object
+
+
+def indexes(positions):
+    """Returns a sequence of indexes as an array, like `validate_array`
+    does.
+    """
+    require_numpy()
+    return numpy.array(sorted(positions), dtype=numpy.intp)
+
+
+class Coerced(object):
+    """The result of converting an array to a number type's native dtype.
+    `native` holds the converted values, with zeroes in place of missing
+    and invalid values, `missing` and `unset` mark the values that were
+    `None` or `Unset` and `invalid` marks those that couldn't be converted.
+    """
+    def __init__(self, native, missing, unset, invalid):
+        self.native = native
+        self.missing = missing
+        self.unset = unset
+        self.invalid = invalid
+
+
+def _mask(values, predicate):
+    return numpy.fromiter(
+        (predicate(v) for v in values), dtype=bool, count=len(values)
+    )
+
+
+def as_array(values):
+    """Returns values as a NumPy array. Sequences that mix strings or
+    complex numbers with other values are kept as objects, so NumPy doesn't
+    give them all the type of one value, and they're checked one at a time.
+    """
+    array = numpy.asarray(values)
+    if array.dtype.kind in 'USc' and not isinstance(values, numpy.ndarray):
+        array = numpy.array(values, dtype=object)
+    return array
+
+
+def _check_dimensions(array):
+    if array.ndim != 1:
+        err_msg = "Arrays must have one dimension, not {}"
+        raise exceptions.TypeException(err_msg.format(array.ndim))
+
+
+def coerce(number_type, values):
+    """Converts values to the native dtype of a number type, marking the
+    values that are missing or can't be converted instead of raising.
+
+    :param Number number_type: The type of each value
+    :param values: A one-dimensional array or sequence of values
+    :return: a `Coerced`
+    """
+    require_numpy()
+
+    python_type = number_type.NATIVE
+    dtype = numpy.dtype(NATIVE_DTYPES[python_type])
+
+    array = as_array(values)
+    _check_dimensions(array)
+
+    size = len(array)
+    unset = numpy.zeros(size, dtype=bool)
+    missing = unset
+    if array.dtype == object:
+        unset = _mask(array, lambda v: v is types.Unset)
+        missing = unset | _mask(array, lambda v: v is None)
+
+    present = array
+    if missing.any():
+        present = array.copy()
+        present[missing] = 0
+
+    invalid = numpy.zeros(size, dtype=bool)
+    if present.dtype.kind == 'c':
+        # neither `int` nor `float` takes complex numbers
+        native = numpy.zeros(size, dtype=dtype)
+        invalid = ~missing
+        return Coerced(native, missing, unset, invalid)
+
+    try:
+        with numpy.errstate(invalid='ignore'):
+            native = present.astype(dtype)
+        # casting quietly turns floats that `int` refuses into integers
+        if python_type is int and present.dtype.kind == 'f':
+            invalid = ~numpy.isfinite(present) | (
+                numpy.abs(present) >= INT64_LIMIT
+            )
+    except (ValueError, TypeError, OverflowError):
+        # find the values that failed, one at a time
+        native = numpy.zeros(size, dtype=dtype)
+        for i, v in enumerate(present.tolist()):
+            if missing[i]:
+                continue
+            try:
+                native[i] = python_type(v)
+            except (ValueError, TypeError, OverflowError):
+                invalid[i] = True
+
+    native[invalid] = 0
+    return Coerced(native, missing, unset, invalid)
+
+
+def _type_mismatches(number_type, array, coerced):
+    """Marks the values a strict type refuses.
+    """
+    python_type = number_type.NATIVE
+    if array.dtype == object:
+        matches = _mask(array, lambda v: isinstance(v, python_type))
+        return ~(matches | coerced.missing)
+    if array.dtype.kind in STRICT_KINDS[python_type]:
+        return numpy.zeros(len(array), dtype=bool)
+    return ~coerced.missing
+
+
+def _vectorized_validators():
+    """Maps the validators this module checks in vectorized form to the
+    functions that do it.
+    """
+    return {
+        types.Primitive.validate_choices: _check_choices,
+        types.domains.RangeDomain.validate_min: _check_min,
+        types.domains.RangeDomain.validate_max: _check_max,
+    }
+
+
+def _check_choices(number_type, coerced):
+    choices = number_type.choices
+    if not choices:
+        return None
+
+    allowed = numpy.isin(coerced.native, list(choices))
+    failing = (~allowed & ~coerced.missing) | coerced.unset
+    if None not in choices:
+        failing |= coerced.missing
+    return failing
+
+
+def _check_min(number_type, coerced):
+    minimum = number_type.min
+    if not minimum:
+        return None
+
+    # `None` is refused when there's a minimum, while `Unset` is skipped
+    below = (coerced.native < minimum) & ~coerced.missing
+    return below | (coerced.missing & ~coerced.unset)
+
+
+def _check_max(number_type, coerced):
+    maximum = number_type.max
+    if not maximum:
+        return None
+    return (coerced.native > maximum) & ~coerced.missing
+
+
+def _failing_values(number_type, values):
+    """Marks the values that fail `validate`, checking one value at a time.
+    """
+    failing = numpy.zeros(len(values), dtype=bool)
+    for i, v in enumerate(values):
+        try:
+            number_type.validate(v)
+        except exceptions.ValidationException:
+            failing[i] = True
+    return failing
+
+
+def failing_mask(number_type, values):
+    """Returns a boolean array that's True for each value that would fail
+    the number type's `validate`.
+
+    :param Number number_type: The type of each value
+    :param values: A one-dimensional array or sequence of values
+    """
+    require_numpy()
+    array = as_array(values)
+    if number_type.strict and not is_numeric_array(values):
+        _check_dimensions(array)
+        return _failing_values(number_type, values)
+
+    coerced = coerce(number_type, array)
+
+    failing = coerced.invalid.copy()
+    if number_type.required:
+        failing |= coerced.unset
+    if number_type.strict:
+        failing |= _type_mismatches(number_type, array, coerced)
+
+    vectorized = _vectorized_validators()
+    python_values = None
+    for name, func in plans.active_validators(number_type):
+        check = vectorized.get(getattr(func, '__func__', func))
+        if check is not None:
+            mask = check(number_type, coerced)
+            if mask is not None:
+                failing |= mask
+            continue
+
+        # other validators are called one value at a time
+        if python_values is None:
+            python_values = [
+                None if coerced.missing[i] else v
+                for i, v in enumerate(coerced.native.tolist())
+            ]
+        for i, v in enumerate(python_values):
+            if failing[i]:
+                continue
+            if coerced.unset[i]:
+                v = types.Unset
+            try:
+                func(number_type, v)
+            except exceptions.ValidationException:
+                failing[i] = True
+
+    return failing
+
+
+def validate_array(number_type, values):
+    """Validates every value of an array against a number type, returning
+    the indexes of the values that fail as an array.
+
+    :param Number number_type: The type of each value
+    :param values: A one-dimensional array or sequence of values
+    """
+    require_numpy()
+    return numpy.flatnonzero(failing_mask(number_type, values))
+
+
+def to_native_array(number_type, values):
+    """Converts every value of an array to the number type's native dtype,
+    raising a `TypeException` that lists the indexes of any values that are
+    missing or can't be converted.
+
+    :param Number number_type: The type of each value
+    :param values: A one-dimensional array or sequence of values
+    """
+    require_numpy()
+    coerced = coerce(number_type, values)
+
+    failing = numpy.flatnonzero(coerced.invalid | coerced.missing)
+    if len(failing):
+        indexes = ', '.join(str(i) for i in failing[:10].tolist())
+        if len(failing) > 10:
+            indexes += ', ...'
+        err_msg = "Values could not be converted at indexes: {}"
+        raise exceptions.TypeException(err_msg.format(indexes))
+
+    return coerced.native
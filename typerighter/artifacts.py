@@ -0,0 +1,197 @@
+"""
+Artifacts are the things derived from type definitions at runtime. Only the
+code of the functions `codegen` generates for records is kept for now.
+Processes that define hundreds of records spend a noticeable part of their
+startup compiling that code, so it can optionally be kept on disk. Nothing
+is stored until `enable` is called, with a directory or with the directory
+named by the `TYPERIGHTER_CACHE_DIR` environment variable.
+
+Entries are keyed by the `schematics.fingerprint` of the source they were
+built from, so a changed definition never picks up a stale entry. Files are
+written with `marshal`, like `.pyc` files, and are named for the running
+interpreter, so only point the store at a directory you trust.
+"""
+
+
+import atexit
+import marshal
+import os
+import sys
+import tempfile
+import threading
+
+from typerighter import schematics
+
+
+CACHE_DIR_ENV = 'TYPERIGHTER_CACHE_DIR'
+
+# Artifact kinds, each stored in its own file
+CODE = 'code'
+
+
+class ArtifactStore(object):
+    """A store of artifacts in a directory. Each kind of artifact is read
+    from its file in full the first time it's needed, and new entries are
+    kept in memory until `save` writes them back.
+    """
+    def __init__(self, directory):
+        self.directory = directory
+        self._entries = {}
+        self._added = {}
+        self._lock = threading.Lock()
+
+    def path(self, kind):
+        """Returns the path of the file that holds one kind of artifact.
+        """
+        tag = sys.implementation.cache_tag or 'python'
+        return os.path.join(self.directory, '%s.%s.marshal' % (kind, tag))
+
+    def _read(self, kind):
+        try:
+            with open(self.path(kind), 'rb') as fh:
+                entries = marshal.load(fh)
+        except (OSError, EOFError, ValueError, TypeError):
+            return {}
+        if not isinstance(entries, dict):
+            return {}
+        return entries
+
+    def _load(self, kind):
+        entries = self._entries.get(kind)
+        if entries is None:
+            with self._lock:
+                entries = self._entries.get(kind)
+                if entries is None:
+                    entries = self._read(kind)
+                    self._entries[kind] = entries
+        return entries
+
+    def get(self, kind, key):
+        """Returns the artifact stored for a key, or `None`.
+
+        :param str kind: The kind of artifact
+        :param str key: The fingerprint of the artifact's source
+        """
+        return self._load(kind).get(key)
+
+    def put(self, kind, key, value):
+        """Adds an artifact, which is written to disk by the next `save`.
+
+        :param str kind: The kind of artifact
+        :param str key: The fingerprint of the artifact's source
+        :param value: Any value `marshal` can write
+        """
+        entries = self._load(kind)
+        with self._lock:
+            entries[key] = value
+            self._added.setdefault(kind, {})[key] = value
+
+    def save(self):
+        """Writes new artifacts to disk, merged with whatever is in the files
+        already, in case another process saved to them in the meantime.
+        Files are replaced whole, so readers never see a partial write.
+        """
+        with self._lock:
+            added, self._added = self._added, {}
+
+        if not added:
+            return
+
+        os.makedirs(self.directory, exist_ok=True)
+        for kind, new_entries in added.items():
+            entries = self._read(kind)
+            entries.update(new_entries)
+
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory)
+            try:
+                with os.fdopen(fd, 'wb') as fh:
+                    marshal.dump(entries, fh)
+                os.replace(tmp_path, self.path(kind))
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+
+    def clear(self):
+        """Forgets every artifact and removes the store's files.
+        """
+        with self._lock:
+            kinds = set(self._entries) | set(self._added)
+            self._entries = {}
+            self._added = {}
+
+        for kind in kinds | {CODE}:
+            try:
+                os.unlink(self.path(kind))
+            except FileNotFoundError:
+                pass
+
+
+_store = None
+_save_registered = False
+
+
+def enable(directory=None):
+    """Keeps generated code in `directory`, or in the directory named by
+    `TYPERIGHTER_CACHE_DIR` when no directory is given. New code is saved
+    when the process exits. Nothing is enabled when neither names one.
+
+    :param str directory: The directory to keep artifacts in
+    :return: the active `ArtifactStore`, or `None`
+    """
+    global _store, _save_registered
+
+    directory = directory or os.environ.get(CACHE_DIR_ENV)
+    if not directory:
+        return _store
+
+    if _store is not None:
+        _store.save()
+    _store = ArtifactStore(directory)
+
+    if not _save_registered:
+        atexit.register(save)
+        _save_registered = True
+    return _store
+
+
+def disable():
+    """Saves the active store's new artifacts and stops using it.
+    """
+    global _store
+
+    if _store is not None:
+        _store.save()
+    _store = None
+
+
+def active_store():
+    """Returns the active `ArtifactStore`, or `None` when there isn't one.
+    """
+    return _store
+
+
+def save():
+    """Writes the active store's new artifacts to disk.
+    """
+    if _store is not None:
+        _store.save()
+
+
+def compile_source(source, filename):
+    """Compiles the source of a module, taking the code from the active
+    store when it has been compiled before.
+
+    :param str source: The module's source
+    :param str filename: The filename code objects report
+    :return: a code object
+    """
+    store = active_store()
+    if store is None:
+        return compile(source, filename, 'exec')
+
+    key = schematics.fingerprint([filename, source])
+    code = store.get(CODE, key)
+    if code is None:
+        code = compile(source, filename, 'exec')
+        store.put(CODE, key, code)
+    return code
@@ -0,0 +1,228 @@
+"""
+Batch operations run one record across many values. The record's setup is
+done once for the whole batch, and failures are reported per row and field
+instead of being raised.
+"""
+
+
+from concurrent import futures
+import itertools
+
+from typerighter import cache
+from typerighter import exceptions
+from typerighter import plans
+from typerighter import schematics
+from typerighter import types
+
+
+RECORD_PATH = ''
+
+
+class BatchResult(object):
+    """The outcome of running a record across many values.
+
+    `values` holds one entry per input row, with `None` for the rows that
+    failed. `errors` is stored by column: it maps each field path, like
+    `albums.0.name`, to a dict of the rows that failed there and their lists
+    of error messages. Errors that concern a row as a whole are stored under
+    `RECORD_PATH`.
+    """
+    def __init__(self, values, errors):
+        self.values = values
+        self.errors = errors
+
+    def __len__(self):
+        return len(self.values)
+
+    def __iter__(self):
+        return iter(self.values)
+
+    @property
+    def is_valid(self):
+        """True when no row had an error.
+        """
+        return not self.errors
+
+    @property
+    def failed_rows(self):
+        """A sorted list of the indexes of every row with an error.
+        """
+        rows = set()
+        for field_errors in self.errors.values():
+            rows.update(field_errors)
+        return sorted(rows)
+
+    def row_errors(self, row):
+        """Returns a dict of field paths and error messages for one row.
+
+        :param int row: The index of the row
+        """
+        return {
+            field_name: field_errors[row]
+            for field_name, field_errors in self.errors.items()
+            if row in field_errors
+        }
+
+
+def _add_row_errors(errors, row, row_errors):
+    for path, messages in row_errors.items():
+        if path not in errors:
+            errors[path] = {}
+        errors[path][row] = messages
+
+
+def _gather(results):
+    natives = []
+    errors = {}
+    for row, (native, row_errors) in enumerate(results):
+        if row_errors:
+            natives.append(None)
+            _add_row_errors(errors, row, row_errors)
+        else:
+            natives.append(native)
+    return BatchResult(natives, errors)
+
+
+def _run_rows(run_row, values):
+    return _gather(run_row(value) for value in values)
+
+
+def row_loader(record):
+    """Builds a function that validates one row of a batch and returns a
+    tuple of the row's native value and a dict of its errors, which is empty
+    when it has none.
+
+    :param Record record: The record that defines each row
+    """
+    collect_load = record.compile().collect_load
+
+    def load_row(value):
+        row_errors = {}
+        native = collect_load(value, row_errors, RECORD_PATH)
+        return native, row_errors
+
+    return load_row
+
+
+def row_converter(record):
+    """Builds a function that converts one row of a batch to its native form
+    and returns a tuple of the native value and a dict of its errors, or
+    `None` when it has none.
+
+    :param Record record: The record that defines each row
+    """
+    plan = record.compile()
+
+    def convert_whole_row(value):
+        try:
+            return plan.convert(value), None
+        except Exception as e:
+            return None, {RECORD_PATH: [str(e)]}
+
+    if not plans.uses_method(record, 'to_native', types.Record):
+        return convert_whole_row
+
+    Unset = types.Unset
+
+    fields = [
+        (field_name, field_plan.convert, plans.field_default(field_plan.type))
+        for field_name, field_plan in plan.fields
+    ]
+
+    def convert_row(value):
+        if not isinstance(value, dict) or plan.is_falsy(value):
+            return convert_whole_row(value)
+
+        native = {}
+        row_errors = None
+        for field_name, convert, default in fields:
+            if field_name in value:
+                raw = value[field_name]
+                try:
+                    native[field_name] = convert(raw)
+                except Exception:
+                    row_errors = row_errors or {}
+                    e_msg = plans.TYPE_MATCH_MSG.format(raw)
+                    row_errors[field_name] = [e_msg]
+            elif default is not Unset:
+                native[field_name] = default
+
+        return native, row_errors
+
+    return convert_row
+
+
+# The row loader for the record a worker process was started with
+_worker_load_row = None
+
+
+def _init_worker(schematic):
+    global _worker_load_row
+    record = schematics.from_schematic(schematic)
+    _worker_load_row = row_loader(record)
+
+
+def _load_chunk(rows):
+    results = []
+    for value in rows:
+        native, row_errors = _worker_load_row(value)
+        if row_errors:
+            native = None
+        results.append((native, row_errors))
+    return results
+
+
+def _chunks(values, chunk_size):
+    values = iter(values)
+    while True:
+        chunk = list(itertools.islice(values, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _validate_in_workers(record, values, workers, chunk_size):
+    """Validates values in chunks across worker processes. Each worker
+    rebuilds the record from its schematic once, when it starts.
+    """
+    schematic = record.to_schematic()
+
+    type_name = schematic[0]
+    if cache.TypeCache().get(type_name) is not type(record):
+        err_msg = "Record cannot be rebuilt from its schematic: %s"
+        raise exceptions.UncachableException(err_msg % (type_name))
+
+    with futures.ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(schematic,)
+    ) as executor:
+        chunk_results = executor.map(_load_chunk, _chunks(values, chunk_size))
+        return _gather(itertools.chain.from_iterable(chunk_results))
+
+
+def validate_many(record, values, workers=None, chunk_size=1000):
+    """Validates every value in an iterable against a record.
+
+    With `workers` set, the values are split into chunks of `chunk_size` rows
+    and validated in that many processes. The record is sent to each process
+    as its schematic and rebuilt there from the `TypeCache`, so its class
+    must be defined when the workers start, eg. at the top of a module.
+
+    :param Record record: The record that defines each row
+    :param iterable values: The rows to validate
+    :param int workers: The number of worker processes to use
+    :param int chunk_size: The number of rows sent to a worker at a time
+    :return: a `BatchResult` with the native form of every valid row
+    """
+    if workers and workers > 1:
+        return _validate_in_workers(record, values, workers, chunk_size)
+    return _run_rows(row_loader(record), values)
+
+
+def to_native_many(record, values):
+    """Converts every value in an iterable to the record's native form.
+
+    :param Record record: The record that defines each row
+    :param iterable values: The rows to convert
+    :return: a `BatchResult` with the native form of every converted row
+    """
+    return _run_rows(row_converter(record), values)
@@ -1,11 +1,14 @@
+from collections import OrderedDict
 import inspect
+import re
+import threading
 
 from .exceptions import CacheMissException, UncachableException
 
 
 class CacheMeta(type):
     """A metaclass for turning objects into singletons. Intended for use only
-    with the `TypeCache`.
+    with the `TypeCache` and `PatternCache`.
     """
     _instances = {}
 
@@ -70,3 +73,68 @@ class TypeCache(object, metaclass=CacheMeta):
             return True
 
         return False
+
+
+class PatternCache(object, metaclass=CacheMeta):
+    """A store of compiled regular expressions, keyed by pattern and flags,
+    shared by every type instance. Types with large patterns, like the net
+    types, compile them once instead of once per instance.
+
+    The store is bounded, dropping the least recently used pattern when it
+    fills up, and it counts hits and misses.
+    """
+    MAX_SIZE = 256
+
+    def __init__(self):
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self.max_size = self.MAX_SIZE
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._cache)
+
+    def compile(self, pattern, flags=0):
+        """Returns the compiled form of a pattern, compiling it only if it
+        isn't already stored. Errors from `re.compile` are not cached.
+
+        :param str pattern: The regular expression
+        :param int flags: Any flags for `re.compile`
+        """
+        key = (pattern, flags)
+
+        with self._lock:
+            compiled = self._cache.get(key)
+            if compiled is not None:
+                self.hits += 1
+                self._cache.move_to_end(key)
+                return compiled
+            self.misses += 1
+
+        compiled = re.compile(pattern, flags)
+
+        with self._lock:
+            self._cache[key] = compiled
+            while len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+
+        return compiled
+
+    def stats(self):
+        """Returns a dict with the store's hits, misses, size and max size.
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': len(self._cache),
+            'max_size': self.max_size,
+        }
+
+    def clear(self):
+        """Empties the store and resets its counts.
+        """
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
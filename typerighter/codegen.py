@@ -0,0 +1,151 @@
+"""
+Code generation turns a record's conversion into a plain Python function, with
+one straight-line block per field, instead of walking the record's fields and
+filters on every call. A function is generated once for each record class,
+conversion method and set of field filters, and then cached on the class.
+When an `artifacts` store is enabled, the compiled code is kept on disk.
+"""
+
+
+from typerighter import artifacts
+from typerighter import plans
+from typerighter import types
+
+
+# The most functions kept for each record class, which bounds the number of
+# distinct field filters that are cached
+MAX_CONVERTERS = 128
+
+# Record methods that generated functions stand in for
+CONVERT_METHODS = ('to_native', 'to_primitive')
+
+# Record methods that, when overridden, change how conversion works
+CONVERT_HOOKS = ('_convert', '_filter', '_parse_field_list')
+
+
+def is_generated(record):
+    """Checks that a record's conversion can be replaced by a generated
+    function, which isn't the case when its class overrides any of the
+    methods conversion relies on, or when the instance has its own fields.
+    """
+    cls = type(record)
+    if record._fields is not cls._fields:
+        return False
+    for name in CONVERT_HOOKS:
+        if getattr(cls, name) is not getattr(types.Record, name):
+            return False
+    return True
+
+
+def _field_filters(fields):
+    """Returns a hashable key for a list of field filters, or `None` when
+    the filters can't be hashed.
+    """
+    if not fields:
+        return ()
+
+    key = tuple(fields)
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _source(record, method, fields):
+    """Writes the source of a conversion function and returns it, along with
+    the names it expects to find in its namespace.
+    """
+    top_level_fields, subfield_map = record._parse_field_list(fields)
+
+    namespace = {}
+    lines = ['def %s(value):' % method, '    converted = {}']
+
+    for index, (field_name, field_type) in enumerate(record):
+        if top_level_fields is not None and field_name not in top_level_fields:
+            continue
+
+        convert_name = 'convert_%d' % index
+        namespace[convert_name] = getattr(field_type, method)
+
+        key = repr(field_name)
+        subfields = subfield_map.get(field_name)
+        if subfields:
+            subfields_name = 'subfields_%d' % index
+            namespace[subfields_name] = subfields
+            call = '%s(value[%s], fields=%s)' % (
+                convert_name, key, subfields_name
+            )
+        else:
+            call = '%s(value[%s])' % (convert_name, key)
+
+        lines.append('    if %s in value:' % key)
+        lines.append('        converted[%s] = %s' % (key, call))
+
+        default = plans.field_default(field_type)
+        if default is not types.Unset:
+            default_name = 'default_%d' % index
+            namespace[default_name] = default
+            lines.append('    else:')
+            lines.append('        converted[%s] = %s' % (key, default_name))
+
+    lines.append('    return converted')
+    return '\n'.join(lines) + '\n', namespace
+
+
+def generate(record, method, fields=()):
+    """Generates a function that converts a record's values with `method`,
+    using only the fields picked by `fields`.
+
+    :param Record record: The record the function converts values for
+    :param str method: Either `to_native` or `to_primitive`
+    :param tuple fields: Field filters, as given to `Record.to_native`
+    :return: a function that takes a value and returns the converted dict
+    """
+    source, namespace = _source(record, method, fields)
+
+    filename = '<typerighter %s.%s>' % (type(record).__name__, method)
+    exec(artifacts.compile_source(source, filename), namespace)
+
+    converter = namespace[method]
+    converter.source = source
+    return converter
+
+
+def record_converter(record, method, fields=None, **convert_args):
+    """Returns the generated function for converting a record's values, with
+    `fields` as its field filters, or `None` when conversion has to take the
+    record's regular path.
+
+    :param Record record: The record to convert values for
+    :param str method: Either `to_native` or `to_primitive`
+    :param fields: Field filters, as given to `Record.to_native`
+    """
+    if convert_args or method not in CONVERT_METHODS:
+        return None
+
+    key = _field_filters(fields)
+    if key is None:
+        return None
+
+    cls = type(record)
+    converters = cls.__dict__.get('_converters')
+    if converters is None or record._fields is not cls._fields:
+        return None
+
+    # Records that can't be generated are cached as `False`
+    cache_key = (method, key)
+    converter = converters.get(cache_key)
+    if converter is not None:
+        try:
+            converters.move_to_end(cache_key)
+        except KeyError:
+            # dropped by another thread in the meantime
+            pass
+        return converter or None
+
+    converter = is_generated(record) and generate(record, method, key)
+    converters[cache_key] = converter
+    while len(converters) > MAX_CONVERTERS:
+        converters.popitem(last=False)
+    return converter or None
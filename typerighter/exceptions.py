@@ -18,6 +18,21 @@ class ValidationException(BaseException):
     pass
 
 
+class ItemValidationException(ValidationException):
+    """Raised when items of a list fail validation. `errors` maps the index
+    of each failing item to its error message.
+    """
+    MAX_INDEXES = 10
+
+    def __init__(self, errors):
+        indexes = [str(i) for i in list(errors)[:self.MAX_INDEXES]]
+        if len(errors) > self.MAX_INDEXES:
+            indexes.append('...')
+        err_msg = "Invalid items at indexes: {}"
+        super().__init__(err_msg.format(', '.join(indexes)))
+        self.errors = errors
+
+
 class ConfigException(BaseException):
     pass
 
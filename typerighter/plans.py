@@ -0,0 +1,615 @@
+"""
+A plan is a precomputed form of a type's validation. Building one walks the
+type once, including the fields of records and the items of lists, and keeps
+only the checks that can do work given the type's configuration.
+"""
+
+
+from typerighter import exceptions
+from typerighter import types
+
+
+REQUIRED_MSG = "Value required but not found"
+TYPE_MATCH_MSG = "Value doesnt match type format {}"
+
+
+class InvalidValue(object):
+    """This class marks a value that failed conversion while errors were
+    being collected.
+    """
+    pass
+
+
+Invalid = InvalidValue()
+
+
+def join_path(path, key):
+    """Extends a dotted field path, eg. `albums.0.name`, with one more key.
+    """
+    if path:
+        return '%s.%s' % (path, key)
+    return str(key)
+
+
+def add_error(errors, path, message):
+    """Appends a message to the list of errors stored for a path.
+    """
+    if path in errors:
+        errors[path].append(message)
+    else:
+        errors[path] = [message]
+
+
+def active_validators(type_instance):
+    """Lists the validators of a type that can do work with the instance's
+    configuration. Validators marked with `requires_config` are dropped when
+    any attribute they depend on is falsy.
+
+    :param Type type_instance: The type to inspect
+    :return: a list of `(name, function)` pairs, in validation order
+    """
+    active = []
+    for name, func in type_instance._validate_functions.items():
+        attr_names = getattr(func, 'requires_config', ())
+        if all(getattr(type_instance, a, None) for a in attr_names):
+            active.append((name, func))
+    return active
+
+
+def falsy_check(type_instance):
+    """Returns a function equivalent to the type's `is_falsy`, inlining the
+    base implementation when the type doesn't override it.
+    """
+    if type(type_instance).is_falsy is types.Type.is_falsy:
+        Unset = types.Unset
+        return lambda value: value is Unset or value is None
+    return type_instance.is_falsy
+
+
+def field_default(type_instance):
+    """Returns the value a record's conversion uses for a field that is
+    missing from its input, or `Unset` when the field is left out.
+    """
+    default = type_instance.default
+    if default is types.Unset or not default:
+        return types.Unset
+    return default
+
+
+def uses_method(type_instance, name, base_class):
+    """Checks that a type's class uses `base_class`'s implementation of a
+    method rather than an override.
+    """
+    return getattr(type(type_instance), name) is getattr(base_class, name)
+
+
+class Plan(object):
+    """A Plan holds the flattened checks for a single type instance. It
+    validates values with the same outcome as the type's `validate`, but
+    converts each value to its native form once and skips validators that
+    cannot fail.
+
+    Records and lists are compiled down into the plans of their fields and
+    items, so nested structures are converted in a single walk.
+
+    Types that override `validate` are treated as opaque and called as-is.
+
+    Plans for records list the plans of their fields as `fields`, in field
+    order, and every plan that compiled its validators lists them as
+    `validators`, pairing each validator's name with its compiled check.
+    When fields or items are converted and checked by their own plans,
+    `nested_convert` is True and `nested_check` names the validator that was
+    replaced.
+
+    Plans can also collect errors rather than raise them. The errors are
+    gathered in a dict that maps the dotted path of each failing value, like
+    `albums.0.name`, to a list of messages, with the root value at `''`.
+    """
+    def __init__(self, type_instance):
+        self.type = type_instance
+
+        self.fields = None
+        if isinstance(type_instance, types.Record):
+            self.fields = [
+                (field_name, field_type.compile())
+                for field_name, field_type in type_instance
+            ]
+
+        self.validators = None
+        self.nested_convert = False
+        self.nested_check = None
+        self.is_falsy = falsy_check(type_instance)
+        self.convert = self._build_convert()
+
+        if uses_method(type_instance, 'validate', types.Type):
+            self.run_validators = self._build_validators()
+            self.check = self._build_check()
+            self.load = self._build_load()
+            self.collect_load = self._build_collect_load()
+            self.collect_nested_load = self.collect_load
+            if type_instance.strict:
+                self.collect_nested_load = self._build_collect_load(
+                    nested=True
+                )
+        else:
+            self.check = type_instance.validate
+            self.load = self._build_opaque_load()
+            self.collect_load = self._build_opaque_collect_load()
+            self.collect_nested_load = self._build_opaque_collect_load(
+                nested=True
+            )
+
+    def validate(self, value):
+        """Validates a value, raising `ValidationException` for failures.
+
+        :param object value: The value to validate
+        """
+        self.load(value)
+
+    def collect(self, value):
+        """Validates a value without raising, checking as much of it as
+        possible.
+
+        :param object value: The value to validate
+        :return: a dict of field paths and error messages, empty when valid
+        """
+        errors = {}
+        self.collect_load(value, errors, '')
+        return errors
+
+    def _build_convert(self):
+        """Builds a function equivalent to the type's `to_native`.
+        """
+        t = self.type
+
+        if isinstance(t, types.Record):
+            if uses_method(t, 'to_native', types.Record):
+                self.nested_convert = True
+                return self._build_record_convert()
+        elif isinstance(t, types.ListType):
+            if uses_method(t, 'to_native', types.ListType):
+                self.nested_convert = True
+                return self._build_list_convert()
+
+        return t.to_native
+
+    def _apply_default(self, convert):
+        t = self.type
+        if t.default is types.Unset:
+            return convert
+
+        Unset = types.Unset
+        default = t.default
+
+        def convert_with_default(value):
+            if value is Unset:
+                return default
+            return convert(value)
+
+        return convert_with_default
+
+    def _build_record_convert(self):
+        Unset = types.Unset
+        is_falsy = self.is_falsy
+
+        converters = [
+            (field_name, field_plan.convert, field_default(field_plan.type))
+            for field_name, field_plan in self.fields
+        ]
+
+        def convert(value):
+            if is_falsy(value):
+                return value
+
+            native = {}
+            for field_name, field_convert, default in converters:
+                if field_name in value:
+                    native[field_name] = field_convert(value[field_name])
+                elif default is not Unset:
+                    native[field_name] = default
+            return native
+
+        return self._apply_default(convert)
+
+    def _build_list_convert(self):
+        is_falsy = self.is_falsy
+        is_simple = self.type.is_simple
+        item_convert = self.type.type.compile().convert
+
+        def convert(value):
+            if is_falsy(value):
+                return value
+            if is_simple(value):
+                return list(value)
+            return [item_convert(v) for v in value]
+
+        return self._apply_default(convert)
+
+    def _build_validators(self):
+        """Builds a function that runs every active validator on a native
+        value. The validators for record fields and list items are replaced
+        by the compiled checks of the nested types.
+        """
+        t = self.type
+
+        self.validators = []
+        for name, func in active_validators(t):
+            if func is types.Record.validate_fields:
+                check = self._build_fields_check()
+                self.nested_check = name
+            elif func is types.ListType.validate_items:
+                check = self._build_items_check()
+                self.nested_check = name
+            else:
+                check = self._bind_validator(func)
+            self.validators.append((name, check))
+
+        checks = [check for name, check in self.validators]
+
+        if not checks:
+            return lambda native: None
+        elif len(checks) == 1:
+            return checks[0]
+
+        def run_validators(native):
+            for check in checks:
+                check(native)
+
+        return run_validators
+
+    def _bind_validator(self, func):
+        t = self.type
+
+        def check(native):
+            func(t, native)
+
+        return check
+
+    def _build_fields_check(self):
+        Unset = types.Unset
+        is_falsy = self.is_falsy
+        field_checks = [
+            (field_name, field_plan.check)
+            for field_name, field_plan in self.fields
+        ]
+
+        def check_fields(native):
+            if is_falsy(native):
+                return
+            for field_name, field_check in field_checks:
+                if field_name in native:
+                    field_check(native[field_name])
+                else:
+                    field_check(Unset)
+
+        return check_fields
+
+    def _build_items_check(self):
+        is_falsy = self.is_falsy
+        is_simple = self.type.is_simple
+        item_check = self.type.type.compile().check
+        ValidationException = exceptions.ValidationException
+
+        def check_items(native):
+            if is_falsy(native) or is_simple(native):
+                return
+
+            item_errors = {}
+            for i, v in enumerate(native):
+                try:
+                    item_check(v)
+                except ValidationException as e:
+                    item_errors[i] = str(e)
+
+            if item_errors:
+                raise exceptions.ItemValidationException(item_errors)
+
+        return check_items
+
+    def _build_check(self):
+        """Builds a function that validates a value that is already in its
+        native form, as happens for the fields of a converted record.
+        """
+        t = self.type
+        Unset = types.Unset
+        ValidationException = exceptions.ValidationException
+
+        skip_falsy = t.SKIP_FALSY
+        required = t.required
+        strict = t.strict
+        is_falsy = self.is_falsy
+        is_type_match = t.is_type_match
+        to_native = t.to_native
+        run_validators = self.run_validators
+
+        def check(value):
+            falsy = is_falsy(value)
+            if falsy and skip_falsy:
+                return
+            if required and value is Unset:
+                raise ValidationException(REQUIRED_MSG)
+
+            if falsy:
+                value = to_native(value)
+            elif strict and not is_type_match(value):
+                raise ValidationException(TYPE_MATCH_MSG.format(value))
+            run_validators(value)
+
+        return check
+
+    def _build_load(self):
+        """Builds a function that validates a value and returns its native
+        form.
+        """
+        t = self.type
+        Unset = types.Unset
+        ValidationException = exceptions.ValidationException
+
+        skip_falsy = t.SKIP_FALSY
+        required = t.required
+        strict = t.strict
+        is_falsy = self.is_falsy
+        is_type_match = t.is_type_match
+        to_native = t.to_native
+        convert = self.convert
+        run_validators = self.run_validators
+
+        def load(value):
+            falsy = is_falsy(value)
+            if falsy and skip_falsy:
+                return to_native(value)
+            if required and value is Unset:
+                raise ValidationException(REQUIRED_MSG)
+
+            if falsy:
+                native = to_native(value)
+            elif strict:
+                if not is_type_match(value):
+                    e_msg = TYPE_MATCH_MSG.format(value)
+                    raise ValidationException(e_msg)
+                native = convert(value)
+            else:
+                try:
+                    native = convert(value)
+                except Exception:
+                    e_msg = TYPE_MATCH_MSG.format(value)
+                    raise ValidationException(e_msg)
+            run_validators(native)
+            return native
+
+        return load
+
+    def _build_opaque_load(self):
+        validate = self.type.validate
+        to_native = self.type.to_native
+
+        def load(value):
+            validate(value)
+            return to_native(value)
+
+        return load
+
+    def _build_opaque_collect_load(self, nested=False):
+        load = self.load
+        convert = self.convert
+        check = self.check
+
+        def collect_load(value, errors, path):
+            try:
+                return load(value)
+            except exceptions.BaseException as e:
+                add_error(errors, path, str(e))
+                return Invalid
+
+        def collect_nested_load(value, errors, path):
+            try:
+                native = convert(value)
+            except Exception:
+                add_error(errors, path, TYPE_MATCH_MSG.format(value))
+                return Invalid
+            try:
+                check(native)
+            except exceptions.BaseException as e:
+                add_error(errors, path, str(e))
+                return Invalid
+            return native
+
+        return collect_nested_load if nested else collect_load
+
+    def _collect_validator(self, func, partial=False):
+        """Wraps a validator so its error is added to `errors`. With
+        `partial`, the wrapper also takes whether some fields or items of
+        the value failed, in which case the value is missing those fields,
+        and errors other than typerighter's from the validator are ignored.
+        """
+        t = self.type
+
+        if not partial:
+            def collect(native, errors, path):
+                try:
+                    func(t, native)
+                except exceptions.BaseException as e:
+                    add_error(errors, path, str(e))
+
+            return collect
+
+        def collect_partial(native, errors, path, failed):
+            try:
+                func(t, native)
+            except exceptions.BaseException as e:
+                add_error(errors, path, str(e))
+            except Exception:
+                if not failed:
+                    raise
+
+        return collect_partial
+
+    def _build_collect_build(self):
+        """Builds a function that converts a record or list piece by piece,
+        loading each field or item with its own plan so every failure is
+        collected at its path. Returns `None` for other types.
+        """
+        t = self.type
+        validate_functions = t._validate_functions
+
+        if isinstance(t, types.Record):
+            if not uses_method(t, 'to_native', types.Record):
+                return None
+            if 'validate_fields' not in validate_functions:
+                return None
+            elif validate_functions['validate_fields'] is not (
+                types.Record.validate_fields
+            ):
+                return None
+            return self._build_collect_fields()
+
+        elif isinstance(t, types.ListType):
+            if not uses_method(t, 'to_native', types.ListType):
+                return None
+            if 'validate_items' not in validate_functions:
+                return None
+            elif validate_functions['validate_items'] is not (
+                types.ListType.validate_items
+            ):
+                return None
+            return self._build_collect_items()
+
+        return None
+
+    def _build_collect_fields(self):
+        Unset = types.Unset
+        fields = [
+            (
+                field_name, field_plan.collect_nested_load,
+                field_default(field_plan.type)
+            )
+            for field_name, field_plan in self.fields
+        ]
+
+        def collect_fields(value, errors, path):
+            native = {}
+            for field_name, load, default in fields:
+                if path:
+                    field_path = path + '.' + field_name
+                else:
+                    field_path = field_name
+
+                if field_name in value:
+                    field_value = load(value[field_name], errors, field_path)
+                    if field_value is not Invalid:
+                        native[field_name] = field_value
+                elif default is not Unset:
+                    load(default, errors, field_path)
+                    native[field_name] = default
+                else:
+                    load(Unset, errors, field_path)
+            return native
+
+        return collect_fields
+
+    def _build_collect_items(self):
+        is_simple = self.type.is_simple
+        item_load = self.type.type.compile().collect_nested_load
+
+        def collect_items(value, errors, path):
+            if is_simple(value):
+                return list(value)
+
+            # failing items keep their raw value, so the list keeps its
+            # length for the list's own validators
+            natives = []
+            for i, v in enumerate(value):
+                native = item_load(v, errors, join_path(path, i))
+                natives.append(v if native is Invalid else native)
+            return natives
+
+        return collect_items
+
+    def _build_collect_load(self, nested=False):
+        """Builds a function that validates a value and returns its native
+        form, adding errors to a dict instead of raising them. It returns
+        `Invalid` when the value could not be converted.
+
+        With `nested`, the function is for the fields of a record or the
+        items of a list, which `load` converts along with their container
+        before checking them, so `strict` is checked on the native value.
+        """
+        t = self.type
+        Unset = types.Unset
+
+        skip_falsy = t.SKIP_FALSY
+        required = t.required
+        strict = t.strict and not nested
+        strict_native = t.strict and nested
+        is_falsy = self.is_falsy
+        is_type_match = t.is_type_match
+        to_native = t.to_native
+        convert = self.convert
+
+        build = self._build_collect_build()
+        if isinstance(t, types.Record):
+            buildable = dict
+        else:
+            buildable = (list, tuple)
+
+        # `collectors` run on fully converted values, while `rest` skips the
+        # check for fields or items that `build` already did, and runs even
+        # when some of them failed
+        collectors = []
+        rest = []
+        for name, func in active_validators(t):
+            if build is not None and func in (
+                types.Record.validate_fields, types.ListType.validate_items
+            ):
+                collectors.append(self._collect_built(build))
+            else:
+                collectors.append(self._collect_validator(func))
+                rest.append(self._collect_validator(func, partial=True))
+
+        def collect_load(value, errors, path):
+            falsy = is_falsy(value)
+            if falsy and skip_falsy:
+                return to_native(value)
+            if required and value is Unset:
+                add_error(errors, path, REQUIRED_MSG)
+                return Invalid
+
+            if falsy:
+                native = to_native(value)
+            elif strict and not is_type_match(value):
+                add_error(errors, path, TYPE_MATCH_MSG.format(value))
+                return Invalid
+            elif build is not None and isinstance(value, buildable):
+                before = len(errors)
+                native = build(value, errors, path)
+                if strict_native and not is_type_match(native):
+                    add_error(errors, path, TYPE_MATCH_MSG.format(native))
+                    return Invalid
+                failed = len(errors) != before
+                for collector in rest:
+                    collector(native, errors, path, failed)
+                return native
+            else:
+                try:
+                    native = convert(value)
+                except Exception:
+                    add_error(errors, path, TYPE_MATCH_MSG.format(value))
+                    return Invalid
+                if strict_native and not is_type_match(native):
+                    add_error(errors, path, TYPE_MATCH_MSG.format(native))
+                    return Invalid
+
+            for collector in collectors:
+                collector(native, errors, path)
+            return native
+
+        return collect_load
+
+    def _collect_built(self, build):
+        is_falsy = self.is_falsy
+
+        def collect(native, errors, path):
+            if not is_falsy(native):
+                build(native, errors, path)
+
+        return collect
@@ -3,7 +3,12 @@
 
 
 from collections import OrderedDict
+import hashlib
 import inspect
+import json
+import re
+
+from . import cache
 
 
 def extract_argspec(klass):
@@ -23,46 +28,116 @@ def extract_argspec(klass):
     return argspec
 
 
-def init_arg_capture(method):
-    """A decorator that wraps a Type's `__init__` method for the purpose of
-    capturing the arguments used when a Type is instantiated so it can then
-    update the instance's argspec with what was actually used.
-    """
-    def wrapper(self, *a, **kw):
-        method(self, *a, **kw)
-
-        init_args = OrderedDict()
-        init_args.update(self._schematic._argspec)
-        for k, v in kw.items():
-            init_args[k] = v
-
-        self._schematic._init_args = init_args
-
-    return wrapper
-
-
 class Schematic(object):
     """A Schematic is a object that maintains a Type's argspec. It exists as a
     class to provide a namespace for relevant values.
+
+    The argspec is read from the class the first time it's needed, rather
+    than when the class is defined. Reading `_schematic` from a type
+    instance gives a schematic for the keyword arguments that instance was
+    created with, which `TypeMeta` records on the instance.
     """
     def __init__(self, klass):
         """Initialize a Schematic instance with a Typerighter Type instance.
 
         :param class klass:
         """
+        self._klass = klass
+        self._init_kwargs = None
+        self._cached_argspec = None
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+
+        bound = Schematic.__new__(Schematic)
+        bound._klass = self._klass
+        bound._init_kwargs = instance.__dict__.get('_init_kwargs')
+        bound._cached_argspec = None
+        return bound
+
+    @property
+    def _argspec(self):
+        """The keyword arguments of the class's `__init__` and those of its
+        base classes, with their default values.
+        """
+        schematic = self._klass.__dict__['_schematic']
+        argspec = schematic._cached_argspec
+        if argspec is not None:
+            return argspec
+
+        klass = self._klass
         argspec = OrderedDict()
 
-        # aggregate argspec from base classes
-        base_classes = inspect.getmro(klass)
-        for base in base_classes:
-            if hasattr(base, '_schematic'):
-                if hasattr(base._schematic, '_argspec'):
-                    argspec.update(base._schematic._argspec)
+        # aggregate argspec from base classes, nearest base last
+        for base in reversed(inspect.getmro(klass)[1:]):
+            base_schematic = base.__dict__.get('_schematic')
+            if isinstance(base_schematic, Schematic):
+                argspec.update(base_schematic._argspec)
 
         # add argspec
-        k_argspec = extract_argspec(klass)
-        argspec.update(k_argspec)
-        self._argspec = argspec
+        if '__init__' in klass.__dict__:
+            argspec.update(extract_argspec(klass))
+
+        schematic._cached_argspec = argspec
+        return argspec
 
-        # this decorator must be applied *after* argspec is read
-        klass.__init__ = init_arg_capture(klass.__init__)
+    @property
+    def _init_args(self):
+        """The argspec updated with the keyword arguments an instance was
+        created with.
+        """
+        init_args = OrderedDict(self._argspec)
+        if self._init_kwargs:
+            init_args.update(self._init_kwargs)
+        return init_args
+
+
+def from_schematic(schematic):
+    """Creates a type instance from the output of a type's `to_schematic`.
+    The type's class is found by name in the `TypeCache`.
+
+    :param tuple schematic: A class name and its init args
+    :return: a new instance of the named type
+    """
+    type_name, init_args = schematic
+    klass = cache.TypeCache().get(type_name)
+
+    if isinstance(init_args, dict):
+        return klass.from_init_args(init_args)
+
+    # variant schematics, as produced by `SumType`
+    return klass(*[from_schematic(s) for s in init_args])
+
+
+def _encode(value):
+    """Gives `json` a stable form for values it can't encode itself.
+    """
+    if isinstance(value, (tuple, set, frozenset)):
+        items = list(value)
+        return items if isinstance(value, tuple) else sorted(items, key=repr)
+    if isinstance(value, re.Pattern):
+        return ['re', value.pattern, value.flags]
+    if hasattr(value, 'fingerprint') and callable(value.fingerprint):
+        return ['fingerprint', value.fingerprint()]
+    if hasattr(value, '__qualname__'):
+        return ['ref', getattr(value, '__module__', None), value.__qualname__]
+    return ['repr', type(value).__name__, repr(value)]
+
+
+def fingerprint(data):
+    """Digests a schematic, or any structure built from schematics, into a
+    stable hex string. Structures that are equal, including dicts whose keys
+    are in a different order, have the same digest in every process.
+
+    Values that aren't plain data are digested by name when they're classes
+    or functions, and by `repr` otherwise, so such values are only stable if
+    their `repr` is.
+
+    :param object data: The structure to digest
+    :return: a sha256 hex digest
+    """
+    encoded = json.dumps(
+        data, sort_keys=True, separators=(',', ':'), default=_encode
+    )
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
@@ -0,0 +1,100 @@
+"""
+Streams validate rows one at a time as they're read, so large inputs never
+need to be held in memory. Every stream yields tuples of
+`(row_number, native, errors)`. For rows that failed, `native` is `None` and
+`errors` maps field paths to messages, as it does for `Record.validate_many`.
+"""
+
+
+import csv
+import json
+import os
+
+from typerighter import batches
+
+
+def _open(source, **open_kw):
+    """Opens `source` if it's a path. Returns the file and a flag for whether
+    the caller is responsible for closing it.
+    """
+    if isinstance(source, (str, bytes, os.PathLike)):
+        return open(source, **open_kw), True
+    return source, False
+
+
+def _row_result(row_number, load_row, value):
+    native, errors = load_row(value)
+    if errors:
+        native = None
+    return row_number, native, errors
+
+
+def validate_stream(record, rows, start=0):
+    """Validates each value from an iterable against a record, yielding the
+    results as they're produced.
+
+    :param Record record: The record that defines each row
+    :param iterable rows: The values to validate
+    :param int start: The number given to the first row
+    """
+    load_row = batches.row_loader(record)
+
+    for row_number, value in enumerate(rows, start):
+        yield _row_result(row_number, load_row, value)
+
+
+def validate_jsonl(record, source):
+    """Validates a JSON Lines file, which has one JSON object per line. Row
+    numbers are line numbers, starting at 1, and blank lines are skipped.
+
+    Lines that aren't valid JSON are reported as errors for the whole row.
+
+    :param Record record: The record that defines each row
+    :param source: A path or an open text file
+    """
+    load_row = batches.row_loader(record)
+    fh, owned = _open(source, mode='r')
+
+    try:
+        for line_number, line in enumerate(fh, 1):
+            if not line.strip():
+                continue
+
+            try:
+                value = json.loads(line)
+            except ValueError as e:
+                e_msg = "Invalid JSON: {}".format(e)
+                yield line_number, None, {batches.RECORD_PATH: [e_msg]}
+                continue
+
+            yield _row_result(line_number, load_row, value)
+    finally:
+        if owned:
+            fh.close()
+
+
+def validate_csv(record, source, **reader_kw):
+    """Validates a CSV file whose header row names the record's fields. Row
+    numbers are the line each row ends on, so the first row after the header
+    is usually 2.
+
+    Empty cells are treated as missing fields, letting defaults and `required`
+    apply to them.
+
+    :param Record record: The record that defines each row
+    :param source: A path or an open text file
+    :param reader_kw: Any keyword arguments for `csv.DictReader`
+    """
+    load_row = batches.row_loader(record)
+    fh, owned = _open(source, mode='r', newline='')
+
+    try:
+        reader = csv.DictReader(fh, **reader_kw)
+        for row in reader:
+            value = {
+                k: v for k, v in row.items() if v != '' and v is not None
+            }
+            yield _row_result(reader.line_num, load_row, value)
+    finally:
+        if owned:
+            fh.close()
@@ -23,7 +23,7 @@ from .records import (
 )
 
 from .composites import (
-    SumType, Container, ListType
+    SumType, TaggedUnionType, Container, ListType
 )
 
 from .net import (
@@ -35,6 +35,6 @@ __all__ = [
     Primitive, BooleanType, IntegerType, FloatType, StringType,
     DateTimeType, TimeType,
     RecordMeta, Record,
-    SumType, Container, ListType,
+    SumType, TaggedUnionType, Container, ListType,
     IPAddressType, IPv4Type, IPv6Type, MACAddressType, URLType, EmailType
 ]
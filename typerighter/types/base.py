@@ -1,7 +1,9 @@
 from collections import OrderedDict
 
+from .. import aio
 from .. import cache
 from .. import exceptions
+from .. import plans
 from .. import schematics
 
 
@@ -9,12 +11,47 @@ class UnsetValue(object):
     """This class exists to put a label on the type of value that represents
     when a field does not _yet_ have a value.
     """
-    pass
+    def __reduce__(self):
+        # unpickle as the module's singleton so identity checks still work
+        return 'Unset'
+
+    def __repr__(self):
+        return 'Unset'
 
 
 Unset = UnsetValue()
 
 
+def not_validator(method):
+    """A decorator that marks a method whose name starts with `validate_` as
+    something other than a validator, so it isn't collected as one.
+    """
+    method.not_validator = True
+    return method
+
+
+def is_validator(name, value):
+    """Checks if a class attribute should be collected as a validator.
+    """
+    if not (name.startswith('validate_') and callable(value)):
+        return False
+    return not getattr(value, 'not_validator', False)
+
+
+def type_attributes(bases, namespace):
+    """Collects the names of class attributes that hold type instances, from
+    a class's namespace and its bases. `Type.__setattr__` keeps instances
+    from overwriting them.
+    """
+    names = set()
+    for b in bases:
+        names.update(getattr(b, '_type_attributes', ()))
+    for k, v in namespace.items():
+        if isinstance(type(v), TypeMeta):
+            names.add(k)
+    return frozenset(names)
+
+
 class TypeMeta(type):
     def __new__(mcs, name, bases, namespace):
         # attribute accumulators
@@ -27,11 +64,12 @@ class TypeMeta(type):
 
         # gather typerighter attributes
         for k, v in namespace.items():
-            if k.startswith('validate_') and callable(v):
+            if is_validator(k, v):
                 validate_functions[k] = v
 
         # attach collected values
         namespace['_validate_functions'] = validate_functions
+        namespace['_type_attributes'] = type_attributes(bases, namespace)
 
         # create the new type
         type_class = type.__new__(mcs, name, bases, namespace)
@@ -45,6 +83,13 @@ class TypeMeta(type):
 
         return type_class
 
+    def __call__(cls, *a, **kw):
+        instance = super().__call__(*a, **kw)
+        # the keyword arguments a type was created with are kept for its
+        # schematic, set directly as `__setattr__` is overridden by types
+        instance.__dict__['_init_kwargs'] = kw
+        return instance
+
 
 def skip_falsy(method):
     """A decorator that intercepts method calls to prevent falsy inputs from
@@ -57,9 +102,21 @@ def skip_falsy(method):
     return wrapper
 
 
+def requires_config(*attr_names):
+    """A decorator that marks a validator as only doing work when every named
+    attribute is truthy on the type instance. Compiled plans use the mark to
+    drop validators that can never fail.
+    """
+    def decorator(method):
+        method.requires_config = attr_names
+        return method
+    return decorator
+
+
 class Type(object, metaclass=TypeMeta):
 
     NATIVE = object  # identity function
+    SKIP_FALSY = False  # validate falsy values as though they were valid
 
     def __init__(self, default=Unset, required=False, strict=False):
         """This class represents the top, and thus most ambiguous, point of the
@@ -118,7 +175,49 @@ class Type(object, metaclass=TypeMeta):
     def to_schematic(self):
         """Returns a Type's Schematic
         """
-        return (self.__class__.__name__, self._schematic.init_args)
+        return (self.__class__.__name__, self._schematic._init_args)
+
+    @classmethod
+    def from_init_args(cls, init_args):
+        """Creates an instance from the init args of a schematic. Types that
+        hold other types rebuild them from their schematics here.
+
+        :param dict init_args: The init args, as found in `to_schematic`
+        """
+        return cls(**init_args)
+
+    def _fingerprint_data(self):
+        """Returns the structure a Type's fingerprint is a digest of. Types
+        made of other types include their fingerprints here.
+        """
+        return self.to_schematic()
+
+    def fingerprint(self):
+        """Returns a stable digest of the Type's schematic, which is the same
+        for equal definitions in every process. It can serve as a cache key
+        for anything derived from the Type's definition.
+
+        The fingerprint is computed once and cached on the instance, so
+        configuration changes made after the first call are not reflected
+        in it.
+        """
+        digest = self.__dict__.get('_fingerprint')
+        if digest is None:
+            digest = schematics.fingerprint(self._fingerprint_data())
+            self._fingerprint = digest
+        return digest
+
+    def compile(self):
+        """Returns the `Plan` for this type, building it on first use.
+
+        The plan is cached on the instance, so configuration changes made
+        after the first call are not reflected in it.
+        """
+        plan = self.__dict__.get('_plan')
+        if plan is None:
+            plan = plans.Plan(self)
+            self._plan = plan
+        return plan
 
     def _apply_default(self, method):
         def wrapper(value, *a, **kw):
@@ -147,13 +246,24 @@ class Type(object, metaclass=TypeMeta):
 
         return value
 
-    def validate(self, value):
+    def validate(self, value, collect=False):
         """This validation function is the primary function responsible for
         calling all associated validators and for managing any details
         related to aggregation of validation results.
 
+        With `collect` set, errors are gathered instead of raised, and a dict
+        mapping the dotted path of each failing value to its error messages is
+        returned. An empty dict means the value is valid.
+
         :param object value: The value to convert
+        :param bool collect: Return every error instead of raising the first
         """
+        if collect:
+            return self.compile().collect(value)
+
+        if self.SKIP_FALSY and self.is_falsy(value):
+            return
+
         self._validate_required(value)
         self._validate_type_match(value)
 
@@ -162,6 +272,33 @@ class Type(object, metaclass=TypeMeta):
         for func in self._validate_functions.values():
             func(self, native)
 
+    def load(self, value):
+        """Validates a value and returns its native form, converting the
+        value only once. Raises the same exceptions as `validate`.
+
+        :param object value: The value to validate and convert
+        :return: the native form of the value
+        """
+        return self.compile().load(value)
+
+    async def avalidate(self, value, **aio_config):
+        """An asyncio version of `validate` that gives the event loop a turn
+        while walking large records and lists. See `typerighter.aio` for the
+        options.
+
+        :param object value: The value to validate
+        """
+        return await aio.avalidate(self, value, **aio_config)
+
+    async def ato_native(self, value, **aio_config):
+        """An asyncio version of `to_native` that gives the event loop a
+        turn while walking large records and lists. See `typerighter.aio` for
+        the options.
+
+        :param object value: The value to convert
+        """
+        return await aio.ato_native(self, value, **aio_config)
+
     def _validate_required(self, value):
         if self.required and value == Unset:
             e_msg = "Value required but not found"
@@ -180,7 +317,6 @@ class Type(object, metaclass=TypeMeta):
         """This method makes it impossible to overwrite any attributes
         that are subclasses of `Type`.
         """
-        propobj = getattr(self.__class__, name, None)
-        if propobj and isinstance(propobj, Type):
+        if name in self._type_attributes:
             return
         super().__setattr__(name, value)
@@ -1,6 +1,46 @@
+from collections import OrderedDict
+import datetime
+import uuid
+
+from . import base
 from . import primitives
 from . import domains
+from .. import arrays
 from .. import exceptions
+from .. import plans
+from .. import schematics
+
+
+# Item types that `ListType` can check in bulk, by the types of the items
+SIMPLE_ITEM_TYPES = frozenset([
+    primitives.IntegerType, primitives.FloatType, primitives.StringType,
+])
+
+# An empty last match for `SumType`, which no value is
+NO_MATCH = (object(), None, 0)
+
+# Values that `SumType` can remember its last match for, as they can't change
+# between lookups
+IMMUTABLE_TYPES = frozenset([
+    str, bytes, int, float, bool, complex, type(None), base.UnsetValue,
+    datetime.datetime, datetime.date, datetime.time, uuid.UUID,
+])
+
+
+class VariantStats(object):
+    """Counts for an adaptive `SumType`: the number of searches for a
+    variant, the number of variants tried across them, and how many times
+    each variant matched, by its position in `SumType.types`.
+
+    Counters are updated without a lock, so with threads they are close
+    estimates rather than exact counts.
+    """
+    __slots__ = ('lookups', 'trials', 'matches')
+
+    def __init__(self, size):
+        self.lookups = 0
+        self.trials = 0
+        self.matches = [0] * size
 
 
 class SumType(primitives.Primitive):
@@ -8,26 +48,170 @@ class SumType(primitives.Primitive):
     Some languages call this a *Union Type*. The idea is to allow validation
     to pass if just one validator, from a list of two or more types, accepts
     it.
+
+    Variants are tried in order and the first that accepts a value is used.
+    With `native_first` set, variants are looked up by the Python type of a
+    value first. The variants whose `NATIVE` type the value already has are
+    tried before the others, starting with those where it's an exact match,
+    and the rest are only tried, in order, when none of those accept the
+    value. This is faster, but a value more than one variant accepts may be
+    given to a later one, like `'5'` to a `StringType` listed after an
+    `IntegerType`.
+
+    With `adaptive` set, the type counts how often each variant matches, once
+    for each call to `validate`, `load`, `to_native` or `to_primitive`, and,
+    every `reorder_every` of them, tries the variants that match most often
+    first. A record's `validate` converts its fields more than once, so each
+    of its values is counted once per pass, for every variant alike.
+    Values that more than one variant accepts may then be given to a
+    different variant than the first in order.
     """
-    def __init__(self, *types, **kwargs):
+    REORDER_EVERY = 1000
+
+    def __init__(
+        self, *types, native_first=False, adaptive=False, reorder_every=None,
+        **kwargs
+    ):
         super(SumType, self).__init__(**kwargs)
         self.types = types
+        self.native_first = native_first
+        self.adaptive = adaptive
+        self.reorder_every = reorder_every or self.REORDER_EVERY
 
-    def _find_variant(self, value):
+        # the order variants are tried in, which adaptive types change
+        self._order = types
+        self._positions = {id(t): i for i, t in enumerate(types)}
+        self._stats = VariantStats(len(types))
+
+        # maps the Python types of values to the variants tried first
+        self._build_dispatch()
+
+        self._last_match = NO_MATCH
+
+    def _build_dispatch(self):
+        self._dispatch = {}
         for t in self.types:
-            try:
-                t.validate(value)
-                return t
-            except exceptions.ValidationException:
-                pass
+            self._native_variants(t.NATIVE)
+
+    def _native_variants(self, value_type):
+        """Returns the variants a value of `value_type` is already native to,
+        in trial order, with those whose `NATIVE` is exactly `value_type`
+        first.
+        """
+        variants = self._dispatch.get(value_type)
+        if variants is not None:
+            return variants
+
+        exact = []
+        inherited = []
+        for t in self._order:
+            if t.NATIVE is value_type:
+                exact.append(t)
+            elif t.NATIVE is not object and issubclass(value_type, t.NATIVE):
+                inherited.append(t)
+
+        variants = tuple(exact + inherited)
+        self._dispatch[value_type] = variants
+        return variants
+
+    def _accepts(self, t, value):
+        try:
+            t.validate(value)
+            return True
+        except exceptions.ValidationException:
+            return False
+
+    def _find_variant(self, value, count=False):
+        """Returns the variant for a value. With `count` set, an adaptive
+        type counts the search, which happens once for each call to
+        `to_native` or `to_primitive`, including the conversion `validate`
+        does.
+        """
+        variant, tried = self._search(value)
+        if count and self.adaptive:
+            self._count_match(variant, tried)
+        return variant
+
+    def _search(self, value):
+        """Finds the variant for a value, returning it along with the number
+        of variants tried.
+        """
+        # `validate` and `to_native` look up the same value in turn, so the
+        # last match is kept for values that can't be changed in between,
+        # along with the number of variants its search tried
+        last_value, last_variant, last_tried = self._last_match
+        if value is last_value:
+            return last_variant, last_tried
+
+        tried = 0
+        candidates = ()
+        if self.native_first:
+            candidates = self._native_variants(type(value))
+        for t in candidates:
+            tried += 1
+            if self._accepts(t, value):
+                variant = t
+                break
         else:
-            err_msg = "No matching variant for value: {}"
-            raise exceptions.TypeException(err_msg.format(value))
+            for t in self._order:
+                if t in candidates:
+                    continue
+                tried += 1
+                if self._accepts(t, value):
+                    variant = t
+                    break
+            else:
+                err_msg = "No matching variant for value: {}"
+                raise exceptions.TypeException(err_msg.format(value))
+
+        if type(value) not in IMMUTABLE_TYPES:
+            return variant, tried
+
+        # set directly, as `__setattr__` is overridden by types
+        self.__dict__['_last_match'] = (value, variant, tried)
+        return variant, tried
+
+    def _count_match(self, variant, tried):
+        stats = self._stats
+        stats.lookups += 1
+        stats.trials += tried
+        stats.matches[self._positions[id(variant)]] += 1
+
+        if stats.lookups % self.reorder_every == 0:
+            self.reorder()
+
+    def reorder(self):
+        """Puts the variants that have matched most often first in the trial
+        order. Variants with equal counts keep their order in `types`.
+        """
+        matches = list(self._stats.matches)
+        positions = sorted(range(len(self.types)), key=lambda i: -matches[i])
+        self._order = tuple(self.types[i] for i in positions)
+        self._build_dispatch()
+
+    def variant_stats(self):
+        """Returns the counts kept by an adaptive type: the number of
+        searches for a variant, the average number of variants tried per
+        search, and a list of variants in trial order, each as a dict with
+        its position in `types` and its number of matches.
+        """
+        stats = self._stats
+        lookups = stats.lookups
+        return {
+            'lookups': lookups,
+            'trials_per_lookup': stats.trials / lookups if lookups else 0.0,
+            'order': [
+                {
+                    'index': self._positions[id(t)],
+                    'variant': t,
+                    'matches': stats.matches[self._positions[id(t)]],
+                }
+                for t in self._order
+            ],
+        }
 
     def is_type_match(self, value):
         for t in self.types:
-            print(t.is_type_match(value))
-            print(isinstance(value, t.NATIVE))
             if t.is_type_match(value):
                 return True
         else:
@@ -40,21 +224,134 @@ class SumType(primitives.Primitive):
             variant_schematics.append(schematic)
         return (self.__class__.__name__, variant_schematics)
 
+    def _fingerprint_data(self):
+        return (
+            self.__class__.__name__, self._schematic._init_args,
+            [t.fingerprint() for t in self.types]
+        )
+
+    def is_coercible(self, value):
+        # like `Type.is_coercible`, without counting the search
+        if self.strict:
+            return self.is_type_match(value)
+        try:
+            self._find_variant(value).to_native(value)
+            return True
+        except Exception:
+            return False
+
     def to_primitive(self, value, **kw):
-        t = self._find_variant(value)
+        t = self._find_variant(value, count=True)
         return t.to_primitive(value, **kw)
 
     def to_native(self, value, **kw):
-        t = self._find_variant(value)
+        t = self._find_variant(value, count=True)
         return t.to_native(value, **kw)
 
     def validate_by_variant_match(self, value):
+        # the value was converted, and counted, just before this
         t = self._find_variant(value)
         if not t:
             e_msg = "Value did not pass any type checks: {}"
             raise exceptions.ValidationException(e_msg.format(value))
 
 
+class TaggedUnionType(primitives.Primitive):
+    """
+    A union of records, also called a *discriminated union*, where one field
+    of a value, the discriminator, holds a tag that names the record to use
+    for the rest of it. Finding the record is a single lookup, rather than
+    validating each record in turn as `SumType` does.
+
+    Every record must have the discriminator as one of its fields, so the tag
+    survives conversion.
+    """
+    NATIVE = dict
+
+    def __init__(self, discriminator, variants, **kwargs):
+        super().__init__(**kwargs)
+        self.discriminator = discriminator
+        self.variants = dict(variants)
+
+        for tag, record in self.variants.items():
+            if discriminator not in record._fields:
+                err_msg = "Variant for tag {} has no field: {}"
+                raise exceptions.TypeException(
+                    err_msg.format(tag, discriminator)
+                )
+
+    @classmethod
+    def from_init_args(cls, init_args):
+        init_args = dict(init_args)
+        init_args['variants'] = {
+            tag: schematics.from_schematic(schematic)
+            for tag, schematic in init_args['variants'].items()
+        }
+        return cls(**init_args)
+
+    def _find_variant(self, value):
+        try:
+            tag = value[self.discriminator]
+        except (KeyError, TypeError, IndexError):
+            err_msg = "Value has no tag in field {}: {}"
+            raise exceptions.TypeException(
+                err_msg.format(self.discriminator, value)
+            )
+
+        try:
+            return self.variants[tag]
+        except (KeyError, TypeError):
+            err_msg = "No variant for tag: {}"
+            raise exceptions.TypeException(err_msg.format(tag))
+
+    def is_type_match(self, value):
+        try:
+            t = self._find_variant(value)
+        except exceptions.TypeException:
+            return False
+        return t.is_type_match(value)
+
+    def to_schematic(self):
+        init_args = OrderedDict(self._schematic._init_args)
+        init_args['discriminator'] = self.discriminator
+        init_args['variants'] = {
+            tag: t.to_schematic() for tag, t in self.variants.items()
+        }
+        return (self.__class__.__name__, init_args)
+
+    def _fingerprint_data(self):
+        init_args = OrderedDict(self._schematic._init_args)
+        init_args['discriminator'] = self.discriminator
+        init_args['variants'] = sorted(
+            (repr(tag), t.fingerprint()) for tag, t in self.variants.items()
+        )
+        return (self.__class__.__name__, init_args)
+
+    def to_primitive(self, value, **kw):
+        if self.is_falsy(value):
+            return value
+        t = self._find_variant(value)
+        return t.to_primitive(value, **kw)
+
+    def to_native(self, value, **kw):
+        if self.is_falsy(value):
+            return value
+        t = self._find_variant(value)
+        return t.to_native(value, **kw)
+
+    def validate_variant(self, value):
+        if self.is_falsy(value):
+            return
+
+        try:
+            t = self._find_variant(value)
+        except exceptions.TypeException as te:
+            raise exceptions.ValidationException(*te.args)
+        # the value is already native, so the record's compiled check is
+        # enough to validate it
+        t.compile().check(value)
+
+
 class Container(primitives.Primitive):
     """
     A `Container` is a foundational type, like `Primitive`, that allows some
@@ -90,38 +387,149 @@ class Container(primitives.Primitive):
 class ListType(Container):
     """
     A `ListType` is a `Container` implemented with a `list`.
+
+    Every item is validated, and the indexes of failing items are reported
+    in an `ItemValidationException`. Lists of plain integers, floats or
+    strings, with no constraints on the items, are checked and converted in
+    bulk when every item already has the item type's native type.
     """
     NATIVE = list
 
+    @classmethod
+    def from_init_args(cls, init_args):
+        init_args = dict(init_args)
+        init_args['type'] = schematics.from_schematic(init_args['type'])
+        return cls(**init_args)
+
     def to_schematic(self):
-        variant_schematics = list()
-        for t in self.types:
-            schematic = t.to_schematic()
-            variant_schematics.append(schematic)
-        return (self.__class__.__name__, variant_schematics)
+        init_args = OrderedDict(self._schematic._init_args)
+        init_args['type'] = self.type.to_schematic()
+        return (self.__class__.__name__, init_args)
+
+    def _fingerprint_data(self):
+        init_args = OrderedDict(self._schematic._init_args)
+        init_args['type'] = self.type.fingerprint()
+        return (self.__class__.__name__, init_args)
+
+    def _simple_native(self):
+        """Returns the native type of the items when the item type is one of
+        `SIMPLE_ITEM_TYPES` with nothing to check beyond the type of a value,
+        or `None`.
+        """
+        t = self.type
+        if type(t) not in SIMPLE_ITEM_TYPES:
+            return None
+        if t.required or t.default is not base.Unset:
+            return None
+        if plans.active_validators(t):
+            return None
+        return t.NATIVE
+
+    def is_simple(self, value):
+        """Checks if a list can be handled in bulk, which is when the item
+        type is simple and every item has exactly its native type.
+
+        :param list value: The list to inspect
+        """
+        native = self._simple_native()
+        if native is None:
+            return False
+        return set(map(type, value)) <= {native}
 
     def to_primitive(self, value, **kw):
         if self.is_falsy(value):
             return value
+        if not kw and self.is_simple(value):
+            return list(value)
 
-        return [self.type.to_primitive(v, **kw) for v in value]
+        to_primitive = self.type.to_primitive
+        return [to_primitive(v, **kw) for v in value]
 
     def to_native(self, value, **kw):
         if self.is_falsy(value):
             return value
+        if not kw and self.is_simple(value):
+            return list(value)
+
+        to_native = self.type.to_native
+        return [to_native(v, **kw) for v in value]
 
-        return [self.type.to_native(v, **kw) for v in value]
+    def item_errors(self, value):
+        """Validates every item of a list that's already native, returning
+        a dict that maps the index of each failing item to its error message.
+
+        :param list value: The list to validate
+        """
+        if self.is_simple(value):
+            return {}
+
+        check = self.type.compile().check
+        errors = {}
+        for i, v in enumerate(value):
+            try:
+                check(v)
+            except exceptions.ValidationException as e:
+                errors[i] = str(e)
+        return errors
+
+    def _number_items(self):
+        if not isinstance(self.type, primitives.Number):
+            err_msg = "Arrays need a list of numbers, not {}"
+            raise exceptions.TypeException(
+                err_msg.format(self.type.__class__.__name__)
+            )
+        return self.type
+
+    @base.not_validator
+    def validate_array(self, values):
+        """Validates a list of numbers given as an array, checking the items
+        in vectorized form. Constraints on the list itself, like its length,
+        raise a `ValidationException`, and the indexes of items that fail
+        are returned as a NumPy array. Requires NumPy.
+
+        :param values: A one-dimensional array or sequence of numbers
+        """
+        item_type = self._number_items()
+        arrays.require_numpy()
+        if values is None or values is base.Unset:
+            self.validate(values)
+            return item_type.validate_array([])
+
+        if item_type.strict and not arrays.is_numeric_array(values):
+            # NumPy would give all the values one type, so lists are
+            # checked the way `validate` checks them
+            try:
+                self.validate(list(values))
+            except exceptions.ItemValidationException as e:
+                return arrays.indexes(e.errors)
+            return arrays.indexes(())
+
+        # checks on the list as a whole are given a plain list
+        checks = [
+            func for name, func in plans.active_validators(self)
+            if name != 'validate_items'
+        ]
+        if checks:
+            as_list = values.tolist() if hasattr(values, 'tolist') else (
+                list(values)
+            )
+            for func in checks:
+                func(self, as_list)
+
+        return item_type.validate_array(values)
+
+    def to_native_array(self, values):
+        """Converts a list of numbers to a NumPy array of the item type's
+        native type. Requires NumPy.
+
+        :param values: A one-dimensional array or sequence of numbers
+        """
+        return self._number_items().to_native_array(values)
 
     def validate_items(self, value):
         if self.is_falsy(value):
             return
 
-        for v in value:
-            try:
-                self.type.validate(v)
-                break
-            except exceptions.ValidationException:
-                pass
-        else:
-            e_msg = "No types in list match for item {}"
-            raise exceptions.ValidationException(e_msg.format(value))
+        errors = self.item_errors(value)
+        if errors:
+            raise exceptions.ItemValidationException(errors)
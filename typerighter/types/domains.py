@@ -1,5 +1,4 @@
-import re
-
+from typerighter import cache
 from typerighter import exceptions
 from . import base
 
@@ -13,10 +12,22 @@ def skip_falsy(method):
 
 
 class Domain:
+    # `(name, validator)` pairs for the domain's validators, found once for
+    # each domain class
+    _validators = ()
+
+    def __init_subclass__(cls, **kw):
+        super().__init_subclass__(**kw)
+        # domains keep their state on type instances, so one instance can
+        # provide the bound validators for every use of the class
+        shared = object.__new__(cls)
+        cls._validators = tuple(
+            (attr_name, getattr(shared, attr_name))
+            for attr_name in dir(cls) if attr_name.startswith("validate_")
+        )
+
     def __init__(self, instance):
-        for attr_name in (a for a in dir(self) if a.startswith("validate_")):
-            attr = getattr(self, attr_name)
-            instance._validate_functions[attr_name] = attr
+        instance._validate_functions.update(self._validators)
 
     def is_falsy(self, instance, value):
         return instance.is_falsy(value)
@@ -28,6 +39,7 @@ class RangeDomain(Domain):
         instance.min = min
         instance.max = max
 
+    @base.requires_config('min')
     def validate_min(self, instance, value):
         if not instance.min or value == base.Unset:
             return
@@ -44,6 +56,7 @@ class RangeDomain(Domain):
                 err_msg.format(value, instance.min)
             )
 
+    @base.requires_config('max')
     def validate_max(self, instance, value):
         if not instance.max or instance.is_falsy(value):
             return
@@ -61,6 +74,7 @@ class LengthDomain(Domain):
         instance.max_length = max_length
         instance.min_length = min_length
 
+    @base.requires_config('min_length')
     def validate_min_length(self, instance, value):
         if not instance.min_length or value == base.Unset:
             return
@@ -77,6 +91,7 @@ class LengthDomain(Domain):
                 err_msg.format(value, instance.min_length)
             )
 
+    @base.requires_config('max_length')
     def validate_max_length(self, instance, value):
         if not instance.max_length or instance.is_falsy(value):
             return
@@ -92,10 +107,13 @@ class RegexDomain(Domain):
     def __init__(self, instance, regex, *compile_args):
         super().__init__(instance)
         instance.regex = regex
+        instance._regex = None
 
         if instance.regex:
             try:
-                compiled = re.compile(instance.regex, *compile_args)
+                compiled = cache.PatternCache().compile(
+                    instance.regex, *compile_args
+                )
                 instance._regex = compiled
             except Exception:
                 err_msg = "Regex failed to compile: {}"
@@ -103,6 +121,7 @@ class RegexDomain(Domain):
                     err_msg.format(instance.regex)
                 )
 
+    @base.requires_config('regex')
     def validate_regex(self, instance, value):
         if instance.is_falsy(value):
             return
@@ -114,3 +133,26 @@ class RegexDomain(Domain):
             raise exceptions.ValidationException(
                 err_msg.format(instance.__class__.__name__, value)
             )
+
+
+class ParserDomain(Domain):
+    """Validates strings with a function that returns whether the string is
+    in the right format, for formats that are cheaper to scan by hand than to
+    match with a regex.
+    """
+    def __init__(self, instance, parser=None):
+        super().__init__(instance)
+        instance.parser = parser
+
+    @base.requires_config('parser')
+    def validate_parser(self, instance, value):
+        if not instance.parser or instance.is_falsy(value):
+            return
+        if not isinstance(value, str):
+            return
+
+        if not instance.parser(value):
+            err_msg = "{} rejected value: {}"
+            raise exceptions.ValidationException(
+                err_msg.format(instance.__class__.__name__, value)
+            )
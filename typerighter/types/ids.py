@@ -1,21 +1,26 @@
 import uuid
 import re
 
-from . import base
 from . import primitives
 from . import domains
 
 
 REGEX_UUID4 = '^[a-z0-9]{32}$'
 
+HEX_DIGITS = frozenset('0123456789abcdefABCDEF')
+
+
+def is_uuid(value):
+    """Returns whether a string is a UUID written as 32 hex digits.
+    """
+    return len(value) == 32 and HEX_DIGITS.issuperset(value)
+
 
 class UUIDType(primitives.Primitive):
     NATIVE = str
+    SKIP_FALSY = True
 
-    def __init__(self, regex=REGEX_UUID4, **kw):
+    def __init__(self, regex=None, **kw):
         super().__init__(**kw)
         domains.RegexDomain(self, regex, re.I + re.X)
-
-    @base.skip_falsy
-    def validate(self, value):
-        super().validate(value)
+        domains.ParserDomain(self, None if regex else is_uuid)
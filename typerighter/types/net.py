@@ -1,6 +1,6 @@
 import re
+import socket
 
-from . import base
 from . import primitives
 from . import domains
 
@@ -60,12 +60,12 @@ _URL_PCHAR = _URL_SUB_DELIMS | _URL_UNRESERVED | set('%:@')
 _URL_QUERY_EXTRAS = set('[]')  # nonstandard
 
 _URL_VALID_CHARS = _URL_ALL_DELIMS | _URL_UNRESERVED | set('%')
-_URL_VALID_CHAR_STRING = str.join('', _URL_VALID_CHARS)
+_URL_VALID_CHAR_STRING = str.join('', sorted(_URL_VALID_CHARS))
 _URL_UNSAFE_CHAR_STRING = '\x00-\x20<>{}|"`\\^\x7F-\x9F'
 
 
 def u(allowed_chars):
-    pattern = str.join('', _URL_VALID_CHARS - allowed_chars)
+    pattern = str.join('', sorted(_URL_VALID_CHARS - allowed_chars))
 
     pairs = [
         ('%', '%%'),
@@ -113,75 +113,127 @@ REGEX_EMAIL = r"""^(
     @((?!-)[A-Z0-9-]{1,63}(?<!-)\.)+[A-Z]{2,63})$""" % EMAIL_PATTERNS
 
 
+# Parsers
+#
+# These check the same formats as the patterns above without a regex, so
+# they run in linear time on any input. They are used by default.
+
+HEX_DIGITS = frozenset('0123456789abcdefABCDEF')
+
+
+def _is_address(family, value):
+    try:
+        socket.inet_pton(family, value)
+    except (OSError, ValueError):
+        return False
+    return True
+
+
+def is_ipv4(value):
+    """Returns whether a string is a dotted quad IPv4 address.
+    """
+    return _is_address(socket.AF_INET, value)
+
+
+def is_ipv6(value):
+    """Returns whether a string is an IPv6 address, including the compressed
+    `::` form and addresses ending in an IPv4 address.
+    """
+    return _is_address(socket.AF_INET6, value)
+
+
+def is_ip(value):
+    """Returns whether a string is either an IPv4 or an IPv6 address.
+    """
+    if ':' in value:
+        return is_ipv6(value)
+    return is_ipv4(value)
+
+
+def is_mac(value):
+    """Returns whether a string is a MAC address written as six pairs of hex
+    digits split by `-` or `:`, two groups of six split by `-` or `:`, three
+    groups of four split by `.`, or twelve hex digits.
+    """
+    size = len(value)
+
+    if size == 17:
+        sep = value[2]
+        if sep not in '-:' or value[2::3] != sep * 5:
+            return False
+        return HEX_DIGITS.issuperset(value.replace(sep, ''))
+
+    if size == 12:
+        return HEX_DIGITS.issuperset(value)
+
+    if size == 13:
+        if value[6] not in '-:':
+            return False
+        return HEX_DIGITS.issuperset(value[:6] + value[7:])
+
+    if size == 14:
+        if value[4::5] != '..':
+            return False
+        return HEX_DIGITS.issuperset(value.replace('.', ''))
+
+    return False
+
+
 # Types
 
 class IPAddressType(primitives.Primitive):
     NATIVE = str
+    SKIP_FALSY = True
 
-    def __init__(self, regex=REGEX_IP, **kw):
+    def __init__(self, regex=None, **kw):
         super().__init__(**kw)
         domains.RegexDomain(self, regex, re.I + re.X)
-
-    @base.skip_falsy
-    def validate(self, value):
-        super().validate(value)
+        domains.ParserDomain(self, None if regex else is_ip)
 
 
 class IPv4Type(primitives.Primitive):
     NATIVE = str
+    SKIP_FALSY = True
 
-    def __init__(self, regex=REGEX_IPV4, **kw):
+    def __init__(self, regex=None, **kw):
         super().__init__(**kw)
         domains.RegexDomain(self, regex, re.I + re.X)
-
-    @base.skip_falsy
-    def validate(self, value):
-        super().validate(value)
+        domains.ParserDomain(self, None if regex else is_ipv4)
 
 
 class IPv6Type(primitives.Primitive):
     NATIVE = str
+    SKIP_FALSY = True
 
-    def __init__(self, regex=REGEX_IPV6, **kw):
+    def __init__(self, regex=None, **kw):
         super().__init__(**kw)
         domains.RegexDomain(self, regex, re.I + re.X)
-
-    @base.skip_falsy
-    def validate(self, value):
-        super().validate(value)
+        domains.ParserDomain(self, None if regex else is_ipv6)
 
 
 class MACAddressType(primitives.Primitive):
     NATIVE = str
+    SKIP_FALSY = True
 
-    def __init__(self, regex=REGEX_MAC, **kw):
+    def __init__(self, regex=None, **kw):
         super().__init__(**kw)
         domains.RegexDomain(self, regex, re.I + re.X)
-
-    @base.skip_falsy
-    def validate(self, value):
-        super().validate(value)
+        domains.ParserDomain(self, None if regex else is_mac)
 
 
 class URLType(primitives.Primitive):
     NATIVE = str
+    SKIP_FALSY = True
 
     def __init__(self, regex=REGEX_URL, **kw):
         super().__init__(**kw)
         domains.RegexDomain(self, regex, re.I + re.X)
 
-    @base.skip_falsy
-    def validate(self, value):
-        super().validate(value)
-
 
 class EmailType(primitives.Primitive):
     NATIVE = str
+    SKIP_FALSY = True
 
     def __init__(self, regex=REGEX_EMAIL, **kw):
         super().__init__(**kw)
         domains.RegexDomain(self, regex, re.I + re.X)
-
-    @base.skip_falsy
-    def validate(self, value):
-        super().validate(value)
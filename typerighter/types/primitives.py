@@ -1,7 +1,7 @@
-import re
-
 from . import base
 from . import domains
+from .. import arrays
+from .. import cache
 from .. import exceptions
 
 
@@ -21,6 +21,7 @@ class Primitive(base.Type):
         super().__init__(**kw)
         self.choices = choices
 
+    @base.requires_config('choices')
     def validate_choices(self, value):
         """
         Checks if a choices list has been set and then if `value` is in that
@@ -86,7 +87,7 @@ class StringType(Primitive):
 
         if self.regex:
             try:
-                compiled = re.compile(self.regex)
+                compiled = cache.PatternCache().compile(self.regex)
                 self._regex = compiled
             except Exception:
                 err_msg = "Regex failed to compile: {}"
@@ -116,6 +117,7 @@ class StringType(Primitive):
                 err_msg.format(err_msg.format(value))
             )
 
+    @base.requires_config('regex')
     @base.skip_falsy
     def validate_regex(self, value):
         if self.regex and not self._regex.match(value):
@@ -134,6 +136,25 @@ class Number(Primitive):
         super().__init__(**kw)
         domains.RangeDomain(self, max, min)
 
+    @base.not_validator
+    def validate_array(self, values):
+        """Validates every value of an array in vectorized form, returning a
+        NumPy array of the indexes of values that fail. Requires NumPy. See
+        `typerighter.arrays` for details.
+
+        :param values: A one-dimensional array or sequence of values
+        """
+        return arrays.validate_array(self, values)
+
+    def to_native_array(self, values):
+        """Converts every value of an array to a NumPy array of the native
+        type, raising a `TypeException` if any values can't be converted.
+        Requires NumPy.
+
+        :param values: A one-dimensional array or sequence of values
+        """
+        return arrays.to_native_array(self, values)
+
 
 class IntegerType(Number):
     """
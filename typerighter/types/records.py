@@ -1,12 +1,45 @@
 
 from collections import OrderedDict
+import functools
+from types import MappingProxyType
 
 from . import base
+from .. import batches
 from .. import cache
+from .. import codegen
 from .. import schematics
 from .. import views
 
 
+@functools.lru_cache(maxsize=256)
+def parse_field_list(fields):
+    """Parses a tuple of field filters, as described by
+    `Record._parse_field_list`, into a frozenset of the top level fields and
+    a read-only map of each field's subfields. Results are cached, since the
+    same few filters tend to be used over and over.
+
+    :param tuple fields: The field filters, eg. `('name', 'hobby.name')`
+    """
+    subfield_map = {}
+
+    for f in fields:
+        record_path = f.split(".")
+        x, xs = record_path[0], '.'.join(record_path[1:])
+        if len(xs) > 0:
+            if x not in subfield_map:
+                subfield_map[x] = []
+            subfield_map[x].append(xs)
+        else:
+            subfield_map[x] = None
+
+    subfield_map = {
+        k: tuple(v) if v is not None else None
+        for k, v in subfield_map.items()
+    }
+    top_level_fields = frozenset(subfield_map) or None
+    return (top_level_fields, MappingProxyType(subfield_map))
+
+
 class RecordMeta(base.TypeMeta):
     def __new__(mcs, name, bases, namespace):
         # attribute accumulators
@@ -37,13 +70,18 @@ class RecordMeta(base.TypeMeta):
                 field_functions[field_name] = v
 
             # collect validation functions
-            elif k.startswith('validate_') and callable(v):
+            elif base.is_validator(k, v):
                 validate_functions[k] = v
 
         # attach collected values
         namespace['_fields'] = fields
         namespace['_field_functions'] = field_functions
         namespace['_validate_functions'] = validate_functions
+        namespace['_type_attributes'] = base.type_attributes(
+            bases, namespace
+        )
+        # the functions `codegen` generates for the class, oldest first
+        namespace['_converters'] = OrderedDict()
 
         # create the new type
         type_class = type.__new__(mcs, name, bases, namespace)
@@ -101,32 +139,19 @@ class Record(base.Type, metaclass=RecordMeta):
 
         Would return a structure like this:
 
-          {'name': None, 'hobby': ['name', 'started_at']}
+          {'name': None, 'hobby': ('name', 'started_at')}
 
         The caller can then look for the name field when it works on the nested
         record named ``hobby``.
 
         The values are intended to be passed directly into the conversion
         function, including ``None``, which indicates no filtering is used.
+        Parsed filters are cached and shared, so they must not be modified.
         """
-        subfield_map = {}
-
         if not fields:
-            return (None, subfield_map)
-
-        if fields:
-            for f in fields:
-                record_path = f.split(".")
-                x, xs = record_path[0], '.'.join(record_path[1:])
-                if len(xs) > 0:
-                    if x not in subfield_map:
-                        subfield_map[x] = []
-                    subfield_map[x].append(xs)
-                else:
-                    subfield_map[x] = None
+            return (None, {})
 
-        top_level_fields = subfield_map.keys() or None
-        return (top_level_fields, subfield_map)
+        return parse_field_list(tuple(fields))
 
     def _convert(self, value, converter, fields=None):
         """
@@ -152,6 +177,12 @@ class Record(base.Type, metaclass=RecordMeta):
 
     @base.skip_falsy
     def to_primitive(self, value, **convert_args):
+        generated = codegen.record_converter(
+            self, 'to_primitive', **convert_args
+        )
+        if generated is not None:
+            return generated(value)
+
         converter = lambda value, ti, **kw: ti.to_primitive(value, **kw)
         return {
             k: v for k, v in self._convert(value, converter, **convert_args)
@@ -159,11 +190,40 @@ class Record(base.Type, metaclass=RecordMeta):
 
     @base.skip_falsy
     def to_native(self, value, **convert_args):
+        generated = codegen.record_converter(self, 'to_native', **convert_args)
+        if generated is not None:
+            return generated(value)
+
         converter = lambda value, ti, **kw: ti.to_native(value, **kw)
         return {
             k: v for k, v in self._convert(value, converter, **convert_args)
         }
 
+    @base.not_validator
+    def validate_many(self, values, workers=None, chunk_size=1000):
+        """Validates many values against this record without raising,
+        returning a `BatchResult` with errors reported per row and field.
+
+        Setting `workers` spreads the rows across that many processes.
+        """
+        return batches.validate_many(
+            self, values, workers=workers, chunk_size=chunk_size
+        )
+
+    def to_native_many(self, values):
+        """Converts many values to this record's native form without
+        raising, returning a `BatchResult` with errors reported per row and
+        field.
+        """
+        return batches.to_native_many(self, values)
+
+    def _fingerprint_data(self):
+        fields = [
+            (field_name, field_type.fingerprint())
+            for field_name, field_type in self
+        ]
+        return (super()._fingerprint_data(), fields)
+
     def to_view(self, data=None, **view_config):
         return views.to_view(self, data=data, **view_config)
 
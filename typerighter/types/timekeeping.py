@@ -21,18 +21,73 @@ REGEX_FROM_TIME = r"""(?P<hour>\d\d):(?P<minute>\d\d)
     (?::(?P<second>\d\d)(?:(?:\.|,)(?P<sec_frac>\d{1,6}))?)?$"""
 
 
+# Parsers
+
+DIGITS = frozenset('0123456789')
+TZD_SIGNS = '+-\u2212'
+
+
+def parse_iso8601(value, native=datetime.datetime):
+    """Parses the common `YYYY-MM-DDTHH:MM:SS[.ffffff][Z|+HH:MM]` shape of an
+    ISO 8601 string, giving the same result as matching it with
+    `REGEX_FROM_ISO8601`. The string's shape is checked by slicing and then
+    handed to `fromisoformat` in a form every Python version accepts.
+
+    Returns `None` for any other shape, or when `fromisoformat` rejects the
+    string, so the caller can fall back to the pattern.
+
+    :param str value: The string to parse
+    :param type native: The datetime class to build
+    """
+    if len(value) < 19 or value[10] not in 'T ':
+        return None
+    if value[4:8:3] != '--' or value[13:17:3] != '::':
+        return None
+
+    # Split what follows the seconds into a fraction and a timezone
+    rest = value[19:]
+    tzd = ''
+    if rest.endswith('Z'):
+        rest, tzd = rest[:-1], '+00:00'
+    elif len(rest) >= 6 and rest[-6] in TZD_SIGNS:
+        rest, tzd = rest[:-6], rest[-6:]
+        if tzd[3] != ':':
+            return None
+        if tzd[0] != '+':
+            tzd = '-' + tzd[1:]
+
+    # Older versions of `fromisoformat` need exactly six fraction digits
+    if rest:
+        if rest[0] != '.' or not 1 < len(rest) < 8:
+            return None
+        rest = rest.ljust(7, '0')
+
+    digits = ''.join((
+        value[:4], value[5:7], value[8:10], value[11:13], value[14:16],
+        value[17:19], rest[1:], tzd[1:3], tzd[4:]
+    ))
+    if not DIGITS.issuperset(digits):
+        return None
+
+    try:
+        return native.fromisoformat(value[:19] + rest + tzd)
+    except ValueError:
+        return None
+
+
 # Types
 
 class DateTimeType(primitives.Primitive):
     NATIVE = datetime.datetime
+    SKIP_FALSY = True
 
     def __init__(self, regex=REGEX_FROM_ISO8601, **kw):
         super().__init__(**kw)
         domains.RegexDomain(self, regex, re.X)
-
-    @base.skip_falsy
-    def validate(self, value):
-        super().validate(value)
+        # Slicing only stands in for the default pattern
+        self._parse_fast = regex == REGEX_FROM_ISO8601
+        if not hasattr(self.NATIVE, 'fromisoformat'):
+            self._parse_fast = False
 
     @base.skip_falsy
     def to_native(self, value):
@@ -43,6 +98,11 @@ class DateTimeType(primitives.Primitive):
             e_msg = "Value is not a string: {}"
             raise exceptions.TypeException(e_msg.format(value))
 
+        if self._parse_fast:
+            native = parse_iso8601(value, self.NATIVE)
+            if native is not None:
+                return native
+
         # Verify regex
         match = self._regex.match(value)
         if not match:
@@ -91,15 +151,12 @@ class DateTimeType(primitives.Primitive):
 
 class TimeType(primitives.Primitive):
     NATIVE = datetime.time
+    SKIP_FALSY = True
 
     def __init__(self, regex=REGEX_FROM_TIME, **kw):
         super().__init__(**kw)
         domains.RegexDomain(self, regex, re.X)
 
-    @base.skip_falsy
-    def validate(self, value):
-        super().validate(value)
-
     @base.skip_falsy
     def to_native(self, value):
         if isinstance(value, self.NATIVE):
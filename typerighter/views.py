@@ -1,3 +1,5 @@
+import weakref
+
 from typerighter import types
 
 
@@ -16,9 +18,63 @@ class Field(object):
 
     def __set__(self, instance, value):
         instance._data[self.name] = value
+        instance._mark_changed(self.name)
 
     def __delete__(self, instance):
         del instance._data[self.name]
+        instance._mark_changed(self.name)
+
+
+class SlotField(Field):
+    """A `Field` for compact views, which keep each field's value in a slot
+    instead of a dict.
+    """
+    def __init__(self, name):
+        super().__init__(name)
+        self.slot = slot_name(name)
+
+    def __get__(self, instance, cls):
+        return getattr(instance, self.slot, None)
+
+    def __set__(self, instance, value):
+        setattr(instance, self.slot, value)
+        instance._mark_changed(self.name)
+
+    def __delete__(self, instance):
+        try:
+            delattr(instance, self.slot)
+        except AttributeError:
+            raise KeyError(self.name)
+        instance._mark_changed(self.name)
+
+
+def _nested_view(instance, name, value):
+    if value is None or value is types.Unset:
+        return None
+
+    record = instance._record._fields[name]
+    view = view_class(record)(record, data=value, native=False)
+
+    # Changes to the nested view are changes to the parent's field too
+    view._parent = (instance, name)
+    return view
+
+
+class RecordField(Field):
+    """A `Field` for a nested record. Reading it returns a view of the nested
+    data, which is shared with the parent view's data.
+    """
+    def __get__(self, instance, cls):
+        value = super().__get__(instance, cls)
+        return _nested_view(instance, self.name, value)
+
+
+class SlotRecordField(SlotField):
+    """A `SlotField` for a nested record, which reads like a `RecordField`.
+    """
+    def __get__(self, instance, cls):
+        value = super().__get__(instance, cls)
+        return _nested_view(instance, self.name, value)
 
 
 class View(object):
@@ -26,9 +82,19 @@ class View(object):
     modeled after the record that can store data in a familiar object oriented
     manner.
     """
+    __slots__ = (
+        '_record', '_config', '_data', '_parent', '_changed', '_stale',
+        '_primitive'
+    )
+
+    # Names of the record's fields whose native values can change in place,
+    # like lists and nested records, set on each generated class
+    _mutable_fields = frozenset()
+
     def __init__(self, record, data=None, native=True, primitive=False):
         self._record = record
         self._config = {}
+        self._reset_changes()
 
         if primitive:
             self._config['primitive'] = True
@@ -39,11 +105,78 @@ class View(object):
         else:
             self._data = data
 
-    def to_primitive(self, **convert_args):
+    def _reset_changes(self):
+        self._parent = None
+        self._changed = None
+        self._stale = None
+        self._primitive = None
+
+    def _mark_changed(self, field_name):
+        if self._changed is None:
+            self._changed = set()
+        self._changed.add(field_name)
+
+        if self._primitive is not None:
+            self._stale.add(field_name)
+
+        if self._parent is not None:
+            parent, parent_field = self._parent
+            parent._mark_changed(parent_field)
+
+    def changed_fields(self):
         """
-        Uses the record's ``to_primitive`` to convert view data.
+        Returns a set of the names of the fields that were set or deleted
+        since the view was loaded. Changes made inside a field's value, like
+        appending to a list, aren't tracked.
         """
-        return self._record.to_primitive(self._data, **convert_args)
+        return set(self._changed or ())
+
+    def _cached_primitive(self):
+        cache = self._primitive
+        if cache is None:
+            cache = self._record.to_primitive(self._data)
+            self._primitive = cache
+            self._stale = set()
+            return cache
+
+        # Only the fields that changed since the cache was built need work,
+        # along with those whose values can change in place
+        stale = self._stale | self._mutable_fields
+        if stale:
+            data = self._data
+            fresh = self._record.to_primitive(
+                {k: data[k] for k in stale if k in data}
+            )
+            for field_name in stale:
+                if field_name in fresh:
+                    cache[field_name] = fresh[field_name]
+                else:
+                    cache.pop(field_name, None)
+            self._stale.clear()
+
+        return cache
+
+    def to_primitive(self, changed_only=False, **convert_args):
+        """
+        Uses the record's ``to_primitive`` to convert view data. The result
+        is cached, so later calls only convert the fields that were set
+        since, along with fields like lists and records, whose values can
+        change in place.
+
+        With ``changed_only``, only fields that were set since the view was
+        loaded are converted and included.
+        """
+        if changed_only:
+            changed = self._changed or ()
+            data = self._data
+            primitive = self._record.to_primitive(
+                {k: data[k] for k in changed if k in data}, **convert_args
+            )
+            return {k: v for k, v in primitive.items() if k in changed}
+
+        if convert_args:
+            return self._record.to_primitive(self._data, **convert_args)
+        return dict(self._cached_primitive())
 
     def to_native(self, **convert_args):
         """
@@ -67,24 +200,203 @@ class View(object):
             return getattr(self._record, name)
 
 
-def to_view(record, data=None, **view_config):
-    """Takes both a record and some data and produces View instance.
+def slot_name(field_name):
+    """Returns the name of the slot a compact view keeps a field in.
+    """
+    return '_field_' + field_name
 
-    :param Type record: The type that defines the view's shape
-    :param dict data: Any initial data for the view's fields
+
+class CompactView(View):
+    """A View that keeps each field in a slot instead of a dict, to use less
+    memory when many views are held at once. Data for names that aren't
+    fields of the record is dropped.
+
+    `_data` still reads as a dict, built from the slots, so every method of
+    `View` works the same way.
     """
-    if not data:
+    __slots__ = ()
+
+    # Pairs of field names and the descriptors of their slots, set on each
+    # generated class. Using the descriptors directly skips `__getattr__`.
+    _field_slots = ()
+
+    @property
+    def _data(self):
         data = {}
+        for field_name, slot in self._field_slots:
+            try:
+                data[field_name] = slot.__get__(self)
+            except AttributeError:
+                pass
+        return data
+
+    @_data.setter
+    def _data(self, data):
+        for field_name, slot in self._field_slots:
+            if field_name in data:
+                slot.__set__(self, data[field_name])
+
+
+# Field types that convert values of their native type to the same value,
+# both to their native and to their primitive form
+PASSTHROUGH_TYPES = frozenset([
+    types.BooleanType, types.IntegerType, types.FloatType, types.StringType,
+])
+
+
+class LazyData(dict):
+    """The data of a `LazyView`. Fields are converted from the raw data the
+    first time they're read and kept from then on. Fields that haven't been
+    read yet are pending.
+    """
+    def __init__(self, record, raw, convert):
+        super().__init__()
+        self.raw = raw
+        self.convert = convert
+        self.pending = {
+            fn: ft for fn, ft in record
+            if fn in raw or (ft.default and ft.default is not types.Unset)
+        }
+
+    def __contains__(self, key):
+        return dict.__contains__(self, key) or key in self.pending
+
+    def __missing__(self, key):
+        field_type = self.pending.pop(key)
+        if key in self.raw:
+            value = self.convert(field_type, self.raw[key])
+        else:
+            value = field_type.default
+        dict.__setitem__(self, key, value)
+        return value
+
+    def __setitem__(self, key, value):
+        self.pending.pop(key, None)
+        dict.__setitem__(self, key, value)
+
+    def __delitem__(self, key):
+        if self.pending.pop(key, None) is None:
+            dict.__delitem__(self, key)
+
+    def untouched(self):
+        """Returns a dict of the raw values of the fields still pending that
+        are already in their primitive form, converting the other pending
+        fields.
+        """
+        untouched = {}
+        for field_name, field_type in list(self.pending.items()):
+            value = self.raw.get(field_name, types.Unset)
+            if type(field_type) in PASSTHROUGH_TYPES and (
+                type(value) is field_type.NATIVE
+            ):
+                untouched[field_name] = value
+            else:
+                self[field_name]
+        return untouched
+
+    def load(self):
+        """Converts every pending field.
+        """
+        for field_name in list(self.pending):
+            self[field_name]
+        return self
+
+
+def _field_to_native(field_type, value):
+    return field_type.to_native(value)
+
+
+def _field_to_primitive(field_type, value):
+    return field_type.to_primitive(value)
+
+
+class LazyView(View):
+    """A View that converts each field the first time it's read, so reading a
+    few fields of a wide record only pays for converting those fields.
+
+    Fields that were never read or changed are written back by `to_primitive`
+    exactly as they were given when they're already in their primitive form,
+    like an `int` for an `IntegerType`. Everything else that needs the whole
+    record converts the remaining fields first.
+    """
+    __slots__ = ()
+
+    def __init__(self, record, data=None, native=True, primitive=False):
+        if not (native or primitive):
+            super().__init__(record, data, native, primitive)
+            return
+
+        self._record = record
+        self._config = {'lazy': True}
+        self._reset_changes()
+
+        if primitive:
+            self._config['primitive'] = True
+            convert = _field_to_primitive
+        else:
+            self._config['native'] = True
+            convert = _field_to_native
+
+        self._data = LazyData(record, data or {}, convert)
+
+    def _load(self):
+        if isinstance(self._data, LazyData):
+            self._data.load()
+
+    def to_primitive(self, changed_only=False, **convert_args):
+        """
+        Uses the record's ``to_primitive`` to convert the fields that were
+        read or changed, and copies the rest from the raw data when they're
+        already primitive.
+        """
+        data = self._data
+        converted = convert_args or self._config.get('primitive')
+        if converted or not isinstance(data, LazyData):
+            self._load()
+            return super().to_primitive(changed_only, **convert_args)
+
+        if changed_only:
+            changed = self._changed or ()
+            primitive = self._record.to_primitive(
+                {k: data[k] for k in changed if k in data}
+            )
+            return {k: v for k, v in primitive.items() if k in changed}
+
+        untouched = data.untouched()
+        primitive = self._record.to_primitive(dict(data))
+        primitive.update(untouched)
+        return primitive
+
+    def to_native(self, **convert_args):
+        self._load()
+        return super().to_native(**convert_args)
+
+    def validate(self):
+        self._load()
+        return super().validate()
+
+    def __iter__(self):
+        self._load()
+        return super().__iter__()
+
+
+# View classes, by record class and then by the record's fields
+_view_classes = weakref.WeakKeyDictionary()
+
+
+def _build_view_class(record, compact=False, lazy=False):
+    field_cls, record_field_cls = Field, RecordField
+    if compact:
+        field_cls, record_field_cls = SlotField, SlotRecordField
 
     # Wrap each field of the record in a `Field` instance
     attrs = {}
     for field_name, field_type in record:
-        # All fields in the record are at least a View instance
-        field = Field(field_name)
-
-        # Records recurse to create RecordView instances instead
+        # Records get views of their own when they're read
         if isinstance(field_type, types.Record):
-            field = to_view(field_type, data[field_name])
+            field = record_field_cls(field_name)
+        else:
+            field = field_cls(field_name)
 
         # Pair field with a name
         attrs[field_name] = field
@@ -95,10 +407,67 @@ def to_view(record, data=None, **view_config):
             attr = getattr(record.__class__, name)
             attrs[name] = attr
 
+    attrs['_mutable_fields'] = frozenset(
+        fn for fn, ft in record
+        if ft.NATIVE not in types.composites.IMMUTABLE_TYPES
+    )
+
     # Normalize class name
     view_cls_name = '%sView' % (record.__class__.__name__)
 
-    # Instantiate a View definition with the new fields
-    RecordView = type(view_cls_name, (View,), attrs)
+    if lazy:
+        return type(view_cls_name, (LazyView,), attrs)
+    if not compact:
+        return type(view_cls_name, (View,), attrs)
+
+    attrs['__slots__'] = tuple(slot_name(fn) for fn, _ in record)
+    RecordView = type(view_cls_name, (CompactView,), attrs)
+    RecordView._field_slots = tuple(
+        (fn, RecordView.__dict__[slot_name(fn)]) for fn, _ in record
+    )
+    return RecordView
+
+
+def view_class(record, compact=False, lazy=False):
+    """Returns the `View` class for a record, building it the first time it's
+    needed. Classes are cached for each record class and set of fields, and
+    are dropped along with the record class.
+
+    :param Type record: The type that defines the view's shape
+    :param bool compact: Returns a `CompactView` class when True
+    :param bool lazy: Returns a `LazyView` class when True
+    """
+    if compact and lazy:
+        raise ValueError("Views cannot be both compact and lazy")
+
+    record_cls = record.__class__
+    fields = record._fields
+
+    by_fields = _view_classes.get(record_cls)
+    if by_fields is None:
+        by_fields = _view_classes[record_cls] = {}
+
+    key = (id(fields), compact, lazy)
+    cached = by_fields.get(key)
+    if cached is not None and cached[0] is fields:
+        return cached[1]
+
+    RecordView = _build_view_class(record, compact=compact, lazy=lazy)
+    by_fields[key] = (fields, RecordView)
+    return RecordView
+
+
+def to_view(record, data=None, compact=False, lazy=False, **view_config):
+    """Takes both a record and some data and produces View instance.
+
+    :param Type record: The type that defines the view's shape
+    :param dict data: Any initial data for the view's fields
+    :param bool compact: Produces a `CompactView`, which uses less memory
+    :param bool lazy: Produces a `LazyView`, which converts fields as they're
+        read
+    """
+    if not data:
+        data = {}
 
+    RecordView = view_class(record, compact=compact, lazy=lazy)
     return RecordView(record, data=data, **view_config)